@@ -1,294 +1,214 @@
-json
+# json
 
 import json
-import sqlite3
 import datetime
 import random
-from pathlib import Path
+from table_writer import open_writer
+from dataset_scale import JSON_LOADER, DatasetSlice, device_id
+from vectorized import loader_columns
 
-def populate_from_json(db_path):
+# Source JSON Lines file for each table, in the order the tables are loaded
+JSON_FILES = {
+    "Customer": "customers.jsonl",
+    "Devices": "devices.jsonl",
+    "WatchHistory": "watch_history.jsonl",
+    "Favorites": "favorites.jsonl",
+    "Payment": "payments.jsonl",
+    "Profile": "profiles.jsonl",
+    "Reviews": "reviews.jsonl",
+    "MarksAsFavorite": "marks_as_favorite.jsonl",
+}
+
+# Text of the generated names, pictures and comments, filled in with each row's number
+JSON_NAMES = {
+    "firstName": "FirstName{}",
+    "lastName": "LastName{}",
+    "profileName": "Profile{}",
+    "profilePicture": "avatar_{}.png",
+    "comment": "This is review comment {}",
+}
+
+
+def read_json_lines(path):
+    """
+    Yields the records of a JSON Lines file (one JSON object per line)
+    without loading the whole file.
+    
+    Args:
+        path (Path): File to read
+    """
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_json_line(f, record):
+    """
+    Appends one record to an open JSON Lines file.
+    
+    Args:
+        f (file): File opened for writing
+        record (dict): Record to write
+    """
+    f.write(json.dumps(record))
+    f.write("\n")
+
+
+def populate_from_json(db_path, bulk=False, scale_factor=1, shard=0, shards=1, vectorized=False,
+                       checkpoint=False, skew=None):
     """
-    Populates approximately 1/3 of the database with data from JSON files.
-    Each table will get around 133-134 entries from this function.
+    Populates approximately 1/3 of the database with data from JSON Lines files.
+    Each table will get around 133-134 entries per unit of scale factor.
     
     Args:
         db_path (str): Path to the SQLite database file
+        bulk (bool): Insert in batches with one transaction per table
+        scale_factor (float): Dataset size, 1 gives ~400 rows per table
+        shard (int): Part of this loader's rows to generate, from 0 to shards - 1
+        shards (int): Number of parts the build is split into
+        vectorized (bool): Generate whole columns at once with NumPy
+        checkpoint (bool): Commit in chunks with a checkpoint each, skipping
+            the rows an earlier run of this loader already committed
+        skew (Skewed): Draw movies, event dates and foreign keys from these
+            skewed distributions instead of uniformly; implies vectorized
     """
     # Connect to database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    writer = open_writer(db_path, bulk=bulk, stage="json" if checkpoint else None)
     
     # Load JSON data
-    data_path = Path("data_files")
+    data_path = DatasetSlice(JSON_LOADER, scale_factor, shard, shards).work_dir("data_files")
     
     # Create data directory if it doesn't exist
-    data_path.mkdir(exist_ok=True)
-    
-    # Generate JSON data files if they don't exist
-    generate_json_files(data_path)
-    
-    # Load data from JSON files
-    with open(data_path / "customers.json", "r") as f:
-        customers = json.load(f)
-    
-    with open(data_path / "devices.json", "r") as f:
-        devices = json.load(f)
-    
-    with open(data_path / "watch_history.json", "r") as f:
-        watch_history = json.load(f)
-    
-    with open(data_path / "favorites.json", "r") as f:
-        favorites = json.load(f)
-    
-    with open(data_path / "payments.json", "r") as f:
-        payments = json.load(f)
-    
-    with open(data_path / "profiles.json", "r") as f:
-        profiles = json.load(f)
+    data_path.mkdir(parents=True, exist_ok=True)
     
-    with open(data_path / "reviews.json", "r") as f:
-        reviews = json.load(f)
+    # Generate JSON Lines data files
+    generate_json_files(data_path, scale_factor, shard, shards, vectorized, skew)
     
-    with open(data_path / "marks_as_favorite.json", "r") as f:
-        marks_as_favorite = json.load(f)
-    
-    # Insert data into tables
-    # Customer table
-    for customer in customers:
-        cursor.execute("""
-            INSERT INTO Customer (firstName, lastName, customerID, dateOfBirth, customerSince)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            customer["firstName"],
-            customer["lastName"],
-            customer["customerID"],
-            customer["dateOfBirth"],
-            customer["customerSince"]
-        ))
-    
-    # Devices table
-    for device in devices:
-        cursor.execute("""
-            INSERT INTO Devices (deviceName, deviceID, lastSeen, deviceType, customerID)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            device["deviceName"],
-            device["deviceID"],
-            device["lastSeen"],
-            device["deviceType"],
-            device["customerID"]
-        ))
-    
-    # WatchHistory table
-    for history in watch_history:
-        cursor.execute("""
-            INSERT INTO WatchHistory (movieID, watchDate, durationWatched, WatchHistoryID)
-            VALUES (?, ?, ?, ?)
-        """, (
-            history["movieID"],
-            history["watchDate"],
-            history["durationWatched"],
-            history["WatchHistoryID"]
-        ))
-    
-    # Favorites table
-    for favorite in favorites:
-        cursor.execute("""
-            INSERT INTO Favorites (movieID, lastSeen, totalTimeWatched)
-            VALUES (?, ?, ?)
-        """, (
-            favorite["movieID"],
-            favorite["lastSeen"],
-            favorite["totalTimeWatched"]
-        ))
-    
-    # Payment table
-    for payment in payments:
-        cursor.execute("""
-            INSERT INTO Payment (paymentID, paymentDate, amount, currency, paymentMethod, status, customerID)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            payment["paymentID"],
-            payment["paymentDate"],
-            payment["amount"],
-            payment["currency"],
-            payment["paymentMethod"],
-            payment["status"],
-            payment["customerID"]
-        ))
-    
-    # Profile table
-    for profile in profiles:
-        cursor.execute("""
-            INSERT INTO Profile (profileName, profilePicture, isOnline, profileID, WatchHistoryID, customerID)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            profile["profileName"],
-            profile["profilePicture"],
-            profile["isOnline"],
-            profile["profileID"],
-            profile["WatchHistoryID"],
-            profile["customerID"]
-        ))
-    
-    # Reviews table
-    for review in reviews:
-        cursor.execute("""
-            INSERT INTO Reviews (rating, movieID, comment, reviewDate, profileID)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            review["rating"],
-            review["movieID"],
-            review["comment"],
-            review["reviewDate"],
-            review["profileID"]
-        ))
-    
-    # MarksAsFavorite table
-    for mark in marks_as_favorite:
-        cursor.execute("""
-            INSERT INTO MarksAsFavorite (profileID, movieID)
-            VALUES (?, ?)
-        """, (
-            mark["profileID"],
-            mark["movieID"]
-        ))
+    # Stream each JSON Lines file into its table, in dependency order.
+    # Records are read one line at a time and inserted in batches, so memory
+    # use stays flat however large the files are.
+    for table, file_name in JSON_FILES.items():
+        writer.insert_records(table, read_json_lines(data_path / file_name))
     
     # Commit and close connection
-    conn.commit()
-    conn.close()
+    writer.close()
     
     print(f"Successfully populated 1/3 of the database from JSON files")
 
 
-def generate_json_files(data_path):
+def generate_json_files(data_path, scale_factor=1, shard=0, shards=1, vectorized=False, skew=None):
     """
-    Generates JSON files with mock data for each table.
+    Generates JSON Lines files with mock data for each table.
     This is a helper function to create the source JSON files.
     
     Args:
-        data_path (Path): Directory path to save JSON files
+        data_path (Path): Directory path to save JSON Lines files
+        scale_factor (float): Dataset size, 1 gives ~400 rows per table
+        shard (int): Part of this loader's rows to generate
+        shards (int): Number of parts the build is split into
+        vectorized (bool): Generate whole columns at once with NumPy
+        skew (Skewed): Skewed distributions to draw from, generated with NumPy
     """
+    # IDs owned by this loader - the first block of every table
+    ids = DatasetSlice(JSON_LOADER, scale_factor, shard, shards)
+    
+    if vectorized or skew is not None:
+        for table, columns in loader_columns(ids, JSON_NAMES, skew).items():
+            with open(data_path / JSON_FILES[table], "w") as f:
+                for values in zip(*columns.values()):
+                    write_json_line(f, dict(zip(columns, values)))
+        return
+    
+    # Each table is written record by record as it is generated
     # Generate customer data
-    customers = []
-    for i in range(134):
-        customer_id = i + 1
-        customer = {
-            "firstName": f"FirstName{i}",
-            "lastName": f"LastName{i}",
-            "customerID": customer_id,
-            "dateOfBirth": (datetime.date(1970, 1, 1) + datetime.timedelta(days=random.randint(0, 18250))).isoformat(),
-            "customerSince": (datetime.date(2015, 1, 1) + datetime.timedelta(days=random.randint(0, 3000))).isoformat(),
-        }
-        customers.append(customer)
+    with open(data_path / JSON_FILES["Customer"], "w") as f:
+        for i, customer_id in enumerate(ids.ids):
+            write_json_line(f, {
+                "firstName": f"FirstName{i}",
+                "lastName": f"LastName{i}",
+                "customerID": customer_id,
+                "dateOfBirth": (datetime.date(1970, 1, 1) + datetime.timedelta(days=random.randint(0, 18250))).isoformat(),
+                "customerSince": (datetime.date(2015, 1, 1) + datetime.timedelta(days=random.randint(0, 3000))).isoformat(),
+            })
     
     # Generate devices data (multiple devices per customer)
-    devices = []
-    device_id = 1
-    for customer in customers:
-        num_devices = random.randint(1, 3)
-        for j in range(num_devices):
-            device = {
-                "deviceName": random.choice(["Mobile", "Laptop", "TV", "Tablet", "Game Console"]) + f"_{j}",
-                "deviceID": device_id,
-                "lastSeen": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
-                "deviceType": random.choice(["iOS", "Android", "Windows", "macOS", "SmartTV"]),
-                "customerID": customer["customerID"]
-            }
-            devices.append(device)
-            device_id += 1
+    with open(data_path / JSON_FILES["Devices"], "w") as f:
+        for customer_id in ids.ids:
+            num_devices = random.randint(1, 3)
+            for j in range(num_devices):
+                write_json_line(f, {
+                    "deviceName": random.choice(["Mobile", "Laptop", "TV", "Tablet", "Game Console"]) + f"_{j}",
+                    "deviceID": device_id(customer_id, j),
+                    "lastSeen": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
+                    "deviceType": random.choice(["iOS", "Android", "Windows", "macOS", "SmartTV"]),
+                    "customerID": customer_id
+                })
     
     # Generate watch history data
-    watch_history = []
-    for i in range(134):
-        watch_history.append({
-            "movieID": random.randint(1, 1000),
-            "watchDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
-            "durationWatched": round(random.uniform(10, 180), 2),
-            "WatchHistoryID": i + 1
-        })
+    with open(data_path / JSON_FILES["WatchHistory"], "w") as f:
+        for watch_history_id in ids.ids:
+            write_json_line(f, {
+                "movieID": ids.random_movie(),
+                "watchDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
+                "durationWatched": round(random.uniform(10, 180), 2),
+                "WatchHistoryID": watch_history_id
+            })
     
     # Generate favorites data
-    favorites = []
-    for i in range(134):
-        favorites.append({
-            "movieID": i + 1,
-            "lastSeen": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
-            "totalTimeWatched": round(random.uniform(60, 600), 2)
-        })
+    with open(data_path / JSON_FILES["Favorites"], "w") as f:
+        for movie_id in ids.ids:
+            write_json_line(f, {
+                "movieID": movie_id,
+                "lastSeen": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
+                "totalTimeWatched": round(random.uniform(60, 600), 2)
+            })
     
     # Generate payment data
-    payments = []
-    for i in range(134):
-        customer_id = random.randint(1, len(customers))
-        payments.append({
-            "paymentID": i + 1,
-            "paymentDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
-            "amount": round(random.uniform(5, 50), 2),
-            "currency": random.choice(["USD", "EUR", "GBP", "CAD"]),
-            "paymentMethod": random.choice(["Credit Card", "PayPal", "Bank Transfer", "Apple Pay", "Google Pay"]),
-            "status": random.choice(["Completed", "Pending", "Failed"]),
-            "customerID": customer_id
-        })
+    with open(data_path / JSON_FILES["Payment"], "w") as f:
+        for payment_id in ids.ids:
+            write_json_line(f, {
+                "paymentID": payment_id,
+                "paymentDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
+                "amount": round(random.uniform(5, 50), 2),
+                "currency": random.choice(["USD", "EUR", "GBP", "CAD"]),
+                "paymentMethod": random.choice(["Credit Card", "PayPal", "Bank Transfer", "Apple Pay", "Google Pay"]),
+                "status": random.choice(["Completed", "Pending", "Failed"]),
+                "customerID": ids.random_id()
+            })
     
     # Generate profile data
-    profiles = []
-    for i in range(134):
-        customer_id = random.randint(1, len(customers))
-        profiles.append({
-            "profileName": f"Profile{i}",
-            "profilePicture": f"avatar_{i}.png",
-            "isOnline": random.choice([True, False]),
-            "profileID": i + 1,
-            "WatchHistoryID": i + 1,  # Assuming 1:1 relationship with watch history
-            "customerID": customer_id
-        })
+    with open(data_path / JSON_FILES["Profile"], "w") as f:
+        for i, profile_id in enumerate(ids.ids):
+            write_json_line(f, {
+                "profileName": f"Profile{i}",
+                "profilePicture": f"avatar_{i}.png",
+                "isOnline": random.choice([True, False]),
+                "profileID": profile_id,
+                "WatchHistoryID": profile_id,  # Assuming 1:1 relationship with watch history
+                "customerID": ids.random_id()
+            })
     
     # Generate reviews data
-    reviews = []
-    for i in range(134):
-        reviews.append({
-            "rating": random.randint(1, 5),
-            "movieID": i + 1,
-            "comment": f"This is review comment {i}",
-            "reviewDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
-            "profileID": random.randint(1, len(profiles))
-        })
-    
-    # Generate marks as favorite data
-    marks_as_favorite = []
-    for i in range(134):
-        marks_as_favorite.append({
-            "profileID": random.randint(1, len(profiles)),
-            "movieID": random.randint(1, len(favorites))
-        })
-    
-    # Save data to JSON files
-    with open(data_path / "customers.json", "w") as f:
-        json.dump(customers, f, indent=2)
-    
-    with open(data_path / "devices.json", "w") as f:
-        json.dump(devices, f, indent=2)
-    
-    with open(data_path / "watch_history.json", "w") as f:
-        json.dump(watch_history, f, indent=2)
-    
-    with open(data_path / "favorites.json", "w") as f:
-        json.dump(favorites, f, indent=2)
-    
-    with open(data_path / "payments.json", "w") as f:
-        json.dump(payments, f, indent=2)
-    
-    with open(data_path / "profiles.json", "w") as f:
-        json.dump(profiles, f, indent=2)
-    
-    with open(data_path / "reviews.json", "w") as f:
-        json.dump(reviews, f, indent=2)
-    
-    with open(data_path / "marks_as_favorite.json", "w") as f:
-        json.dump(marks_as_favorite, f, indent=2)
+    with open(data_path / JSON_FILES["Reviews"], "w") as f:
+        for i, movie_id in enumerate(ids.ids):
+            write_json_line(f, {
+                "rating": random.randint(1, 5),
+                "movieID": movie_id,
+                "comment": f"This is review comment {i}",
+                "reviewDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).isoformat(),
+                "profileID": ids.random_id()
+            })
+    
+    # Generate marks as favorite data (unique pairs, the table's primary key)
+    with open(data_path / JSON_FILES["MarksAsFavorite"], "w") as f:
+        for profile_id, movie_id in ids.random_pairs(ids.count):
+            write_json_line(f, {
+                "profileID": profile_id,
+                "movieID": movie_id
+            })
 
 
-if _name_ == "_main_":
+if __name__ == "__main__":
     # Example usage
     populate_from_json("streaming_service.db")
@@ -1,162 +1,229 @@
-excel
+# excel
 
-import sqlite3
 import pandas as pd
 import random
 import datetime
+import hashlib
+import json
 import os
+import time
 from pathlib import Path
+from table_writer import TABLE_COLUMNS, open_writer, record_timing
+from dataset_scale import EXCEL_LOADER, DatasetSlice, device_id
+from vectorized import loader_columns
 
-def populate_from_excel(db_path):
+# Source workbook for each table, in the order the tables are loaded
+EXCEL_FILES = {
+    "Customer": "customers.xlsx",
+    "Devices": "devices.xlsx",
+    "WatchHistory": "watch_history.xlsx",
+    "Favorites": "favorites.xlsx",
+    "Payment": "payments.xlsx",
+    "Profile": "profiles.xlsx",
+    "Reviews": "reviews.xlsx",
+    "MarksAsFavorite": "marks_as_favorite.xlsx",
+}
+
+# Text of the generated names, pictures and comments, filled in with each row's number
+EXCEL_NAMES = {
+    "firstName": "ExcelFirstName{}",
+    "lastName": "ExcelLastName{}",
+    "profileName": "ExcelProfile{}",
+    "profilePicture": "excel_avatar_{}.png",
+    "comment": "This is an Excel review comment {}",
+}
+
+# Directory the generated workbooks are kept in, with one subdirectory per shard
+EXCEL_DIR = "excel_data"
+
+# Parameters the workbooks in a directory were generated with, kept next to them
+GENERATION_FILE = "generation.json"
+
+# Parquet copies of parsed sheets, named by a hash of the workbook's contents
+EXCEL_CACHE_DIR = Path("excel_cache")
+
+
+def file_digest(path):
     """
-    Populates approximately 1/3 of the database with data from Excel files.
-    Each table will get around 133-134 entries from this function.
+    Returns the SHA-256 hex digest of a file's contents.
     
     Args:
-        db_path (str): Path to the SQLite database file
+        path (Path): File to hash
     """
-    # Connect to database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Setup Excel files directory
-    excel_dir = Path("excel_data")
-    excel_dir.mkdir(exist_ok=True)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_sheet(path, cache_dir=EXCEL_CACHE_DIR, digest=None):
+    """
+    Reads an Excel sheet, parsing each distinct workbook only once. The parsed
+    sheet is stored as Parquet, keyed by the workbook's content hash, and later
+    reads of the same contents load the Parquet file instead.
     
-    # Generate Excel files if they don't exist
-    generate_excel_files(excel_dir)
+    Args:
+        path (Path): Excel file to read
+        cache_dir (Path): Directory holding the Parquet copies
+        digest (str): The workbook's file_digest, if already computed
+    """
+    cache_path = cache_dir / f"{digest or file_digest(path)}.parquet"
+    try:
+        if cache_path.exists():
+            return pd.read_parquet(cache_path)
+        
+        df = pd.read_excel(path)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, index=False)
+        return df
+    except ImportError:
+        # No Parquet engine (pyarrow) installed - fall back to parsing every time
+        return pd.read_excel(path)
+
+
+def evict_sheets(excel_root=EXCEL_DIR, cache_dir=EXCEL_CACHE_DIR, digests=None):
+    """
+    Deletes the Parquet copies whose content hash no longer matches any
+    workbook on disk, so regenerating the workbooks doesn't grow the cache.
     
-    # Read data from Excel files and insert into database
-    # Customer table
-    df_customers = pd.read_excel(excel_dir / "customers.xlsx")
-    for _, row in df_customers.iterrows():
-        cursor.execute("""
-            INSERT INTO Customer (firstName, lastName, customerID, dateOfBirth, customerSince)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            row["firstName"],
-            row["lastName"],
-            row["customerID"],
-            row["dateOfBirth"],
-            row["customerSince"]
-        ))
+    Args:
+        excel_root (str): Directory holding the workbooks of every shard
+        cache_dir (Path): Directory holding the Parquet copies
+        digests (dict): file_digest of workbooks already hashed, by path, so
+            they aren't read again
+    """
+    digests = digests or {}
+    if not cache_dir.exists():
+        return
     
-    # Devices table
-    df_devices = pd.read_excel(excel_dir / "devices.xlsx")
-    for _, row in df_devices.iterrows():
-        cursor.execute("""
-            INSERT INTO Devices (deviceName, deviceID, lastSeen, deviceType, customerID)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            row["deviceName"],
-            row["deviceID"],
-            row["lastSeen"],
-            row["deviceType"],
-            row["customerID"]
-        ))
+    # Listed before hashing, so copies a parallel shard adds meanwhile are kept
+    cached = list(cache_dir.glob("*.parquet"))
+    current = {digests.get(path) or file_digest(path) for path in Path(excel_root).rglob("*.xlsx")}
+    for path in cached:
+        if path.stem not in current:
+            path.unlink(missing_ok=True)
+
+
+def generation_settings(scale_factor, shard, shards, vectorized, skew):
+    """
+    Returns the parameters that decide which rows the workbooks hold, as
+    stored in GENERATION_FILE.
     
-    # WatchHistory table
-    df_watch_history = pd.read_excel(excel_dir / "watch_history.xlsx")
-    for _, row in df_watch_history.iterrows():
-        cursor.execute("""
-            INSERT INTO WatchHistory (movieID, watchDate, durationWatched, WatchHistoryID)
-            VALUES (?, ?, ?, ?)
-        """, (
-            row["movieID"],
-            row["watchDate"],
-            row["durationWatched"],
-            row["WatchHistoryID"]
-        ))
+    Args:
+        scale_factor (float): Dataset size
+        shard (int): Part of this loader's rows
+        shards (int): Number of parts the build is split into
+        vectorized (bool): Whether columns are generated with NumPy
+        skew (Skewed): Skewed distributions, or None for uniform ones
+    """
+    return {
+        "scale_factor": scale_factor,
+        "shard": shard,
+        "shards": shards,
+        "vectorized": vectorized or skew is not None,
+        "skew": skew.settings() if skew is not None else None,
+    }
+
+
+def dataframe_rows(df, columns):
+    """
+    Returns the rows of a DataFrame as tuples of plain Python values.
     
-    # Favorites table
-    df_favorites = pd.read_excel(excel_dir / "favorites.xlsx")
-    for _, row in df_favorites.iterrows():
-        cursor.execute("""
-            INSERT INTO Favorites (movieID, lastSeen, totalTimeWatched)
-            VALUES (?, ?, ?)
-        """, (
-            row["movieID"],
-            row["lastSeen"],
-            row["totalTimeWatched"]
-        ))
+    Args:
+        df (DataFrame): Sheet read from an Excel file
+        columns (tuple): Column names in insert order
+    """
+    # A sheet written from no rows has no columns either
+    if df.empty:
+        return iter(())
+    # tolist() converts numpy scalars to Python types sqlite3 can bind
+    return zip(*(df[column].tolist() for column in columns))
+
+
+def populate_from_excel(db_path, bulk=False, scale_factor=1, shard=0, shards=1, regenerate=True,
+                        vectorized=False, checkpoint=False, skew=None):
+    """
+    Populates approximately 1/3 of the database with data from Excel files.
+    Each table will get around 133-134 entries per unit of scale factor.
     
-    # Payment table
-    df_payments = pd.read_excel(excel_dir / "payments.xlsx")
-    for _, row in df_payments.iterrows():
-        cursor.execute("""
-            INSERT INTO Payment (paymentID, paymentDate, amount, currency, paymentMethod, status, customerID)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            row["paymentID"],
-            row["paymentDate"],
-            row["amount"],
-            row["currency"],
-            row["paymentMethod"],
-            row["status"],
-            row["customerID"]
-        ))
+    Args:
+        db_path (str): Path to the SQLite database file
+        bulk (bool): Insert in batches with one transaction per table
+        scale_factor (float): Dataset size, 1 gives ~400 rows per table
+        shard (int): Part of this loader's rows to generate, from 0 to shards - 1
+        shards (int): Number of parts the build is split into
+        regenerate (bool): Write new Excel files; False loads the files already
+            in the directory, which lets the sheet cache skip parsing them,
+            unless they were generated with other parameters
+        vectorized (bool): Generate whole columns at once with NumPy
+        checkpoint (bool): Commit in chunks with a checkpoint each, skipping
+            the rows an earlier run of this loader already committed
+        skew (Skewed): Draw movies, event dates and foreign keys from these
+            skewed distributions instead of uniformly; implies vectorized
+    """
+    # Connect to database
+    writer = open_writer(db_path, bulk=bulk, stage="excel" if checkpoint else None)
     
-    # Profile table
-    df_profiles = pd.read_excel(excel_dir / "profiles.xlsx")
-    for _, row in df_profiles.iterrows():
-        cursor.execute("""
-            INSERT INTO Profile (profileName, profilePicture, isOnline, profileID, WatchHistoryID, customerID)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            row["profileName"],
-            row["profilePicture"],
-            row["isOnline"],
-            row["profileID"],
-            row["WatchHistoryID"],
-            row["customerID"]
-        ))
+    # Setup Excel files directory
+    excel_dir = DatasetSlice(EXCEL_LOADER, scale_factor, shard, shards).work_dir(EXCEL_DIR)
+    excel_dir.mkdir(parents=True, exist_ok=True)
     
-    # Reviews table
-    df_reviews = pd.read_excel(excel_dir / "reviews.xlsx")
-    for _, row in df_reviews.iterrows():
-        cursor.execute("""
-            INSERT INTO Reviews (rating, movieID, comment, reviewDate, profileID)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            row["rating"],
-            row["movieID"],
-            row["comment"],
-            row["reviewDate"],
-            row["profileID"]
-        ))
+    # Generate Excel files if asked to, if they don't exist or if they were
+    # generated with other parameters
+    settings = generation_settings(scale_factor, shard, shards, vectorized, skew)
+    settings_path = excel_dir / GENERATION_FILE
+    missing = any(not (excel_dir / file_name).exists() for file_name in EXCEL_FILES.values())
+    stale = not settings_path.exists() or json.loads(settings_path.read_text()) != settings
+    if regenerate or missing or stale:
+        # Removed first, so files left half-written by a failed run are never reused
+        settings_path.unlink(missing_ok=True)
+        generate_excel_files(excel_dir, scale_factor, shard, shards, vectorized, skew)
+        settings_path.write_text(json.dumps(settings, sort_keys=True))
     
-    # MarksAsFavorite table
-    df_marks = pd.read_excel(excel_dir / "marks_as_favorite.xlsx")
-    for _, row in df_marks.iterrows():
-        cursor.execute("""
-            INSERT INTO MarksAsFavorite (profileID, movieID)
-            VALUES (?, ?)
-        """, (
-            row["profileID"],
-            row["movieID"]
-        ))
+    # Read data from Excel files and insert into database, in dependency order.
+    # Insert batches are built from whole columns rather than row by row.
+    # Each workbook is hashed once, for both the sheet cache and the eviction.
+    digests = {}
+    for table, file_name in EXCEL_FILES.items():
+        path = excel_dir / file_name
+        # Timed as part of loading the table, as reading the JSON Lines files is
+        start = time.perf_counter()
+        digests[path] = file_digest(path)
+        df = read_sheet(path, digest=digests[path])
+        record_timing(table, 0, time.perf_counter() - start)
+        writer.insert(table, dataframe_rows(df, TABLE_COLUMNS[table]))
+    evict_sheets(digests=digests)
     
     # Commit and close connection
-    conn.commit()
-    conn.close()
+    writer.close()
     
     print(f"Successfully populated 1/3 of the database from Excel files")
 
 
-def generate_excel_files(excel_dir):
+def generate_excel_files(excel_dir, scale_factor=1, shard=0, shards=1, vectorized=False, skew=None):
     """
     Generates Excel files with mock data for each table.
     
     Args:
         excel_dir (Path): Directory path to save Excel files
+        scale_factor (float): Dataset size, 1 gives ~400 rows per table
+        shard (int): Part of this loader's rows to generate
+        shards (int): Number of parts the build is split into
+        vectorized (bool): Generate whole columns at once with NumPy
+        skew (Skewed): Skewed distributions to draw from, generated with NumPy
     """
-    # Base IDs for this function - starting from where the first function left off
-    base_id = 135
+    # IDs for this function - starting from where the first function left off
+    ids = DatasetSlice(EXCEL_LOADER, scale_factor, shard, shards)
+    
+    if vectorized or skew is not None:
+        for table, columns in loader_columns(ids, EXCEL_NAMES, skew).items():
+            pd.DataFrame(columns).to_excel(excel_dir / EXCEL_FILES[table], index=False)
+        return
     
     # Generate customer data
     customers = []
-    for i in range(133):
-        customer_id = base_id + i
+    for i, customer_id in enumerate(ids.ids):
         customers.append({
             "firstName": f"ExcelFirstName{i}",
             "lastName": f"ExcelLastName{i}",
@@ -167,25 +234,22 @@ def generate_excel_files(excel_dir):
     
     # Generate devices data (multiple devices per customer)
     devices = []
-    device_id = base_id
     for customer in customers:
         num_devices = random.randint(1, 3)
         for j in range(num_devices):
             devices.append({
                 "deviceName": random.choice(["Mobile", "Laptop", "TV", "Tablet", "Game Console"]) + f"_{j}",
-                "deviceID": device_id,
+                "deviceID": device_id(customer["customerID"], j),
                 "lastSeen": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d'),
                 "deviceType": random.choice(["iOS", "Android", "Windows", "macOS", "SmartTV"]),
                 "customerID": customer["customerID"]
             })
-            device_id += 1
     
     # Generate watch history data
     watch_history = []
-    for i in range(133):
-        watch_history_id = base_id + i
+    for watch_history_id in ids.ids:
         watch_history.append({
-            "movieID": random.randint(1001, 2000),
+            "movieID": ids.random_movie(),
             "watchDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d'),
             "durationWatched": round(random.uniform(10, 180), 2),
             "WatchHistoryID": watch_history_id
@@ -193,8 +257,7 @@ def generate_excel_files(excel_dir):
     
     # Generate favorites data
     favorites = []
-    for i in range(133):
-        movie_id = base_id + i
+    for movie_id in ids.ids:
         favorites.append({
             "movieID": movie_id,
             "lastSeen": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d'),
@@ -203,9 +266,8 @@ def generate_excel_files(excel_dir):
     
     # Generate payment data
     payments = []
-    for i in range(133):
-        payment_id = base_id + i
-        customer_id = random.choice(customers)["customerID"]
+    for payment_id in ids.ids:
+        customer_id = ids.random_id()
         payments.append({
             "paymentID": payment_id,
             "paymentDate": (datetime.date(2023, 1, 1) + datetime.timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d'),
@@ -218,10 +280,9 @@ def generate_excel_files(excel_dir):
     
     # Generate profile data
     profiles = []
-    for i in range(133):
-        profile_id = base_id + i
-        watch_history_id = base_id + i  # Assuming 1:1 relationship with watch history
-        customer_id = random.choice(customers)["customerID"]
+    for i, profile_id in enumerate(ids.ids):
+        watch_history_id = profile_id  # Assuming 1:1 relationship with watch history
+        customer_id = ids.random_id()
         profiles.append({
             "profileName": f"ExcelProfile{i}",
             "profilePicture": f"excel_avatar_{i}.png",
@@ -233,9 +294,8 @@ def generate_excel_files(excel_dir):
     
     # Generate reviews data
     reviews = []
-    for i in range(133):
-        movie_id = base_id + i
-        profile_id = random.choice(profiles)["profileID"]
+    for i, movie_id in enumerate(ids.ids):
+        profile_id = ids.random_id()
         reviews.append({
             "rating": random.randint(1, 5),
             "movieID": movie_id,
@@ -244,11 +304,9 @@ def generate_excel_files(excel_dir):
             "profileID": profile_id
         })
     
-    # Generate marks as favorite data
+    # Generate marks as favorite data (unique pairs, the table's primary key)
     marks_as_favorite = []
-    for i in range(133):
-        profile_id = random.choice(profiles)["profileID"]
-        movie_id = random.choice(favorites)["movieID"]
+    for profile_id, movie_id in ids.random_pairs(ids.count):
         marks_as_favorite.append({
             "profileID": profile_id,
             "movieID": movie_id
@@ -265,6 +323,6 @@ def generate_excel_files(excel_dir):
     pd.DataFrame(marks_as_favorite).to_excel(excel_dir / "marks_as_favorite.xlsx", index=False)
 
 
-if _name_ == "_main_":
+if __name__ == "__main__":
     # Example usage
     populate_from_excel("streaming_service.db")
@@ -1,187 +1,142 @@
-python
+# python
 
-import sqlite3
 import random
 import datetime
-import string
-from faker import Faker
+from table_writer import open_writer
+from dataset_scale import PYTHON_LOADER, REFERENCE_DATE, DatasetSlice
+from distributions import Uniform
+from text_pools import FakerText, PoolText
+from vectorized import (
+    device_columns, random_choices, random_dates, random_floats, random_ints, seeded_generator,
+    unique_pairs
+)
 
-def populate_from_python(db_path):
+def populate_from_python(db_path, bulk=False, scale_factor=1, shard=0, shards=1, use_faker=False,
+                         checkpoint=False, skew=None):
     """
     Populates approximately 1/3 of the database with data generated directly in Python.
-    Each table will get around 133-134 entries from this function.
+    Each table will get around 133-134 entries per unit of scale factor.
     
     Args:
         db_path (str): Path to the SQLite database file
+        bulk (bool): Insert in batches with one transaction per table
+        scale_factor (float): Dataset size, 1 gives ~400 rows per table
+        shard (int): Part of this loader's rows to generate, from 0 to shards - 1
+        shards (int): Number of parts the build is split into
+        use_faker (bool): Fidelity mode - generate names and text with Faker
+            instead of the precomputed pools (much slower)
+        checkpoint (bool): Commit in chunks with a checkpoint each, skipping
+            the rows an earlier run of this loader already committed
+        skew (Skewed): Draw movies, event dates and foreign keys from these
+            skewed distributions instead of uniformly
     """
     # Connect to database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    writer = open_writer(db_path, bulk=bulk, stage="python" if checkpoint else None)
     
-    # Initialize Faker for generating realistic data
-    fake = Faker()
+    # Names and text come from fixed pools sampled in bulk, or from Faker in
+    # fidelity mode; every other column is generated a whole column at a time
+    text = FakerText() if use_faker else PoolText()
+    rng = seeded_generator()
+    dist = skew or Uniform()
     
-    # Base IDs for this function - starting from where the second function left off
-    base_id = 268
+    # IDs for this function - starting from where the second function left off
+    ids = DatasetSlice(PYTHON_LOADER, scale_factor, shard, shards)
+    n = ids.count
+    
+    # Date ranges, as (first day, number of days after it)
+    birth_dates = ((REFERENCE_DATE - datetime.timedelta(days=int(70 * 365.25))).isoformat(), int(52 * 365.25))  # Ages 18-70
+    customer_since = ("2015-01-01", (datetime.date(2023, 12, 31) - datetime.date(2015, 1, 1)).days)
+    year_2023 = ("2023-01-01", 364)
     
     # Generate and insert customer data
-    customers = []
-    for i in range(133):
-        customer_id = base_id + i
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        dob = fake.date_of_birth(minimum_age=18, maximum_age=70).strftime('%Y-%m-%d')
-        customer_since = fake.date_between_dates(
-            date_start=datetime.date(2015, 1, 1),
-            date_end=datetime.date(2023, 12, 31)
-        ).strftime('%Y-%m-%d')
-        
-        cursor.execute("""
-            INSERT INTO Customer (firstName, lastName, customerID, dateOfBirth, customerSince)
-            VALUES (?, ?, ?, ?, ?)
-        """, (first_name, last_name, customer_id, dob, customer_since))
-        
-        customers.append({
-            "id": customer_id,
-            "firstName": first_name,
-            "lastName": last_name
-        })
+    writer.insert("Customer", zip(
+        text.first_names(n),
+        text.last_names(n),
+        ids.ids,
+        random_dates(rng, *birth_dates, n),
+        random_dates(rng, *customer_since, n)
+    ))
     
     # Generate and insert device data
-    device_id = base_id
     device_types = ["Smartphone", "Tablet", "Smart TV", "Laptop", "Desktop", "Game Console"]
     os_types = ["iOS", "Android", "Windows", "macOS", "Roku", "FireTV", "PlayStation", "Xbox"]
     
-    for customer in customers:
-        # Each customer has 1-4 devices
-        num_devices = random.randint(1, 4)
-        for _ in range(num_devices):
-            device_name = f"{random.choice(device_types)} - {fake.word().capitalize()}"
-            last_seen = fake.date_between_dates(
-                date_start=datetime.date(2023, 1, 1),
-                date_end=datetime.date(2023, 12, 31)
-            ).strftime('%Y-%m-%d')
-            device_type = random.choice(os_types)
-            
-            cursor.execute("""
-                INSERT INTO Devices (deviceName, deviceID, lastSeen, deviceType, customerID)
-                VALUES (?, ?, ?, ?, ?)
-            """, (device_name, device_id, last_seen, device_type, customer["id"]))
-            
-            device_id += 1
+    # Each customer has 1-4 devices
+    device_customers, _, device_ids = device_columns(rng, ids, 4)
+    device_count = len(device_ids)
+    device_names = [
+        f"{device_type} - {word.capitalize()}"
+        for device_type, word in zip(random_choices(rng, device_types, device_count), text.words(device_count))
+    ]
+    writer.insert("Devices", zip(
+        device_names,
+        device_ids,
+        dist.dates(rng, *year_2023, device_count),
+        random_choices(rng, os_types, device_count),
+        device_customers
+    ))
     
     # Generate and insert watch history
-    watch_histories = []
-    for i in range(133):
-        watch_history_id = base_id + i
-        movie_id = random.randint(2001, 3000)
-        watch_date = fake.date_between_dates(
-            date_start=datetime.date(2023, 1, 1),
-            date_end=datetime.date(2023, 12, 31)
-        ).strftime('%Y-%m-%d')
-        duration_watched = round(random.uniform(15, 240), 2)  # In minutes
-        
-        cursor.execute("""
-            INSERT INTO WatchHistory (movieID, watchDate, durationWatched, WatchHistoryID)
-            VALUES (?, ?, ?, ?)
-        """, (movie_id, watch_date, duration_watched, watch_history_id))
-        
-        watch_histories.append({
-            "id": watch_history_id,
-            "movieID": movie_id
-        })
+    writer.insert("WatchHistory", zip(
+        dist.movies(rng, ids.movie_low, ids.movie_high, n),
+        dist.dates(rng, *year_2023, n),
+        random_floats(rng, 15, 240, n),  # In minutes
+        ids.ids
+    ))
     
     # Generate and insert favorites
-    for i in range(133):
-        movie_id = base_id + i
-        last_seen = fake.date_between_dates(
-            date_start=datetime.date(2023, 1, 1),
-            date_end=datetime.date(2023, 12, 31)
-        ).strftime('%Y-%m-%d')
-        total_time_watched = round(random.uniform(120, 900), 2)  # In minutes
-        
-        cursor.execute("""
-            INSERT INTO Favorites (movieID, lastSeen, totalTimeWatched)
-            VALUES (?, ?, ?)
-        """, (movie_id, last_seen, total_time_watched))
+    writer.insert("Favorites", zip(
+        ids.ids,
+        dist.dates(rng, *year_2023, n),
+        random_floats(rng, 120, 900, n)  # In minutes
+    ))
     
     # Generate and insert payment data
     payment_methods = ["Credit Card", "PayPal", "Google Pay", "Apple Pay", "Bank Transfer", "Gift Card"]
     currencies = ["USD", "EUR", "GBP", "CAD", "AUD", "JPY"]
     statuses = ["Completed", "Pending", "Failed", "Refunded"]
     
-    for i in range(133):
-        payment_id = base_id + i
-        customer_id = random.choice(customers)["id"]
-        payment_date = fake.date_between_dates(
-            date_start=datetime.date(2023, 1, 1),
-            date_end=datetime.date(2023, 12, 31)
-        ).strftime('%Y-%m-%d')
-        amount = round(random.uniform(5, 100), 2)
-        currency = random.choice(currencies)
-        payment_method = random.choice(payment_methods)
-        status = random.choice(statuses)
-        
-        cursor.execute("""
-            INSERT INTO Payment (paymentID, paymentDate, amount, currency, paymentMethod, status, customerID)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (payment_id, payment_date, amount, currency, payment_method, status, customer_id))
+    writer.insert("Payment", zip(
+        ids.ids,
+        dist.dates(rng, *year_2023, n),
+        random_floats(rng, 5, 100, n),
+        random_choices(rng, currencies, n),
+        random_choices(rng, payment_methods, n),
+        random_choices(rng, statuses, n),
+        dist.foreign_ids(rng, ids, n)
+    ))
     
     # Generate and insert profile data
-    profiles = []
-    for i in range(133):
-        profile_id = base_id + i
-        watch_history_id = base_id + i  # 1:1 relationship with watch history
-        customer_id = random.choice(customers)["id"]
-        profile_name = fake.user_name()
-        profile_picture = f"avatar_{fake.word()}.png"
-        is_online = random.choice([0, 1])  # Boolean as integer
-        
-        cursor.execute("""
-            INSERT INTO Profile (profileName, profilePicture, isOnline, profileID, WatchHistoryID, customerID)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (profile_name, profile_picture, is_online, profile_id, watch_history_id, customer_id))
-        
-        profiles.append({
-            "id": profile_id
-        })
+    writer.insert("Profile", zip(
+        text.user_names(n),
+        [f"avatar_{word}.png" for word in text.words(n)],
+        random_ints(rng, 0, 1, n),  # Boolean as integer
+        ids.ids,
+        ids.ids,  # 1:1 relationship with watch history
+        dist.foreign_ids(rng, ids, n)
+    ))
     
     # Generate and insert reviews
-    for i in range(133):
-        movie_id = base_id + i
-        profile_id = random.choice(profiles)["id"]
-        rating = random.randint(1, 5)
-        comment = fake.paragraph(nb_sentences=2)
-        review_date = fake.date_between_dates(
-            date_start=datetime.date(2023, 1, 1),
-            date_end=datetime.date(2023, 12, 31)
-        ).strftime('%Y-%m-%d')
-        
-        cursor.execute("""
-            INSERT INTO Reviews (rating, movieID, comment, reviewDate, profileID)
-            VALUES (?, ?, ?, ?, ?)
-        """, (rating, movie_id, comment, review_date, profile_id))
-    
-    # Generate and insert marks as favorite
-    for i in range(133):
-        profile_id = random.choice(profiles)["id"]
-        movie_id = base_id + random.randint(0, 132)  # One of the movies we created in favorites
-        
-        # Avoid duplicate primary keys
-        cursor.execute("SELECT COUNT(*) FROM MarksAsFavorite WHERE profileID = ? AND movieID = ?", (profile_id, movie_id))
-        if cursor.fetchone()[0] == 0:
-            cursor.execute("""
-                INSERT INTO MarksAsFavorite (profileID, movieID)
-                VALUES (?, ?)
-            """, (profile_id, movie_id))
+    writer.insert("Reviews", zip(
+        random_ints(rng, 1, 5, n),
+        ids.ids,
+        text.comments(n),
+        dist.dates(rng, *year_2023, n),
+        dist.foreign_ids(rng, ids, n)
+    ))
+    
+    # Generate and insert marks as favorite. Pairs are sampled without
+    # replacement, so there are no duplicate primary keys to look up; pairs
+    # already in the table (e.g. from an earlier run) are skipped on insert.
+    profile_ids, movie_ids = unique_pairs(rng, ids, n)  # Movies are the ones we created in favorites
+    writer.insert("MarksAsFavorite", zip(profile_ids, movie_ids), ignore_conflicts=True)
     
     # Commit and close connection
-    conn.commit()
-    conn.close()
+    writer.close()
     
     print(f"Successfully populated 1/3 of the database using Python generation")
 
 
-if _name_ == "_main_":
+if __name__ == "__main__":
     # Example usage
     populate_from_python("streaming_service.db")
@@ -0,0 +1,197 @@
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from loaders import populate_from_excel, populate_from_json, populate_from_python
+from populate_coordinator import create_database
+from table_writer import is_postgres, timed_inserts
+
+# Loaders the benchmark can run, by the name used on the command line
+LOADERS = {
+    "json": populate_from_json,
+    "excel": populate_from_excel,
+    "python": populate_from_python,
+}
+
+# A table whose rows/sec drops by more than this fraction counts as a regression
+REGRESSION_THRESHOLD = 0.10
+
+
+def peak_rss_mb():
+    """
+    Returns the peak resident set size of this process in MB, or None where
+    the platform doesn't report it.
+    """
+    try:
+        # Only available on Unix
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_loader(loader, db_path, scale_factor, bulk=False, vectorized=False, use_faker=False, seed=0):
+    """
+    Runs one loader into a fresh database and measures it. Runs in its own
+    spawned worker process, so the peak RSS belongs to this run alone rather
+    than including the memory of a forked parent.
+
+    Args:
+        loader (str): Name of the loader, a key of LOADERS
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        scale_factor (float): Dataset size
+        bulk (bool): Bulk-load mode
+        vectorized (bool): Generate columns with NumPy (JSON and Excel loaders)
+        use_faker (bool): Generate names and text with Faker (Python loader)
+        seed (int): Random seed, so every run generates the same rows
+
+    Returns:
+        dict: Wall time split into generation and insertion, peak RSS and
+            rows, seconds and rows/sec per table
+    """
+    random.seed(seed)
+    create_database(db_path)
+
+    options = {"use_faker": use_faker} if loader == "python" else {"vectorized": vectorized}
+    with timed_inserts() as timings:
+        start = time.perf_counter()
+        LOADERS[loader](db_path, bulk=bulk, scale_factor=scale_factor, **options)
+        seconds = time.perf_counter() - start
+
+    insertion = sum(table_seconds for _, table_seconds in timings.values())
+    return {
+        "loader": loader,
+        "scale_factor": scale_factor,
+        "seconds": round(seconds, 4),
+        "generation_seconds": round(seconds - insertion, 4),
+        "insertion_seconds": round(insertion, 4),
+        "peak_rss_mb": peak_rss_mb(),
+        "tables": {
+            table: {
+                "rows": rows,
+                "seconds": round(table_seconds, 4),
+                "rows_per_sec": round(rows / table_seconds) if table_seconds else None,
+            }
+            for table, (rows, table_seconds) in timings.items()
+        },
+    }
+
+
+def run_benchmark(db_path, loaders, scale_factors, bulk=False, vectorized=False, use_faker=False, seed=0):
+    """
+    Runs every loader at every scale factor, each in a fresh worker process
+    and a fresh database.
+
+    Args:
+        db_path (str): Scratch SQLite file or PostgreSQL URL - its tables are replaced
+        loaders (list): Names of the loaders to run
+        scale_factors (list): Dataset sizes to run them at
+        bulk (bool): Bulk-load mode
+        vectorized (bool): Generate columns with NumPy
+        use_faker (bool): Generate names and text with Faker
+        seed (int): Random seed of every run
+
+    Returns:
+        dict: The benchmark results, as written to the result file
+    """
+    # A forked worker starts with the parent's peak RSS, which would hide
+    # smaller runs after a large one - spawned workers start from scratch
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for scale_factor in scale_factors:
+        for loader in loaders:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                run = pool.submit(
+                    run_loader, loader, db_path, scale_factor, bulk, vectorized, use_faker, seed
+                ).result()
+            runs.append(run)
+            print(f"{loader} x{scale_factor}: {run['seconds']:.2f}s "
+                  f"(generation {run['generation_seconds']:.2f}s, insertion {run['insertion_seconds']:.2f}s), "
+                  f"peak RSS {run['peak_rss_mb']} MB")
+
+    if not is_postgres(db_path) and os.path.exists(db_path):
+        os.remove(db_path)
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {"backend": "postgresql" if is_postgres(db_path) else "sqlite", "bulk": bulk,
+                    "vectorized": vectorized, "use_faker": use_faker, "seed": seed},
+        "runs": runs,
+    }
+
+
+def compare_results(baseline, results, threshold=REGRESSION_THRESHOLD):
+    """
+    Prints the rows/sec change of every table between two benchmark results
+    and returns the tables that regressed by more than `threshold`.
+
+    Args:
+        baseline (dict): Earlier benchmark results
+        results (dict): New benchmark results
+        threshold (float): Fractional slowdown that counts as a regression
+    """
+    earlier = {(run["loader"], run["scale_factor"]): run for run in baseline["runs"]}
+    regressions = []
+
+    print("\nComparison with baseline (rows/sec):")
+    print("-" * 40)
+    if baseline["options"] != results["options"]:
+        print(f"Note: baseline options differ - {baseline['options']}")
+    for run in results["runs"]:
+        old_run = earlier.get((run["loader"], run["scale_factor"]))
+        if old_run is None:
+            continue
+        for table, timing in run["tables"].items():
+            old = old_run["tables"].get(table, {}).get("rows_per_sec")
+            new = timing["rows_per_sec"]
+            if not old or not new:
+                continue
+            change = new / old - 1
+            status = "✗" if change < -threshold else "✓"
+            print(f"{run['loader']} x{run['scale_factor']} {table}: {old} -> {new} ({change:+.1%}) {status}")
+            if change < -threshold:
+                regressions.append(f"{run['loader']} x{run['scale_factor']} {table}")
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the data_insert loaders")
+    parser.add_argument("--db", default="benchmark.db",
+                        help="scratch SQLite file or postgresql:// URL - its tables are replaced")
+    parser.add_argument("--loaders", nargs="+", choices=list(LOADERS), default=list(LOADERS),
+                        help="loaders to run (default: all)")
+    parser.add_argument("--scale-factors", nargs="+", type=float, default=[1, 10, 100],
+                        help="dataset sizes to run each loader at (default: 1 10 100)")
+    parser.add_argument("--bulk", action="store_true", help="use the bulk-load mode")
+    parser.add_argument("--vectorized", action="store_true", help="generate columns with NumPy")
+    parser.add_argument("--faker", action="store_true", help="generate names and text with Faker")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of every run (default: 0)")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="JSON file to write the results to (default: benchmark_results.json)")
+    parser.add_argument("--compare", help="earlier result file; exits with status 1 on a regression")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.db, args.loaders, args.scale_factors, bulk=args.bulk,
+                            vectorized=args.vectorized, use_faker=args.faker, seed=args.seed)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results)
+        if regressions:
+            print(f"\n{len(regressions)} regressions over {REGRESSION_THRESHOLD:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
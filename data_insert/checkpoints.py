@@ -0,0 +1,120 @@
+import random
+from itertools import islice
+
+# Progress of a resumable build is kept in this table of the database being
+# built, so the rows and the checkpoint recording them commit together
+CHECKPOINT_TABLE = "populate_checkpoints"
+
+# Rows committed together with one checkpoint. An interrupted build resumes
+# from the last of these commits rather than from the start of the table.
+CHECKPOINT_ROWS = 100000
+
+
+class Checkpoints:
+    """
+    Checkpoints of a build, one row per stage: a loader ("json"), a table
+    loaded by it ("json.Customer"), or a coordinator step ("schema", "keys").
+    Each row holds the seed the stage was generated with, how many of its
+    rows are committed and whether it is complete.
+    """
+
+    def __init__(self, conn, param="?"):
+        """
+        Args:
+            conn: Open DB-API connection to the database being built
+            param (str): The driver's query parameter placeholder
+        """
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.param = param
+
+        self.cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE}\n(\n"
+            "  stage VARCHAR NOT NULL,\n"
+            "  seed BIGINT,\n"
+            "  rows_done INT NOT NULL,\n"
+            "  complete BOOL NOT NULL,\n"
+            "  PRIMARY KEY (stage)\n)"
+        )
+        self.cursor.execute(f"SELECT stage, seed, rows_done, complete FROM {CHECKPOINT_TABLE}")
+        self.stages = {
+            stage: (seed, rows_done, bool(complete)) for stage, seed, rows_done, complete in self.cursor.fetchall()
+        }
+        self.conn.commit()
+
+    def is_complete(self, stage):
+        """Returns True when an earlier run completed the stage."""
+        return stage in self.stages and self.stages[stage][2]
+
+    def rows_done(self, stage):
+        """Returns the number of rows of the stage already committed."""
+        return self.stages[stage][1] if stage in self.stages else 0
+
+    def seed(self, stage):
+        """
+        Returns the seed the stage was first generated with, recording a new
+        one if the stage has not been started yet.
+        """
+        if stage not in self.stages:
+            self.record(self.cursor, stage, 0, False, random.getrandbits(63))
+            self.conn.commit()
+        return self.stages[stage][0]
+
+    def record(self, cursor, stage, rows_done, complete, seed=None):
+        """
+        Records a stage's progress. Not committed here - the caller commits it
+        in the same transaction as the rows it describes.
+
+        Args:
+            cursor: Cursor of the transaction the rows were written in
+            stage (str): Name of the stage
+            rows_done (int): Rows of the stage committed so far
+            complete (bool): Whether the stage is finished
+            seed (int): Seed of the stage, kept from the first record if None
+        """
+        if seed is None and stage in self.stages:
+            seed = self.stages[stage][0]
+        values = ", ".join([self.param] * 4)
+        cursor.execute(
+            f"INSERT INTO {CHECKPOINT_TABLE} (stage, seed, rows_done, complete) VALUES ({values}) "
+            f"ON CONFLICT (stage) DO UPDATE SET rows_done = excluded.rows_done, complete = excluded.complete",
+            (stage, seed, rows_done, complete)
+        )
+        self.stages[stage] = (seed, rows_done, complete)
+
+    def complete(self, stage):
+        """Marks a stage complete and commits."""
+        self.record(self.cursor, stage, self.rows_done(stage), True)
+        self.conn.commit()
+
+    def chunks(self, stage, rows):
+        """
+        Splits a stage's rows into lists of CHECKPOINT_ROWS rows, skipping the
+        rows an earlier run already committed. Rows must be generated in the
+        same order on every run, i.e. from the same seed.
+
+        Args:
+            stage (str): Name of the stage
+            rows (iterable): All rows of the stage
+        """
+        remaining = islice(rows, self.rows_done(stage), None)
+        while True:
+            chunk = list(islice(remaining, CHECKPOINT_ROWS))
+            if not chunk:
+                return
+            yield chunk
+
+    def drop(self):
+        """
+        Drops the checkpoint table once the build it tracked is finished, so
+        the next resumable run starts a new build, and closes the connection.
+        """
+        self.cursor.execute(f"DROP TABLE {CHECKPOINT_TABLE}")
+        self.conn.commit()
+        self.close()
+
+    def close(self):
+        """
+        Closes the connection.
+        """
+        self.conn.close()
@@ -0,0 +1,119 @@
+import datetime
+import random
+from pathlib import Path
+
+# Index of each loader in the ID layout, in the order they populate the database
+JSON_LOADER = 0
+EXCEL_LOADER = 1
+PYTHON_LOADER = 2
+
+# Rows each loader contributes to every table at scale factor 1 (~400 per table)
+LOADER_ROWS = (134, 133, 133)
+
+# Size of the movie catalogue each loader draws watch history from at scale factor 1
+MOVIES_PER_LOADER = 1000
+
+# Date the dataset is generated as of, used for ages. Fixed rather than today's
+# date, so a seed builds the same rows whichever day it runs.
+REFERENCE_DATE = datetime.date(2024, 1, 1)
+
+# Device IDs are derived from the customer ID, leaving room for this many devices each
+MAX_DEVICES_PER_CUSTOMER = 4
+
+
+def scaled(rows, scale_factor):
+    """
+    Scales a row count, never going below one row.
+
+    Args:
+        rows (int): Row count at scale factor 1
+        scale_factor (float): Dataset scale factor
+    """
+    return max(1, int(round(rows * scale_factor)))
+
+
+def device_id(customer_id, index):
+    """
+    Returns the ID of a customer's n-th device. IDs never overlap between
+    customers, so every loader can assign them without coordination.
+
+    Args:
+        customer_id (int): Owner of the device
+        index (int): Zero-based position of the device for that customer
+    """
+    return (customer_id - 1) * MAX_DEVICES_PER_CUSTOMER + index + 1
+
+
+class DatasetSlice:
+    """
+    The block of IDs one loader owns at a given scale factor. The same block
+    is used for every table (customers, profiles, payments, ...), so foreign
+    keys stay consistent across all eight tables.
+
+    When the build is split into shards, each shard generates the rows of a
+    disjoint part of the block, while foreign keys may point anywhere in the
+    loader's block - those rows exist once all shards are merged.
+    """
+
+    def __init__(self, loader, scale_factor=1, shard=0, shards=1):
+        self.loader = loader
+        self.scale_factor = scale_factor
+        self.shard = shard
+        self.shards = shards
+
+        counts = [scaled(rows, scale_factor) for rows in LOADER_ROWS]
+        self.loader_base_id = 1 + sum(counts[:loader])
+        self.loader_count = counts[loader]
+
+        start = self.loader_count * shard // shards
+        end = self.loader_count * (shard + 1) // shards
+        self.base_id = self.loader_base_id + start
+        self.count = end - start
+
+        movies = scaled(MOVIES_PER_LOADER, scale_factor)
+        self.movie_low = loader * movies + 1
+        self.movie_high = (loader + 1) * movies
+
+    @property
+    def ids(self):
+        """IDs of the rows this slice generates."""
+        return range(self.base_id, self.base_id + self.count)
+
+    def random_id(self):
+        """Returns a random ID from this loader's block, used for foreign keys."""
+        return self.loader_base_id + random.randrange(self.loader_count)
+
+    def random_movie(self):
+        """Returns a random movie ID from this slice's part of the catalogue."""
+        return random.randint(self.movie_low, self.movie_high)
+
+    def random_pairs(self, count):
+        """
+        Returns unique random (profileID, movieID) pairs, used for the
+        MarksAsFavorite composite primary key. Profiles come from this shard
+        only, so pairs from different shards never collide.
+
+        Args:
+            count (int): Number of pairs to generate
+        """
+        count = min(count, self.count * self.loader_count)
+        pairs = []
+        seen = set()
+        while len(pairs) < count:
+            pair = (self.base_id + random.randrange(self.count), self.random_id())
+            if pair not in seen:
+                seen.add(pair)
+                pairs.append(pair)
+        return pairs
+
+    def work_dir(self, name):
+        """
+        Returns the directory a loader keeps its source files in, separate
+        per shard so parallel workers don't overwrite each other's files.
+
+        Args:
+            name (str): The loader's directory name
+        """
+        if self.shards == 1:
+            return Path(name)
+        return Path(name) / f"shard_{self.shard}"
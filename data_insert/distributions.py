@@ -0,0 +1,101 @@
+import numpy as np
+from vectorized import random_dates, random_foreign_ids, random_ints
+
+# Relative amount of activity on each day of the week, Monday first
+WEEKDAY_WEIGHTS = (0.85, 0.8, 0.85, 0.9, 1.1, 1.3, 1.2)
+
+
+class Uniform:
+    """
+    Movie IDs, event dates and foreign keys drawn uniformly - the default.
+    """
+
+    def movies(self, rng, low, high, size):
+        return random_ints(rng, low, high, size)
+
+    def dates(self, rng, start, days, size):
+        return random_dates(rng, start, days, size)
+
+    def foreign_ids(self, rng, ids, size):
+        return random_foreign_ids(rng, ids, size)
+
+    def settings(self):
+        return None
+
+
+class Skewed:
+    """
+    The same columns drawn from skewed distributions, for testing under
+    realistic hot spots: Zipf movie popularity, event dates weighted towards
+    recent days and weekends, and power-law activity per customer and profile.
+    """
+
+    def __init__(self, zipf_exponent=1.1, activity_exponent=1.2, recency=3.0, weekly=True, activity_seed=0):
+        """
+        Args:
+            zipf_exponent (float): Zipf exponent of movie popularity - the
+                lowest movie ID of a range is the most watched
+            activity_exponent (float): Pareto shape of how active each
+                customer or profile is; smaller is more skewed
+            recency (float): How many times likelier the last day of a date
+                range is than the first
+            weekly (bool): Weight dates by WEEKDAY_WEIGHTS
+            activity_seed (int): Seed of each ID's activity, fixed so every
+                loader and shard agrees on which IDs are the most active
+        """
+        self.zipf_exponent = zipf_exponent
+        self.activity_exponent = activity_exponent
+        self.recency = recency
+        self.weekly = weekly
+        self.activity_seed = activity_seed
+        self.weights = {}
+
+    def movies(self, rng, low, high, size):
+        """Returns movie IDs from low to high inclusive, Zipf-distributed."""
+        key = ("movies", low, high)
+        if key not in self.weights:
+            ranks = np.arange(1, high - low + 2)
+            self.weights[key] = normalized(ranks ** -self.zipf_exponent)
+        return (low + rng.choice(high - low + 1, size=size, p=self.weights[key])).tolist()
+
+    def dates(self, rng, start, days, size):
+        """Returns ISO dates from `start` to `start + days`, favouring recent days and weekends."""
+        key = ("dates", start, days)
+        if key not in self.weights:
+            offsets = np.arange(days + 1)
+            weights = self.recency ** (offsets / max(days, 1))
+            if self.weekly:
+                # Day 0 of the epoch, 1970-01-01, was a Thursday
+                weekdays = (np.datetime64(start, "D").astype(np.int64) + offsets + 3) % 7
+                weights = weights * np.array(WEEKDAY_WEIGHTS)[weekdays]
+            self.weights[key] = normalized(weights)
+        offsets = rng.choice(days + 1, size=size, p=self.weights[key])
+        return (np.datetime64(start, "D") + offsets).astype(str).tolist()
+
+    def foreign_ids(self, rng, ids, size):
+        """Returns IDs from a loader's block, each picked in proportion to its power-law activity."""
+        key = ("activity", ids.loader_base_id, ids.loader_count)
+        if key not in self.weights:
+            activity_rng = np.random.default_rng([self.activity_seed, ids.loader_base_id])
+            self.weights[key] = normalized(activity_rng.pareto(self.activity_exponent, ids.loader_count) + 1)
+        return (ids.loader_base_id + rng.choice(ids.loader_count, size=size, p=self.weights[key])).tolist()
+
+    def settings(self):
+        """Returns the parameters of the distributions, e.g. for snapshot keys."""
+        return {
+            "zipf_exponent": self.zipf_exponent,
+            "activity_exponent": self.activity_exponent,
+            "recency": self.recency,
+            "weekly": self.weekly,
+            "activity_seed": self.activity_seed,
+        }
+
+
+def normalized(weights):
+    """
+    Scales weights to probabilities that sum to 1.
+
+    Args:
+        weights (ndarray): Non-negative weights
+    """
+    return weights / weights.sum()
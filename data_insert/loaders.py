@@ -0,0 +1,40 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+# The numbered loader scripts, by the module name each is loaded as. Their file
+# names aren't valid module names, so they can't be imported the usual way.
+LOADER_SCRIPTS = {
+    "populate_from_json": "1_mockaroo(JSON).py",
+    "populate_from_excel": "2_excel_import.py",
+    "populate_from_python": "3_direct_insertion.py",
+}
+
+
+def load_script(module_name):
+    """
+    Loads one of the numbered loader scripts from its path as a module,
+    once per process.
+
+    Args:
+        module_name (str): Name to load it as, a key of LOADER_SCRIPTS
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    path = Path(__file__).with_name(LOADER_SCRIPTS[module_name])
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered first, as for a normal import, so pickle can find its functions
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+populate_from_json = load_script("populate_from_json").populate_from_json
+populate_from_excel = load_script("populate_from_excel").populate_from_excel
+populate_from_python = load_script("populate_from_python").populate_from_python
@@ -1,126 +1,60 @@
-מתאם
+# מתאם
 
+import argparse
 import sqlite3
 import os
-from populate_from_json import populate_from_json
-from populate_from_excel import populate_from_excel
-from populate_from_python import populate_from_python
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+from checkpoints import CHECKPOINT_TABLE
+from dataset_scale import LOADER_ROWS, scaled
+from distributions import Skewed
+from loaders import populate_from_excel, populate_from_json, populate_from_python
+from schema import (
+    FOREIGN_KEYS, PRIMARY_KEYS, TABLE_COLUMNS, VALUE_RULES, create_table_sql, duplicate_keys_sql,
+    orphaned_rows_sql, row_counts_sql, value_violations_sql
+)
+from snapshots import SNAPSHOT_DIR, restore_snapshot, save_snapshot, snapshot_key
+from table_writer import connect, is_postgres, open_checkpoints, open_writer
 
-def create_database(db_path):
+def create_database(db_path, deferred_keys=False):
     """
     Creates the database schema based on the provided SQL statements.
     
     Args:
-        db_path (str): Path to the SQLite database file
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        deferred_keys (bool): Create bare tables and leave the keys to
+            build_keys, once the data is loaded
     """
-    # Remove existing database if it exists
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    postgres = is_postgres(db_path)
     
-    # Connect to database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    if postgres:
+        conn = connect(db_path)
+        cursor = conn.cursor()
+        
+        # Drop existing tables, referencing tables first. No CASCADE, so
+        # objects built on top of these tables are never dropped silently.
+        for table in reversed(list(TABLE_COLUMNS)):
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(f"DROP TABLE IF EXISTS {CHECKPOINT_TABLE}")
+    else:
+        # Remove existing database if it exists
+        if os.path.exists(db_path):
+            os.remove(db_path)
+        
+        # Connect to database
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
     
-    # Create tables
-    cursor.execute("""
-        CREATE TABLE Customer
-        (
-          firstName VARCHAR NOT NULL,
-          lastName VARCHAR NOT NULL,
-          customerID INT NOT NULL,
-          dateOfBirth DATE NOT NULL,
-          customerSince DATE NOT NULL,
-          PRIMARY KEY (customerID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE Devices
-        (
-          deviceName VARCHAR NOT NULL,
-          deviceID INT NOT NULL,
-          lastSeen DATE NOT NULL,
-          deviceType VARCHAR NOT NULL,
-          customerID INT NOT NULL,
-          PRIMARY KEY (deviceID),
-          FOREIGN KEY (customerID) REFERENCES customer(customerID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE WatchHistory
-        (
-          movieID INT NOT NULL,
-          watchDate DATE NOT NULL,
-          durationWatched FLOAT NOT NULL,
-          WatchHistoryID INT NOT NULL,
-          PRIMARY KEY (WatchHistoryID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE Favorites
-        (
-          movieID INT NOT NULL,
-          lastSeen DATE NOT NULL,
-          totalTimeWatched FLOAT NOT NULL,
-          PRIMARY KEY (movieID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE Payment
-        (
-          paymentID INT NOT NULL,
-          paymentDate DATE NOT NULL,
-          amount FLOAT NOT NULL,
-          currency VARCHAR NOT NULL,
-          paymentMethod VARCHAR NOT NULL,
-          status VARCHAR NOT NULL,
-          customerID INT NOT NULL,
-          PRIMARY KEY (paymentID),
-          FOREIGN KEY (customerID) REFERENCES customer(customerID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE Profile
-        (
-          profileName VARCHAR NOT NULL,
-          profilePicture VARCHAR NOT NULL,
-          isOnline BOOL NOT NULL,
-          profileID INT NOT NULL,
-          WatchHistoryID INT NOT NULL,
-          customerID INT NOT NULL,
-          PRIMARY KEY (profileID),
-          FOREIGN KEY (WatchHistoryID) REFERENCES WatchHistory(WatchHistoryID),
-          FOREIGN KEY (customerID) REFERENCES customer(customerID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE Reviews
-        (
-          rating INT NOT NULL,
-          movieID INT NOT NULL,
-          comment VARCHAR NOT NULL,
-          reviewDate DATE NOT NULL,
-          profileID INT NOT NULL,
-          PRIMARY KEY (movieID),
-          FOREIGN KEY (profileID) REFERENCES Profile(profileID)
-        )
-    """)
-    
-    cursor.execute("""
-        CREATE TABLE MarksAsFavorite
-        (
-          profileID INT NOT NULL,
-          movieID INT NOT NULL,
-          PRIMARY KEY (profileID, movieID),
-          FOREIGN KEY (profileID) REFERENCES Profile(profileID),
-          FOREIGN KEY (movieID) REFERENCES Favorites(movieID)
-        )
-    """)
+    # Create tables. SQLite only checks foreign keys when asked to, so bare
+    # SQLite tables keep them; PostgreSQL gets them from build_keys.
+    for table in TABLE_COLUMNS:
+        cursor.execute(create_table_sql(
+            table,
+            primary_key=not deferred_keys,
+            foreign_keys=not (deferred_keys and postgres)
+        ))
     
     # Commit and close
     conn.commit()
@@ -129,59 +63,444 @@ def create_database(db_path):
     print(f"Database schema created at {db_path}")
 
 
-def populate_database(db_path):
+def build_keys(db_path):
+    """
+    Builds the primary keys and foreign keys of a database created with
+    deferred_keys, after the load. Integrity is checked first with one
+    set-based query for duplicate keys and one for orphaned foreign keys,
+    and the violations are reported as a summary. Keys that would be
+    violated are not created.
+    
+    On SQLite the primary keys become unique indexes (SQLite cannot add a
+    primary key to an existing table) and the foreign keys are already declared.
+    
+    Args:
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+    
+    Returns:
+        dict: Number of violations per primary key and foreign key
+    """
+    postgres = is_postgres(db_path)
+    conn = connect(db_path)
+    cursor = conn.cursor()
+    violations = {}
+    
+    # Primary keys - the index is built in one pass over the loaded table
+    cursor.execute(duplicate_keys_sql())
+    duplicates = dict(cursor.fetchall())
+    for table, columns in PRIMARY_KEYS.items():
+        violations[f"{table} primary key"] = duplicates[table]
+        if duplicates[table]:
+            continue
+        if postgres:
+            cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({', '.join(columns)})")
+        else:
+            cursor.execute(f"CREATE UNIQUE INDEX pk_{table} ON {table} ({', '.join(columns)})")
+    conn.commit()
+    
+    # Foreign keys - checked against the new primary key indexes
+    cursor.execute(orphaned_rows_sql())
+    orphans = {(table, column): count for table, column, count in cursor.fetchall()}
+    for table, column, parent, parent_column in FOREIGN_KEYS:
+        count = orphans[(table, column)]
+        violations[f"{table}.{column} -> {parent}"] = count
+        if postgres and not count:
+            cursor.execute(
+                f"ALTER TABLE {table} ADD FOREIGN KEY ({column}) REFERENCES {parent}({parent_column})"
+            )
+    conn.commit()
+    conn.close()
+    
+    print("\nDeferred key build:")
+    print("-" * 40)
+    for key, count in violations.items():
+        status = "✓" if count == 0 else f"✗ {count} violating rows, key not created"
+        print(f"{key}: {status}")
+    
+    return violations
+
+
+def run_stage(db_path, resume, stage, function, *args, **kwargs):
+    """
+    Runs one stage of the build, seeded with a seed drawn for the stage.
+    When resuming, a stage an earlier run completed is skipped, and the stage
+    is seeded with the seed recorded when it first ran, so a resumed stage
+    regenerates exactly the same rows.
+    
+    Args:
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        resume (bool): Record the stage in the build's checkpoints
+        stage (str): Name of the stage
+        function (callable): Runs the stage, called with args and kwargs
+    """
+    if not resume:
+        # Drawn the same way as a recorded seed, so a seeded build produces
+        # the same rows whether or not it is resumable
+        random.seed(random.getrandbits(63))
+        function(*args, **kwargs)
+        return
+    
+    checkpoints = open_checkpoints(db_path)
+    complete = checkpoints.is_complete(stage)
+    seed = None if complete else checkpoints.seed(stage)
+    checkpoints.close()
+    if complete:
+        print(f"Skipping {stage}, completed by an earlier run")
+        return
+    
+    random.seed(seed)
+    function(*args, **kwargs)
+    
+    checkpoints = open_checkpoints(db_path)
+    checkpoints.complete(stage)
+    checkpoints.close()
+
+
+def run_loaders(db_path, resume=False, bulk=False, scale_factor=1, shard=0, shards=1, reuse_excel=False,
+                vectorized=False, use_faker=False, skew=None):
+    """
+    Runs the three loaders, each as a stage of the build.
+    
+    Args:
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        resume (bool): Checkpoint the loaders and skip what an earlier run completed
+        bulk (bool): Bulk-load mode
+        scale_factor (float): Dataset size
+        shard (int): Shard to build, from 0 to shards - 1
+        shards (int): Number of shards
+        reuse_excel (bool): Load the existing Excel files
+        vectorized (bool): Generate columns with NumPy
+        use_faker (bool): Generate names and text with Faker
+        skew (Skewed): Skewed distributions to draw from
+    """
+    run_stage(db_path, resume, "json", populate_from_json, db_path, bulk=bulk, scale_factor=scale_factor,
+              shard=shard, shards=shards, vectorized=vectorized, checkpoint=resume, skew=skew)
+    run_stage(db_path, resume, "excel", populate_from_excel, db_path, bulk=bulk, scale_factor=scale_factor,
+              shard=shard, shards=shards, regenerate=not reuse_excel, vectorized=vectorized, checkpoint=resume,
+              skew=skew)
+    run_stage(db_path, resume, "python", populate_from_python, db_path, bulk=bulk, scale_factor=scale_factor,
+              shard=shard, shards=shards, use_faker=use_faker, checkpoint=resume, skew=skew)
+
+
+def populate_database(db_path, bulk=False, scale_factor=1, shards=1, reuse_excel=False, vectorized=False,
+                      use_faker=False, deferred_keys=False, resume=False, seed=None,
+                      snapshot_dir=SNAPSHOT_DIR, skew=None):
     """
     Populates the database using all three methods.
     
     Args:
-        db_path (str): Path to the SQLite database file
+        db_path (str): Path to the SQLite database file, or a PostgreSQL URL
+            (postgresql://...) to stream the rows in with COPY
+        bulk (bool): Bulk-load mode - batched executemany inserts, one
+            transaction per table and the fast SQLite build profile
+            (WAL, synchronous off, larger page cache)
+        scale_factor (float): Dataset size - 1 gives ~400 rows per table,
+            1000 gives ~400k
+        shards (int): Number of parts to generate in parallel worker
+            processes; 1 builds everything in this process
+        reuse_excel (bool): Load the existing Excel files instead of writing
+            new ones, so their cached Parquet copies are used
+        vectorized (bool): Generate the JSON and Excel data a whole column
+            at a time with NumPy
+        use_faker (bool): Generate the direct-insertion names and text with
+            Faker instead of the precomputed pools (slower, more varied)
+        deferred_keys (bool): Load into bare tables and build the keys
+            afterwards in one pass, reporting any integrity violations
+        resume (bool): Checkpoint the build in the database, so running it
+            again after a failure continues from the last committed chunk
+            instead of starting over
+        seed (int): Random seed - the same seed, scale factor and options
+            always build the same rows. Seeded SQLite builds are stored as
+            snapshots and later builds of the same dataset clone them.
+        snapshot_dir (Path): Directory holding the snapshots
+        skew (Skewed): Draw movies, event dates and foreign keys from these
+            skewed distributions (Zipf popularity, recent days and weekends,
+            power-law activity) instead of uniformly
     """
-    # Create the database schema
-    create_database(db_path)
+    key = None
+    if seed is not None:
+        random.seed(seed)
+        # Existing Excel files are not generated from the seed, and a
+        # PostgreSQL database is not a file that can be cloned
+        if not (reuse_excel or is_postgres(db_path)):
+            key = snapshot_key(seed, scale_factor, shards=shards, vectorized=vectorized, use_faker=use_faker,
+                               deferred_keys=deferred_keys, skew=skew.settings() if skew else None)
+            if restore_snapshot(key, db_path, snapshot_dir):
+                print(f"Cloned snapshot {key[:12]} to {db_path}")
+                verify_data(db_path, scale_factor)
+                return
+    
+    # Create the database schema - kept if resuming a build that created it
+    run_stage(db_path, resume, "schema", create_database, db_path, deferred_keys=deferred_keys)
+    
+    if shards > 1:
+        run_stage(db_path, resume, "shards", populate_sharded, db_path, scale_factor, shards, reuse_excel,
+                  vectorized, use_faker, resume, skew)
+    else:
+        # Populate using the three different methods
+        run_loaders(db_path, resume, bulk=bulk, scale_factor=scale_factor, reuse_excel=reuse_excel,
+                    vectorized=vectorized, use_faker=use_faker, skew=skew)
     
-    # Populate using the three different methods
-    populate_from_json(db_path)
-    populate_from_excel(db_path)
-    populate_from_python(db_path)
+    if deferred_keys:
+        run_stage(db_path, resume, "keys", build_keys, db_path)
     
-    # Verify data count
-    verify_data_count(db_path)
+    if resume:
+        # The build is finished - its checkpoints have nothing left to resume
+        open_checkpoints(db_path).drop()
+    
+    if key is not None:
+        save_snapshot(key, db_path, snapshot_dir)
+        print(f"Saved snapshot {key[:12]} of {db_path}")
+    
+    # Verify the data
+    verify_data(db_path, scale_factor)
 
 
-def verify_data_count(db_path):
+def populate_sharded(db_path, scale_factor, shards, reuse_excel=False, vectorized=False, use_faker=False,
+                     resume=False, skew=None):
     """
-    Verifies that each table has at least 400 entries.
+    Splits every loader's rows into shards, builds each shard in its own
+    worker process and staging database, then merges the staging databases.
     
     Args:
-        db_path (str): Path to the SQLite database file
+        db_path (str): Path to the SQLite database file or PostgreSQL URL,
+            schema already created
+        scale_factor (float): Dataset size
+        shards (int): Number of shards
+        reuse_excel (bool): Load the existing Excel files of each shard
+        vectorized (bool): Generate columns with NumPy
+        use_faker (bool): Generate names and text with Faker
+        resume (bool): Checkpoint the shard builds and the merge, keeping the
+            staging databases until the merge is done
+        skew (Skewed): Skewed distributions to draw from
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    # Shards are always staged in SQLite files
+    staging_dir = Path("postgres.shards" if is_postgres(db_path) else f"{db_path}.shards")
+    staging_dir.mkdir(exist_ok=True)
+    staging_paths = [str(staging_dir / f"shard_{shard}.db") for shard in range(shards)]
     
-    tables = [
-        "Customer", 
-        "Devices", 
-        "WatchHistory", 
-        "Favorites", 
-        "Payment", 
-        "Profile", 
-        "Reviews", 
-        "MarksAsFavorite"
-    ]
-    
-    print("\nVerification of data counts:")
-    print("-" * 40)
+    # Each worker gets its own seed - forked workers would otherwise all
+    # continue from the same random state and generate identical values
+    seeds = [random.getrandbits(64) for _ in range(shards)]
+    
+    with ProcessPoolExecutor(max_workers=min(shards, os.cpu_count() or 1)) as pool:
+        list(pool.map(
+            build_shard,
+            staging_paths,
+            [scale_factor] * shards,
+            range(shards),
+            [shards] * shards,
+            seeds,
+            [reuse_excel] * shards,
+            [vectorized] * shards,
+            [use_faker] * shards,
+            [resume] * shards,
+            [skew] * shards
+        ))
     
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        count = cursor.fetchone()[0]
-        status = "✓" if count >= 400 else "✗"
+    merge_shards(db_path, staging_paths, resume)
+    for staging_path in staging_paths:
+        os.remove(staging_path)
+    staging_dir.rmdir()
+    
+    print(f"Merged {shards} shards into {db_path}")
+
+
+def build_shard(staging_path, scale_factor, shard, shards, seed, reuse_excel=False, vectorized=False,
+                use_faker=False, resume=False, skew=None):
+    """
+    Builds one shard with all three loaders. Runs in a worker process.
+    
+    Args:
+        staging_path (str): Path to the shard's own SQLite database file
+        scale_factor (float): Dataset size
+        shard (int): Shard to build, from 0 to shards - 1
+        shards (int): Number of shards
+        seed (int): Random seed for this shard
+        reuse_excel (bool): Load the shard's existing Excel files
+        vectorized (bool): Generate columns with NumPy
+        use_faker (bool): Generate names and text with Faker
+        resume (bool): Checkpoint the shard's staging database, continuing
+            the one an earlier run left behind
+        skew (Skewed): Skewed distributions to draw from
+    """
+    random.seed(seed)
+    
+    # Staging tables are only read back by the merge, so they never need keys
+    run_stage(staging_path, resume, "schema", create_database, staging_path, deferred_keys=True)
+    run_loaders(staging_path, resume, bulk=True, scale_factor=scale_factor, shard=shard, shards=shards,
+                reuse_excel=reuse_excel, vectorized=vectorized, use_faker=use_faker, skew=skew)
+
+
+def merge_shards(db_path, staging_paths, resume=False):
+    """
+    Copies every table of the staging databases into the main database,
+    one transaction per table.
+    
+    Args:
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        staging_paths (list): Paths to the shard databases
+        resume (bool): Checkpoint the merge and skip what an earlier run merged
+    """
+    writer = open_writer(db_path, bulk=True, stage="merge" if resume else None)
+    
+    if is_postgres(db_path):
+        # PostgreSQL enforces foreign keys between shards, so every table is
+        # completed from all shards - one COPY each - before the next one
+        stagings = [sqlite3.connect(staging_path) for staging_path in staging_paths]
+        for table, columns in TABLE_COLUMNS.items():
+            select = f"SELECT {', '.join(columns)} FROM {table}"
+            writer.insert(table, chain.from_iterable(staging.execute(select) for staging in stagings))
+        for staging in stagings:
+            staging.close()
+        writer.close()
+        return
+    
+    checkpoints = writer.checkpoints
+    for shard, staging_path in enumerate(staging_paths):
+        writer.cursor.execute("ATTACH DATABASE ? AS shard", (staging_path,))
+        for table, columns in TABLE_COLUMNS.items():
+            stage = f"merge.shard_{shard}.{table}"
+            if checkpoints is not None and checkpoints.is_complete(stage):
+                continue
+            column_list = ", ".join(columns)
+            with writer.transaction() as cursor:
+                cursor.execute(f"INSERT INTO main.{table} ({column_list}) SELECT {column_list} FROM shard.{table}")
+                if checkpoints is not None:
+                    checkpoints.record(cursor, stage, cursor.rowcount, True)
+        writer.cursor.execute("DETACH DATABASE shard")
+    
+    writer.close()
+
+
+def run_query(db_path, sql):
+    """
+    Runs one read-only query on its own connection and returns all rows.
+    
+    Args:
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        sql (str): Query to run
+    """
+    conn = connect(db_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql)
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+
+def verify_data(db_path, scale_factor=1):
+    """
+    Verifies the data of all eight tables: that each has at least the rows
+    the three loaders insert together at the scale factor, and that no keys
+    are duplicated, no foreign keys are orphaned and no values break
+    VALUE_RULES. Every check is a set-based query over all tables, and the
+    queries run in parallel on separate connections.
+    
+    Args:
+        db_path (str): Path to the SQLite database file or PostgreSQL URL
+        scale_factor (float): Scale factor the database was populated with
+    
+    Returns:
+        dict: Report with the row counts and the violations of each check,
+            and "ok" - whether every check passed
+    """
+    minimum = sum(scaled(rows, scale_factor) for rows in LOADER_ROWS)
+    
+    queries = {
+        "row_counts": row_counts_sql(),
+        "duplicate_keys": duplicate_keys_sql(),
+        "orphaned_rows": orphaned_rows_sql(),
+    }
+    for table in VALUE_RULES:
+        queries[table] = value_violations_sql(table)
+    
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        futures = {name: pool.submit(run_query, db_path, sql) for name, sql in queries.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    
+    value_violations = {}
+    for table, rules in VALUE_RULES.items():
+        counts = results[table][0]
+        for rule, count in zip(rules, counts):
+            value_violations[f"{table}: {rule}"] = count or 0
+    
+    # UNION ALL doesn't keep the order of its branches, so each row names its foreign key
+    orphans = {(table, column): count for table, column, count in results["orphaned_rows"]}
+    
+    report = {
+        "row_counts": {table: count for table, count in results["row_counts"]},
+        "minimum_rows": minimum,
+        "duplicate_keys": {table: count for table, count in results["duplicate_keys"]},
+        "orphaned_rows": {
+            f"{table}.{column} -> {parent}": orphans[(table, column)]
+            for table, column, parent, _ in FOREIGN_KEYS
+        },
+        "value_violations": value_violations,
+    }
+    report["ok"] = (
+        all(count >= minimum for count in report["row_counts"].values())
+        and not any(report["duplicate_keys"].values())
+        and not any(report["orphaned_rows"].values())
+        and not any(value_violations.values())
+    )
+    
+    print("\nVerification of data:")
+    print("-" * 40)
+    for table, count in report["row_counts"].items():
+        status = "✓" if count >= minimum else "✗"
         print(f"{table}: {count} entries {status}")
+    for check in ("duplicate_keys", "orphaned_rows", "value_violations"):
+        failed = {name: count for name, count in report[check].items() if count}
+        title = check.replace("_", " ").capitalize()
+        if failed:
+            print(f"{title}: ✗ " + ", ".join(f"{name} ({count})" for name, count in failed.items()))
+        else:
+            print(f"{title}: none ✓")
     
-    conn.close()
+    return report
 
 
-if _name_ == "_main_":
-    db_path = "streaming_service.db"
-    populate_database(db_path)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create and populate the streaming service database")
+    parser.add_argument("db_path", nargs="?", default="streaming_service.db",
+                        help="SQLite file, or a postgresql:// URL to load with COPY")
+    parser.add_argument("--bulk", action="store_true", help="use the bulk-load mode")
+    parser.add_argument("--scale-factor", type=float, default=1,
+                        help="dataset size, 1 gives ~400 rows per table (default: 1)")
+    parser.add_argument("--shards", type=int, default=1,
+                        help="generate the data in this many parallel worker processes (default: 1)")
+    parser.add_argument("--reuse-excel", action="store_true",
+                        help="load the existing Excel files instead of generating new ones")
+    parser.add_argument("--vectorized", action="store_true",
+                        help="generate the JSON and Excel data with NumPy, a column at a time")
+    parser.add_argument("--faker", action="store_true",
+                        help="generate the direct-insertion names and text with Faker (slower)")
+    parser.add_argument("--deferred-keys", action="store_true",
+                        help="load into bare tables and build keys and check integrity afterwards")
+    parser.add_argument("--resume", action="store_true",
+                        help="checkpoint the build, and continue an interrupted one instead of starting over")
+    parser.add_argument("--seed", type=int,
+                        help="random seed; seeded builds are saved as snapshots and cloned when rebuilt")
+    parser.add_argument("--snapshot-dir", default=SNAPSHOT_DIR,
+                        help=f"directory holding the snapshots (default: {SNAPSHOT_DIR})")
+    parser.add_argument("--skew", action="store_true",
+                        help="draw movies, event dates and foreign keys from skewed distributions")
+    parser.add_argument("--zipf-exponent", type=float, default=1.1,
+                        help="Zipf exponent of movie popularity with --skew (default: 1.1)")
+    parser.add_argument("--activity-exponent", type=float, default=1.2,
+                        help="Pareto shape of customer and profile activity with --skew (default: 1.2)")
+    parser.add_argument("--recency", type=float, default=3.0,
+                        help="how much likelier the latest date is than the earliest with --skew (default: 3)")
+    args = parser.parse_args()
+    
+    skew = None
+    if args.skew:
+        skew = Skewed(args.zipf_exponent, args.activity_exponent, args.recency)
+    
+    populate_database(args.db_path, bulk=args.bulk, scale_factor=args.scale_factor, shards=args.shards,
+                      reuse_excel=args.reuse_excel, vectorized=args.vectorized, use_faker=args.faker,
+                      deferred_keys=args.deferred_keys, resume=args.resume, seed=args.seed,
+                      snapshot_dir=args.snapshot_dir, skew=skew)
     print("\nDatabase population complete!")
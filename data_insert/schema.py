@@ -0,0 +1,167 @@
+# Schema of the eight tables, listed in the order the tables are loaded
+
+# Column definitions of every table
+TABLE_DEFINITIONS = {
+    "Customer": (
+        ("firstName", "VARCHAR"),
+        ("lastName", "VARCHAR"),
+        ("customerID", "INT"),
+        ("dateOfBirth", "DATE"),
+        ("customerSince", "DATE"),
+    ),
+    "Devices": (
+        ("deviceName", "VARCHAR"),
+        ("deviceID", "INT"),
+        ("lastSeen", "DATE"),
+        ("deviceType", "VARCHAR"),
+        ("customerID", "INT"),
+    ),
+    "WatchHistory": (
+        ("movieID", "INT"),
+        ("watchDate", "DATE"),
+        ("durationWatched", "FLOAT"),
+        ("WatchHistoryID", "INT"),
+    ),
+    "Favorites": (
+        ("movieID", "INT"),
+        ("lastSeen", "DATE"),
+        ("totalTimeWatched", "FLOAT"),
+    ),
+    "Payment": (
+        ("paymentID", "INT"),
+        ("paymentDate", "DATE"),
+        ("amount", "FLOAT"),
+        ("currency", "VARCHAR"),
+        ("paymentMethod", "VARCHAR"),
+        ("status", "VARCHAR"),
+        ("customerID", "INT"),
+    ),
+    "Profile": (
+        ("profileName", "VARCHAR"),
+        ("profilePicture", "VARCHAR"),
+        ("isOnline", "BOOL"),
+        ("profileID", "INT"),
+        ("WatchHistoryID", "INT"),
+        ("customerID", "INT"),
+    ),
+    "Reviews": (
+        ("rating", "INT"),
+        ("movieID", "INT"),
+        ("comment", "VARCHAR"),
+        ("reviewDate", "DATE"),
+        ("profileID", "INT"),
+    ),
+    "MarksAsFavorite": (
+        ("profileID", "INT"),
+        ("movieID", "INT"),
+    ),
+}
+
+# Column order used for every INSERT
+TABLE_COLUMNS = {
+    table: tuple(name for name, _ in columns) for table, columns in TABLE_DEFINITIONS.items()
+}
+
+PRIMARY_KEYS = {
+    "Customer": ("customerID",),
+    "Devices": ("deviceID",),
+    "WatchHistory": ("WatchHistoryID",),
+    "Favorites": ("movieID",),
+    "Payment": ("paymentID",),
+    "Profile": ("profileID",),
+    "Reviews": ("movieID",),
+    "MarksAsFavorite": ("profileID", "movieID"),
+}
+
+# (table, column, referenced table, referenced column)
+FOREIGN_KEYS = (
+    ("Devices", "customerID", "Customer", "customerID"),
+    ("Payment", "customerID", "Customer", "customerID"),
+    ("Profile", "WatchHistoryID", "WatchHistory", "WatchHistoryID"),
+    ("Profile", "customerID", "Customer", "customerID"),
+    ("Reviews", "profileID", "Profile", "profileID"),
+    ("MarksAsFavorite", "profileID", "Profile", "profileID"),
+    ("MarksAsFavorite", "movieID", "Favorites", "movieID"),
+)
+
+
+def create_table_sql(table, primary_key=True, foreign_keys=True):
+    """
+    Returns the CREATE TABLE statement for a table.
+
+    Args:
+        table (str): Name of the table
+        primary_key (bool): Declare the primary key
+        foreign_keys (bool): Declare the foreign keys
+    """
+    lines = [f"{name} {sql_type} NOT NULL" for name, sql_type in TABLE_DEFINITIONS[table]]
+    if primary_key:
+        lines.append(f"PRIMARY KEY ({', '.join(PRIMARY_KEYS[table])})")
+    if foreign_keys:
+        for child, column, parent, parent_column in FOREIGN_KEYS:
+            if child == table:
+                lines.append(f"FOREIGN KEY ({column}) REFERENCES {parent}({parent_column})")
+
+    body = ",\n  ".join(lines)
+    return f"CREATE TABLE {table}\n(\n  {body}\n)"
+
+
+def duplicate_keys_sql():
+    """
+    Returns one query that counts duplicated primary key values in every
+    table, as (table, duplicated keys) rows.
+    """
+    parts = []
+    for table, columns in PRIMARY_KEYS.items():
+        column_list = ", ".join(columns)
+        parts.append(
+            f"SELECT '{table}', COUNT(*) FROM "
+            f"(SELECT {column_list} FROM {table} GROUP BY {column_list} HAVING COUNT(*) > 1) d"
+        )
+    return "\nUNION ALL\n".join(parts)
+
+
+def orphaned_rows_sql():
+    """
+    Returns one query that counts rows whose foreign key has no matching
+    parent row, as (table, column, orphaned rows) rows - one anti-join per
+    foreign key.
+    """
+    parts = []
+    for table, column, parent, parent_column in FOREIGN_KEYS:
+        parts.append(
+            f"SELECT '{table}', '{column}', COUNT(*) FROM {table} c "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {parent} p WHERE p.{parent_column} = c.{column})"
+        )
+    return "\nUNION ALL\n".join(parts)
+
+# Conditions every row's values must meet, per table
+VALUE_RULES = {
+    "WatchHistory": ("durationWatched > 0",),
+    "Favorites": ("totalTimeWatched >= 0",),
+    "Payment": (
+        "amount > 0",
+        "currency IN ('USD', 'EUR', 'GBP', 'CAD', 'AUD', 'JPY')",
+        "status IN ('Completed', 'Pending', 'Failed', 'Refunded')",
+    ),
+    "Reviews": ("rating BETWEEN 1 AND 5",),
+}
+
+
+def row_counts_sql():
+    """
+    Returns one query that counts the rows of every table, as (table, rows) rows.
+    """
+    return "\nUNION ALL\n".join(f"SELECT '{table}', COUNT(*) FROM {table}" for table in TABLE_DEFINITIONS)
+
+
+def value_violations_sql(table):
+    """
+    Returns a query that counts the rows breaking each of a table's
+    VALUE_RULES in a single scan, as one row with a count per rule.
+
+    Args:
+        table (str): Name of the table
+    """
+    counts = ", ".join(f"SUM(CASE WHEN {rule} THEN 0 ELSE 1 END)" for rule in VALUE_RULES[table])
+    return f"SELECT {counts} FROM {table}"
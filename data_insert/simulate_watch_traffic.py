@@ -0,0 +1,286 @@
+import argparse
+import itertools
+import json
+import random
+import statistics
+import threading
+import time
+import numpy as np
+from distributions import Skewed, normalized
+from table_writer import connect, is_postgres
+
+# Kinds of watch event the simulator sends
+INSERT_EVENT = "insert"        # INSERT INTO WatchHistory, fires trigger_update_favorites
+PROCEDURE_EVENT = "procedure"  # CALL update_viewing_data_and_recommendations
+
+INSERT_SQL = (
+    "INSERT INTO WatchHistory (WatchHistoryID, movieID, watchDate, durationWatched) "
+    "VALUES (%s, %s, CURRENT_DATE, %s)"
+)
+PROCEDURE_SQL = "CALL update_viewing_data_and_recommendations(%s, %s, %s, %s)"
+
+# New watch events take the next WatchHistoryID (the procedure uses MAX + 1),
+# so concurrent events collide on the key. An event that hits a unique
+# violation is retried with a new ID, up to this many attempts in all.
+MAX_ATTEMPTS = 5
+UNIQUE_VIOLATION = "23505"
+
+
+def load_targets(db_path):
+    """
+    Returns the movie IDs and profile IDs events are generated for, and the
+    first free WatchHistoryID. Movies come from the Title table the trigger
+    and procedure look them up in, or from WatchHistory if there is none.
+
+    Args:
+        db_path (str): PostgreSQL URL
+    """
+    conn = connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT to_regclass('title') IS NOT NULL")
+    if cursor.fetchone()[0]:
+        cursor.execute("SELECT Title_ID FROM Title ORDER BY Title_ID")
+    else:
+        print("No Title table - using the movies in WatchHistory; procedure calls will fail")
+        cursor.execute("SELECT DISTINCT movieID FROM WatchHistory ORDER BY movieID")
+    movies = [movie for movie, in cursor.fetchall()]
+    cursor.execute("SELECT profileID FROM Profile ORDER BY profileID")
+    profiles = [profile for profile, in cursor.fetchall()]
+    cursor.execute("SELECT COALESCE(MAX(WatchHistoryID), 0) + 1 FROM WatchHistory")
+    next_id = cursor.fetchone()[0]
+    conn.close()
+    return movies, profiles, next_id
+
+
+class WatchTraffic:
+    """
+    Sends watch events to the database at a target rate from several
+    connections, each paced on its own schedule, and records the latency of
+    every event.
+    """
+
+    def __init__(self, db_path, rate, connections, procedure_ratio=0.2, skew=None, seed=None):
+        """
+        Args:
+            db_path (str): PostgreSQL URL
+            rate (float): Target events per second, across all connections
+            connections (int): Number of concurrent connections
+            procedure_ratio (float): Share of events sent through the
+                procedure; the rest are plain inserts
+            skew (Skewed): Pick movies with Zipf popularity and profiles
+                with power-law activity instead of uniformly
+            seed (int): Random seed of the event stream
+        """
+        self.db_path = db_path
+        self.rate = rate
+        self.connections = connections
+        self.procedure_ratio = procedure_ratio
+        self.skew = skew
+        self.seed = seed if seed is not None else random.getrandbits(63)
+
+        self.movies, self.profiles, next_id = load_targets(db_path)
+        if skew is not None:
+            # Fixed activity per profile, so every connection agrees on the most active ones
+            activity_rng = np.random.default_rng(skew.activity_seed)
+            self.profile_weights = normalized(activity_rng.pareto(skew.activity_exponent, len(self.profiles)) + 1)
+        # IDs of inserted events; procedure calls pick their own with MAX + 1
+        self.watch_ids = itertools.count(next_id)
+        self.lock = threading.Lock()
+        self.latencies = {INSERT_EVENT: [], PROCEDURE_EVENT: []}
+        self.errors = {INSERT_EVENT: 0, PROCEDURE_EVENT: 0}
+        self.retries = {INSERT_EVENT: 0, PROCEDURE_EVENT: 0}
+        self.error_samples = {}
+
+    def events(self, rng, size):
+        """
+        Generates a batch of events as (kind, movieID, profileID, minutes,
+        rating) tuples.
+
+        Args:
+            rng (Generator): NumPy random generator of the connection
+            size (int): Number of events
+        """
+        if self.skew is not None:
+            movie_indexes = np.array(self.skew.movies(rng, 0, len(self.movies) - 1, size))
+            profile_indexes = rng.choice(len(self.profiles), size=size, p=self.profile_weights)
+        else:
+            movie_indexes = rng.integers(0, len(self.movies), size=size)
+            profile_indexes = rng.integers(0, len(self.profiles), size=size)
+        kinds = np.where(rng.random(size) < self.procedure_ratio, PROCEDURE_EVENT, INSERT_EVENT)
+        minutes = np.round(rng.uniform(1, 180, size=size), 2)
+        ratings = rng.integers(1, 5, size=size, endpoint=True)
+        for kind, movie, profile, duration, rating in zip(kinds, movie_indexes, profile_indexes, minutes, ratings):
+            yield str(kind), self.movies[movie], self.profiles[profile], float(duration), int(rating)
+
+    def run_connection(self, index, deadline):
+        """
+        Sends events from one connection until the deadline, paced to its
+        share of the target rate. Runs in its own thread.
+
+        Args:
+            index (int): Number of the connection
+            deadline (float): time.perf_counter() value to stop at
+        """
+        conn = connect(self.db_path)
+        conn.autocommit = True
+        cursor = conn.cursor()
+        rng = np.random.default_rng([self.seed, index])
+        interval = self.connections / self.rate
+
+        # Connections start spread over one interval rather than all at once
+        next_send = time.perf_counter() + interval * index / self.connections
+        while next_send < deadline:
+            for kind, movie, profile, minutes, rating in self.events(rng, 1000):
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                if next_send >= deadline:
+                    break
+                next_send += interval
+
+                start = time.perf_counter()
+                error = self.send(conn, cursor, kind, movie, profile, minutes, rating)
+                latency = time.perf_counter() - start
+                with self.lock:
+                    if error is None:
+                        self.latencies[kind].append(latency)
+                    else:
+                        self.errors[kind] += 1
+                        self.error_samples.setdefault(kind, str(error).strip().splitlines()[0])
+        conn.close()
+
+    def send(self, conn, cursor, kind, movie, profile, minutes, rating):
+        """
+        Sends one event, retrying it on key collisions. Returns the error it
+        failed with, or None.
+
+        Args:
+            conn: Connection of the thread, in autocommit mode
+            cursor: Cursor of the connection
+            kind (str): INSERT_EVENT or PROCEDURE_EVENT
+            movie (int): Movie watched
+            profile (int): Profile watching it
+            minutes (float): Duration watched
+            rating (int): Rating given, for procedure events
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                if kind == INSERT_EVENT:
+                    cursor.execute(INSERT_SQL, (next(self.watch_ids), movie, minutes))
+                else:
+                    cursor.execute(PROCEDURE_SQL, (profile, movie, minutes, rating))
+                return None
+            except Exception as e:
+                if getattr(e, "pgcode", None) != UNIQUE_VIOLATION or attempt == MAX_ATTEMPTS - 1:
+                    return e
+                with self.lock:
+                    self.retries[kind] += 1
+            finally:
+                # Notices raised by the trigger and procedure aren't needed
+                del conn.notices[:]
+
+    def run(self, duration):
+        """
+        Sends events for `duration` seconds and returns the report.
+
+        Args:
+            duration (float): Seconds to run for
+        """
+        start = time.perf_counter()
+        deadline = start + duration
+        threads = [
+            threading.Thread(target=self.run_connection, args=(index, deadline))
+            for index in range(self.connections)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        report = {
+            "target_rate": self.rate,
+            "connections": self.connections,
+            "procedure_ratio": self.procedure_ratio,
+            "skewed": self.skew is not None,
+            "seconds": round(elapsed, 2),
+            "events": {},
+        }
+        all_latencies = []
+        for kind, latencies in self.latencies.items():
+            all_latencies.extend(latencies)
+            report["events"][kind] = latency_summary(latencies, elapsed)
+            report["events"][kind]["errors"] = self.errors[kind]
+            report["events"][kind]["retries"] = self.retries[kind]
+            if kind in self.error_samples:
+                report["events"][kind]["first_error"] = self.error_samples[kind]
+        report["total"] = latency_summary(all_latencies, elapsed)
+        report["total"]["errors"] = sum(self.errors.values())
+        report["total"]["retries"] = sum(self.retries.values())
+        return report
+
+
+def latency_summary(latencies, elapsed):
+    """
+    Returns the count, throughput and p50/p95/p99 latency of a set of events.
+
+    Args:
+        latencies (list): Latency of every successful event, in seconds
+        elapsed (float): Length of the run, in seconds
+    """
+    summary = {"count": len(latencies), "events_per_sec": round(len(latencies) / elapsed, 1)}
+    if len(latencies) >= 2:
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        summary["p50_ms"] = round(percentiles[49] * 1000, 2)
+        summary["p95_ms"] = round(percentiles[94] * 1000, 2)
+        summary["p99_ms"] = round(percentiles[98] * 1000, 2)
+    return summary
+
+
+def print_report(report):
+    """
+    Prints a simulation report.
+
+    Args:
+        report (dict): Report returned by WatchTraffic.run
+    """
+    print(f"\nWatch traffic: target {report['target_rate']} events/sec over "
+          f"{report['connections']} connections, {report['seconds']}s")
+    print("-" * 40)
+    for name, summary in list(report["events"].items()) + [("total", report["total"])]:
+        line = f"{name}: {summary['count']} events, {summary['events_per_sec']}/sec, {summary['errors']} errors, {summary['retries']} retries"
+        if "p50_ms" in summary:
+            line += f", p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, p99 {summary['p99_ms']} ms"
+        print(line)
+        if "first_error" in summary:
+            print(f"  first error: {summary['first_error']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Send watch events to WatchHistory at a target rate and measure the latency"
+    )
+    parser.add_argument("db_path", help="postgresql:// URL of a database with the part 4 triggers and procedures")
+    parser.add_argument("--rate", type=float, default=100, help="target events per second (default: 100)")
+    parser.add_argument("--connections", type=int, default=4, help="concurrent connections (default: 4)")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run for (default: 30)")
+    parser.add_argument("--procedure-ratio", type=float, default=0.2,
+                        help="share of events sent through update_viewing_data_and_recommendations (default: 0.2)")
+    parser.add_argument("--skew", action="store_true",
+                        help="pick movies by Zipf popularity and profiles by power-law activity")
+    parser.add_argument("--seed", type=int, help="random seed of the event stream")
+    parser.add_argument("--output", help="JSON file to write the report to")
+    args = parser.parse_args()
+
+    if not is_postgres(args.db_path):
+        parser.error("the trigger and procedure only exist in PostgreSQL - pass a postgresql:// URL")
+
+    traffic = WatchTraffic(args.db_path, args.rate, args.connections, args.procedure_ratio,
+                           skew=Skewed() if args.skew else None, seed=args.seed)
+    report = traffic.run(args.duration)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+# Finished databases of seeded builds, named by a hash of what produced them
+SNAPSHOT_DIR = Path("snapshots")
+
+# Bump whenever a change to the generators changes the rows a seed produces,
+# so snapshots built by the older generators are no longer matched
+GENERATOR_VERSION = 1
+
+# Linux ioctl that makes a file share another file's blocks (copy-on-write)
+FICLONE = 0x40049409
+
+
+def snapshot_key(seed, scale_factor, **options):
+    """
+    Returns the hash a seeded build's snapshot is stored under.
+
+    Args:
+        seed (int): Random seed of the build
+        scale_factor (float): Dataset size
+        **options: Other build options that change the rows or schema,
+            e.g. shards or vectorized
+    """
+    build = {"seed": seed, "scale_factor": scale_factor, "generator_version": GENERATOR_VERSION, **options}
+    return hashlib.sha256(json.dumps(build, sort_keys=True).encode()).hexdigest()
+
+
+def clone_file(source, target):
+    """
+    Copies a file, as a copy-on-write reflink where the filesystem supports
+    it (Btrfs, XFS) and with the kernel's fast file copy otherwise.
+
+    Args:
+        source (Path): File to copy
+        target (Path): Path of the copy, replaced if it exists
+    """
+    try:
+        # Only available on Unix
+        import fcntl
+
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copyfile(source, target)
+
+
+def restore_snapshot(key, db_path, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Clones the snapshot stored under `key` to `db_path`. Returns False if
+    there is no such snapshot.
+
+    Args:
+        key (str): Snapshot hash from snapshot_key
+        db_path (str): Path to the SQLite database file to create
+        snapshot_dir (Path): Directory holding the snapshots
+    """
+    snapshot = Path(snapshot_dir) / f"{key}.db"
+    if not snapshot.exists():
+        return False
+    clone_file(snapshot, db_path)
+    return True
+
+
+def save_snapshot(key, db_path, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Stores a finished database as the snapshot for `key`.
+
+    Args:
+        key (str): Snapshot hash from snapshot_key
+        db_path (str): Path to the finished SQLite database file
+        snapshot_dir (Path): Directory holding the snapshots
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    # Copied under a temporary name first, so a half-written snapshot is never matched
+    partial = snapshot_dir / f"{key}.db.partial"
+    clone_file(db_path, partial)
+    os.replace(partial, snapshot_dir / f"{key}.db")
@@ -0,0 +1,176 @@
+import random
+
+# Fixed pools the direct-insertion loader samples names and text from. Sampling
+# a whole column from these takes one call, where Faker costs one call per value.
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Christopher", "Karen",
+    "Charles", "Lisa", "Daniel", "Nancy", "Matthew", "Betty", "Anthony", "Sandra", "Mark", "Margaret",
+    "Donald", "Ashley", "Steven", "Kimberly", "Andrew", "Emily", "Paul", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Carol", "Kevin", "Amanda", "Brian", "Melissa", "George", "Deborah", "Timothy", "Stephanie",
+    "Ronald", "Rebecca", "Jason", "Sharon", "Edward", "Laura", "Jeffrey", "Cynthia", "Ryan", "Dorothy",
+    "Jacob", "Amy", "Gary", "Kathleen", "Nicholas", "Angela", "Eric", "Shirley", "Jonathan", "Emma",
+    "Stephen", "Brenda", "Larry", "Pamela", "Justin", "Nicole", "Scott", "Anna", "Brandon", "Samantha",
+    "Benjamin", "Katherine", "Samuel", "Christine", "Gregory", "Debra", "Alexander", "Rachel", "Patrick", "Carolyn",
+    "Frank", "Janet", "Raymond", "Maria", "Jack", "Olivia", "Dennis", "Heather", "Jerry", "Helen",
+    "Tyler", "Catherine", "Aaron", "Diane", "Jose", "Julie", "Adam", "Victoria", "Nathan", "Joyce",
+    "Henry", "Lauren", "Zachary", "Kelly", "Douglas", "Christina", "Peter", "Ruth", "Kyle", "Joan",
+    "Noah", "Virginia", "Ethan", "Judith", "Jeremy", "Evelyn", "Christian", "Hannah", "Walter", "Andrea",
+    "Keith", "Megan", "Austin", "Cheryl", "Roger", "Jacqueline", "Terry", "Madison", "Sean", "Teresa",
+    "Gerald", "Abigail", "Carl", "Sophia", "Dylan", "Martha", "Harold", "Sara", "Jordan", "Gloria",
+]
+
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Walker", "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell", "Carter", "Roberts",
+    "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker", "Cruz", "Edwards", "Collins", "Reyes",
+    "Stewart", "Morris", "Morales", "Murphy", "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan", "Cooper",
+    "Peterson", "Bailey", "Reed", "Kelly", "Howard", "Ramos", "Kim", "Cox", "Ward", "Richardson",
+    "Watson", "Brooks", "Chavez", "Wood", "James", "Bennett", "Gray", "Mendoza", "Ruiz", "Hughes",
+    "Price", "Alvarez", "Castillo", "Sanders", "Patel", "Myers", "Long", "Ross", "Foster", "Jimenez",
+    "Powell", "Jenkins", "Perry", "Russell", "Sullivan", "Bell", "Coleman", "Butler", "Henderson", "Barnes",
+    "Gonzales", "Fisher", "Vasquez", "Simmons", "Romero", "Jordan", "Patterson", "Alexander", "Hamilton", "Graham",
+    "Reynolds", "Griffin", "Wallace", "Moreno", "West", "Cole", "Hayes", "Bryant", "Herrera", "Gibson",
+    "Ellis", "Tran", "Medina", "Aguilar", "Stevens", "Murray", "Ford", "Castro", "Marshall", "Owens",
+    "Harrison", "Fernandez", "McDonald", "Woods", "Washington", "Kennedy", "Wells", "Vargas", "Henry", "Chen",
+]
+
+WORDS = [
+    "amber", "anchor", "apple", "arrow", "atlas", "aurora", "autumn", "badge", "bamboo", "banner",
+    "beacon", "birch", "blossom", "breeze", "bridge", "canyon", "cedar", "cherry", "cinder", "cliff",
+    "cloud", "clover", "comet", "coral", "cosmos", "cotton", "crane", "crystal", "dawn", "delta",
+    "desert", "dune", "eagle", "echo", "ember", "falcon", "fern", "flame", "forest", "fox",
+    "frost", "galaxy", "garden", "glacier", "granite", "harbor", "hawk", "hazel", "horizon", "iris",
+    "island", "ivory", "jade", "jasmine", "jungle", "lagoon", "lantern", "lemon", "lily", "lotus",
+    "lunar", "maple", "marble", "meadow", "mesa", "meteor", "mint", "mist", "moon", "moss",
+    "nebula", "nova", "oak", "ocean", "olive", "onyx", "orbit", "orchid", "otter", "panda",
+    "pearl", "pebble", "pepper", "phoenix", "pine", "planet", "plum", "polar", "prairie", "quartz",
+    "rain", "raven", "reef", "ridge", "river", "robin", "rose", "ruby", "saffron", "sage",
+    "sand", "sapphire", "shadow", "sierra", "silver", "sky", "snow", "solar", "spark", "spruce",
+    "star", "stone", "storm", "summit", "sun", "swift", "thunder", "tide", "tiger", "timber",
+    "topaz", "tulip", "tundra", "valley", "velvet", "violet", "wave", "willow", "wind", "winter",
+    "wolf", "zephyr", "zen", "blaze", "cobalt", "crimson", "dusk", "flint", "gale", "glow",
+]
+
+REVIEW_OPENINGS = [
+    "Absolutely loved this one from start to finish.",
+    "The cinematography was stunning throughout.",
+    "A solid watch for a quiet evening.",
+    "The pacing dragged a little in the middle.",
+    "Great performances from the whole cast.",
+    "Not quite what I expected from the trailer.",
+    "The story kept me guessing until the very end.",
+    "Beautiful soundtrack and a moving story.",
+    "I found the plot hard to follow at times.",
+    "One of the best films I have seen this year.",
+    "The dialogue felt a bit forced in places.",
+    "A fun ride with plenty of memorable moments.",
+    "The visual effects were impressive.",
+    "It started slow but really picked up later on.",
+    "The characters were well written and believable.",
+    "Honestly a bit disappointing overall.",
+    "A heartfelt film with a strong message.",
+    "The humor landed more often than not.",
+    "Tense, gripping and very well directed.",
+    "The ending felt rushed compared to the rest.",
+]
+
+REVIEW_CLOSINGS = [
+    "Would definitely watch it again.",
+    "I would recommend it to friends.",
+    "Worth it for the lead performance alone.",
+    "Probably not one I will revisit.",
+    "Perfect for a family movie night.",
+    "Could have been twenty minutes shorter.",
+    "I am already looking forward to a sequel.",
+    "Fans of the genre will enjoy it.",
+    "It deserves more attention than it gets.",
+    "Good, but not as good as the original.",
+    "Watched it twice in the same week.",
+    "The kids enjoyed it more than I did.",
+    "A nice surprise in the catalogue.",
+    "I would give it another chance someday.",
+    "Easily one of my favorites now.",
+    "Not bad, just not memorable.",
+    "Left me thinking about it for days.",
+    "Great background watch while relaxing.",
+    "Skip it unless you love the director.",
+    "A must-see for everyone.",
+]
+
+
+class PoolText:
+    """
+    Names, words and review comments sampled in bulk from the fixed pools,
+    seeded from `random`.
+    """
+
+    def __init__(self):
+        self.random = random.Random(random.getrandbits(64))
+
+    def first_names(self, n):
+        return self.random.choices(FIRST_NAMES, k=n)
+
+    def last_names(self, n):
+        return self.random.choices(LAST_NAMES, k=n)
+
+    def words(self, n):
+        return self.random.choices(WORDS, k=n)
+
+    def user_names(self, n):
+        # Same shapes as Faker's user names, e.g. "jsmith", "mary.lee", "oak42"
+        firsts = self.first_names(n)
+        lasts = self.last_names(n)
+        words = self.words(n)
+        shapes = self.random.choices(range(4), k=n)
+        numbers = self.random.choices(range(100), k=n)
+        names = []
+        for first, last, word, shape, number in zip(firsts, lasts, words, shapes, numbers):
+            if shape == 0:
+                names.append(f"{first[0]}{last}".lower())
+            elif shape == 1:
+                names.append(f"{first}.{last}".lower())
+            elif shape == 2:
+                names.append(f"{last}{number}".lower())
+            else:
+                names.append(f"{word}{number}")
+        return names
+
+    def comments(self, n):
+        openings = self.random.choices(REVIEW_OPENINGS, k=n)
+        closings = self.random.choices(REVIEW_CLOSINGS, k=n)
+        return [f"{opening} {closing}" for opening, closing in zip(openings, closings)]
+
+
+class FakerText:
+    """
+    The same columns generated with Faker, one call per value. Slower, but
+    with Faker's full variety - the fidelity mode.
+    """
+
+    def __init__(self):
+        # Only needed in fidelity mode
+        from faker import Faker
+
+        # Seeded from `random` so Faker follows the same seed as the rest of the data
+        self.fake = Faker()
+        self.fake.seed_instance(random.getrandbits(64))
+
+    def first_names(self, n):
+        return [self.fake.first_name() for _ in range(n)]
+
+    def last_names(self, n):
+        return [self.fake.last_name() for _ in range(n)]
+
+    def words(self, n):
+        return [self.fake.word() for _ in range(n)]
+
+    def user_names(self, n):
+        return [self.fake.user_name() for _ in range(n)]
+
+    def comments(self, n):
+        return [self.fake.paragraph(nb_sentences=2) for _ in range(n)]
@@ -0,0 +1,206 @@
+import random
+import numpy as np
+from dataset_scale import device_id
+
+# Whole-column versions of the per-row random calls used by the generators.
+# Every function returns a plain Python list so the values can be written to
+# JSON, Excel or the database without numpy scalar types leaking through.
+
+
+def seeded_generator():
+    """
+    Returns a NumPy Generator seeded from `random`, so vectorised columns
+    follow the same seed as the rest of the data.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def random_dates(rng, start, days, size):
+    """
+    Returns ISO date strings drawn uniformly from `start` to `start + days`.
+
+    Args:
+        rng (Generator): NumPy random generator
+        start (str): First possible date, YYYY-MM-DD
+        days (int): Number of days after `start` the range extends to
+        size (int): Number of values
+    """
+    offsets = rng.integers(0, days, size=size, endpoint=True)
+    return (np.datetime64(start, "D") + offsets).astype(str).tolist()
+
+
+def random_floats(rng, low, high, size):
+    """
+    Returns floats drawn uniformly from [low, high), rounded to 2 decimals.
+
+    Args:
+        rng (Generator): NumPy random generator
+        low (float): Lower bound
+        high (float): Upper bound
+        size (int): Number of values
+    """
+    return np.round(rng.uniform(low, high, size=size), 2).tolist()
+
+
+def random_ints(rng, low, high, size):
+    """
+    Returns integers drawn uniformly from low to high inclusive.
+
+    Args:
+        rng (Generator): NumPy random generator
+        low (int): Smallest value
+        high (int): Largest value
+        size (int): Number of values
+    """
+    return rng.integers(low, high, size=size, endpoint=True).tolist()
+
+
+def random_choices(rng, options, size):
+    """
+    Returns values picked uniformly from `options`.
+
+    Args:
+        rng (Generator): NumPy random generator
+        options (list): Values to pick from
+        size (int): Number of values
+    """
+    return [options[i] for i in rng.integers(0, len(options), size=size).tolist()]
+
+
+def random_foreign_ids(rng, ids, size):
+    """
+    Returns random IDs from a loader's block, used for foreign keys.
+
+    Args:
+        rng (Generator): NumPy random generator
+        ids (DatasetSlice): Slice whose loader block the IDs come from
+        size (int): Number of values
+    """
+    return random_ints(rng, ids.loader_base_id, ids.loader_base_id + ids.loader_count - 1, size)
+
+
+def device_columns(rng, ids, max_devices):
+    """
+    Assigns each customer of a slice between 1 and `max_devices` devices.
+    Returns the customerID, per-customer device index and deviceID columns.
+
+    Args:
+        rng (Generator): NumPy random generator
+        ids (DatasetSlice): Slice whose customers own the devices
+        max_devices (int): Largest number of devices per customer
+    """
+    customers = np.arange(ids.base_id, ids.base_id + ids.count)
+    counts = rng.integers(1, max_devices, size=ids.count, endpoint=True)
+
+    customer_ids = np.repeat(customers, counts)
+    # Position of each device within its customer's run of devices
+    indexes = np.arange(len(customer_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return customer_ids.tolist(), indexes.tolist(), device_id(customer_ids, indexes).tolist()
+
+
+def unique_pairs(rng, ids, size):
+    """
+    Returns unique (profileID, movieID) columns for MarksAsFavorite, sampling
+    without replacement from every combination of this shard's profiles and
+    the loader's favorites.
+
+    Args:
+        rng (Generator): NumPy random generator
+        ids (DatasetSlice): Slice the pairs belong to
+        size (int): Number of pairs
+    """
+    size = min(size, ids.count * ids.loader_count)
+    flat = rng.choice(ids.count * ids.loader_count, size=size, replace=False)
+    profile_ids = ids.base_id + flat // ids.loader_count
+    movie_ids = ids.loader_base_id + flat % ids.loader_count
+    return profile_ids.tolist(), movie_ids.tolist()
+
+
+def loader_columns(ids, names, skew=None):
+    """
+    Builds every column of every table for one loader's slice at once with a
+    seeded NumPy Generator. The loaders differ only in their generated text,
+    given by `names`. Returns the columns of each table, keyed by table and
+    column name.
+
+    Args:
+        ids (DatasetSlice): IDs to generate
+        names (dict): Format string of each text column, keyed by column
+            name - firstName, lastName, profileName, profilePicture and
+            comment - filled in with each row's number within the loader
+        skew (Skewed): Skewed distributions to draw from, uniform if None
+    """
+    # distributions imports this module, so it can't be imported at the top
+    from distributions import Uniform
+
+    rng = seeded_generator()
+    dist = skew or Uniform()
+    n = ids.count
+    numbers = range(ids.base_id - ids.loader_base_id, ids.base_id - ids.loader_base_id + n)
+
+    def text(column):
+        return [names[column].format(i) for i in numbers]
+
+    device_customers, device_indexes, device_ids = device_columns(rng, ids, 3)
+    pair_profiles, pair_movies = unique_pairs(rng, ids, n)
+
+    return {
+        "Customer": {
+            "firstName": text("firstName"),
+            "lastName": text("lastName"),
+            "customerID": list(ids.ids),
+            "dateOfBirth": random_dates(rng, "1970-01-01", 18250, n),
+            "customerSince": random_dates(rng, "2015-01-01", 3000, n),
+        },
+        "Devices": {
+            "deviceName": [
+                f"{name}_{j}" for name, j in zip(
+                    random_choices(rng, ["Mobile", "Laptop", "TV", "Tablet", "Game Console"], len(device_ids)),
+                    device_indexes
+                )
+            ],
+            "deviceID": device_ids,
+            "lastSeen": dist.dates(rng, "2023-01-01", 365, len(device_ids)),
+            "deviceType": random_choices(rng, ["iOS", "Android", "Windows", "macOS", "SmartTV"], len(device_ids)),
+            "customerID": device_customers,
+        },
+        "WatchHistory": {
+            "movieID": dist.movies(rng, ids.movie_low, ids.movie_high, n),
+            "watchDate": dist.dates(rng, "2023-01-01", 365, n),
+            "durationWatched": random_floats(rng, 10, 180, n),
+            "WatchHistoryID": list(ids.ids),
+        },
+        "Favorites": {
+            "movieID": list(ids.ids),
+            "lastSeen": dist.dates(rng, "2023-01-01", 365, n),
+            "totalTimeWatched": random_floats(rng, 60, 600, n),
+        },
+        "Payment": {
+            "paymentID": list(ids.ids),
+            "paymentDate": dist.dates(rng, "2023-01-01", 365, n),
+            "amount": random_floats(rng, 5, 50, n),
+            "currency": random_choices(rng, ["USD", "EUR", "GBP", "CAD"], n),
+            "paymentMethod": random_choices(rng, ["Credit Card", "PayPal", "Bank Transfer", "Apple Pay", "Google Pay"], n),
+            "status": random_choices(rng, ["Completed", "Pending", "Failed"], n),
+            "customerID": dist.foreign_ids(rng, ids, n),
+        },
+        "Profile": {
+            "profileName": text("profileName"),
+            "profilePicture": text("profilePicture"),
+            "isOnline": random_choices(rng, [True, False], n),
+            "profileID": list(ids.ids),
+            "WatchHistoryID": list(ids.ids),  # Assuming 1:1 relationship with watch history
+            "customerID": dist.foreign_ids(rng, ids, n),
+        },
+        "Reviews": {
+            "rating": random_ints(rng, 1, 5, n),
+            "movieID": list(ids.ids),
+            "comment": text("comment"),
+            "reviewDate": dist.dates(rng, "2023-01-01", 365, n),
+            "profileID": dist.foreign_ids(rng, ids, n),
+        },
+        "MarksAsFavorite": {
+            "profileID": pair_profiles,
+            "movieID": pair_movies,
+        },
+    }
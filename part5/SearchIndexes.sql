@@ -0,0 +1,29 @@
+-- קובץ אינדקסים לחיפוש לקוחות ופרופילים לפי שם בממשק הגרפי
+-- =========================================================
+
+-- ================================================
+-- חיפוש לפי תחילת השם
+-- ================================================
+
+-- שם מלא של לקוח באותיות קטנות בסדר בתים (COLLATE "C"),
+-- כך ש-LIKE 'abc%' נסרק כטווח באינדקס
+CREATE INDEX IF NOT EXISTS idx_customer_name_prefix
+ON Customer ((lower(firstName || ' ' || lastName)) COLLATE "C");
+
+-- שם פרופיל באותיות קטנות בסדר בתים
+CREATE INDEX IF NOT EXISTS idx_profile_name_prefix
+ON Profile ((lower(profileName)) COLLATE "C");
+
+-- ================================================
+-- חיפוש שמות דומים (טריגרמות)
+-- ================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- אינדקס טריגרמות על השם המלא של לקוח (מאפשר מיון לפי מרחק דמיון)
+CREATE INDEX IF NOT EXISTS idx_customer_name_trgm
+ON Customer USING gist ((firstName || ' ' || lastName) gist_trgm_ops);
+
+-- אינדקס טריגרמות על שם פרופיל
+CREATE INDEX IF NOT EXISTS idx_profile_name_trgm
+ON Profile USING gist (profileName gist_trgm_ops);
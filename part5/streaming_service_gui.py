@@ -1,20 +1,1108 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 import psycopg2
-from psycopg2.extras import DictCursor
+from psycopg2.extensions import QueryCanceledError
+from psycopg2.extras import DictCursor, execute_values
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, date
+import csv
+import itertools
+import os
+import queue
 import random
+import threading
+import time
+import weakref
+
+# Statements of the CRUD screens and dialogs, prepared on the server and run by name
+CRUD_STATEMENTS = {
+    "add_customer": """
+        INSERT INTO Customer (customerID, firstName, lastName, dateOfBirth, customerSince)
+        VALUES ($1, $2, $3, $4, $5)
+    """,
+    "edit_customer": """
+        UPDATE Customer 
+        SET firstName = $1, lastName = $2, dateOfBirth = $3, customerSince = $4
+        WHERE customerID = $5
+    """,
+    "delete_customer": "DELETE FROM Customer WHERE customerID = $1",
+    "add_profile": """
+        INSERT INTO Profile (profileID, profileName, profilePicture, isOnline, WatchHistoryID, customerID)
+        VALUES ($1, $2, $3, $4, $5, $6)
+    """,
+    "edit_profile": """
+        UPDATE Profile 
+        SET profileName = $1, profilePicture = $2, isOnline = $3, WatchHistoryID = $4, customerID = $5
+        WHERE profileID = $6
+    """,
+    "delete_profile": "DELETE FROM Profile WHERE profileID = $1",
+    "add_favorite": """
+        INSERT INTO MarksAsFavorite (profileID, movieID)
+        VALUES ($1, $2)
+    """,
+    "delete_favorite": """
+        DELETE FROM MarksAsFavorite 
+        WHERE profileID = $1 AND movieID = $2
+    """,
+    "favorite_exists": """
+        SELECT COUNT(*) FROM MarksAsFavorite 
+        WHERE profileID = $1 AND movieID = $2
+    """,
+}
+
+# Tables the management screens bulk import into and delete from: their CSV columns and primary key
+BULK_TABLES = {
+    "Customer": (("customerID", "firstName", "lastName", "dateOfBirth", "customerSince"), ("customerID",)),
+    "Profile": (("profileID", "profileName", "profilePicture", "isOnline", "WatchHistoryID", "customerID"),
+                ("profileID",)),
+    "MarksAsFavorite": (("profileID", "movieID"), ("profileID", "movieID")),
+}
+
+# Name searches of the search boxes: table, ID column and the name expression, as indexed in SearchIndexes.sql
+NAME_SEARCHES = {
+    "customers": ("Customer", "customerID", "firstName || ' ' || lastName"),
+    "profiles": ("Profile", "profileID", "profileName"),
+}
+
+# Foreign keys of the database, table -> the tables it references, from code/sql/createtable.sql,
+# part3/Integrate.sql and part4/AlterTable.sql
+FOREIGN_KEYS = {
+    "Devices": ("Customer",),
+    "WatchHistory": ("Title", "Devices"),
+    "Favorites": ("Title",),
+    "Payment": ("Customer",),
+    "Profile": ("WatchHistory", "Customer"),
+    "Reviews": ("Profile", "Title"),
+    "MarksAsFavorite": ("Profile", "Favorites", "Title"),
+    "RecommendationCache": ("Profile", "Title"),
+}
+
+
+def referencing_tables(table):
+    """
+    The table and every table referencing it, directly or through others - the tables a delete
+    from it can change by cascading, or that decide whether it is allowed
+    """
+    tables = {table}
+    pending = [table]
+    while pending:
+        parent = pending.pop()
+        for child, parents in FOREIGN_KEYS.items():
+            if parent in parents and child not in tables:
+                tables.add(child)
+                pending.append(child)
+    return tuple(sorted(tables))
+
+
+class StatementRegistry:
+    """Named statements prepared once per connection and run with EXECUTE, with execution counts and timings"""
+    
+    def __init__(self, statements):
+        self.statements = dict(statements)
+        self.prepared = weakref.WeakKeyDictionary()     # connection -> names prepared on it
+        self.stats = {name: [0, 0.0, 0.0] for name in self.statements}     # name -> [executions, total, slowest]
+        self.prepares = 0
+        self.lock = threading.Lock()
+    
+    def execute(self, cursor, name, params=()):
+        """Run a registered statement on the cursor, preparing it on the cursor's connection first if needed"""
+        connection = cursor.connection
+        with self.lock:
+            prepared = self.prepared.setdefault(connection, set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {self.statements[name]}")
+            prepared.add(name)
+            with self.lock:
+                self.prepares += 1
+        
+        arguments = f" ({', '.join(['%s'] * len(params))})" if params else ""
+        start = time.perf_counter()
+        cursor.execute(f"EXECUTE {name}{arguments}", tuple(params))
+        seconds = time.perf_counter() - start
+        
+        with self.lock:
+            stats = self.stats[name]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+    
+    def report(self):
+        """Execution statistics as text, one line per statement that ran"""
+        with self.lock:
+            lines = [f"{'Statement':<18}{'Runs':>8}{'Avg ms':>10}{'Max ms':>10}"]
+            for name, (runs, total, slowest) in sorted(self.stats.items()):
+                if runs:
+                    lines.append(f"{name:<18}{runs:>8}{total / runs * 1000:>10.2f}{slowest * 1000:>10.2f}")
+            lines.append(f"Prepared {self.prepares} times on {len(self.prepared)} open connections")
+        return "\n".join(lines)
+
+
+class ConnectionPool:
+    """Thread-safe pool of PostgreSQL connections with health checks and automatic reconnect"""
+    
+    # Connections idle for longer than this are checked with a query before reuse, in seconds
+    HEALTH_CHECK_AFTER = 30
+    # How long a checkout waits for a free connection, in seconds
+    CHECKOUT_TIMEOUT = 30
+    
+    def __init__(self, minconn, maxconn, **connect_args):
+        self.maxconn = maxconn
+        self.connect_args = connect_args
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.closed = False
+        
+        for _ in range(minconn):
+            self.opened += 1
+            self.idle.put((self.open(), time.monotonic()))
+    
+    def open(self):
+        """Open a new connection in a slot already counted in opened; the slot is given back if it fails"""
+        try:
+            return psycopg2.connect(**self.connect_args)
+        except Exception:
+            with self.lock:
+                self.opened -= 1
+            raise
+    
+    def discard(self, connection):
+        """Close a broken connection and free its place in the pool"""
+        with self.lock:
+            self.opened -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    def getconn(self):
+        """Check out a healthy connection, opening or reconnecting one if needed"""
+        while True:
+            if self.closed:
+                raise psycopg2.InterfaceError("connection pool is closed")
+            try:
+                connection, returned = self.idle.get_nowait()
+            except queue.Empty:
+                # The slot is taken under the lock so two checkouts can't both see room for one
+                with self.lock:
+                    can_open = self.opened < self.maxconn
+                    if can_open:
+                        self.opened += 1
+                if can_open:
+                    return self.open()
+                try:
+                    connection, returned = self.idle.get(timeout=self.CHECKOUT_TIMEOUT)
+                except queue.Empty:
+                    raise psycopg2.OperationalError("no database connection became free in time")
+            
+            if self.healthy(connection, returned):
+                return connection
+            # Dropped by the server or the network - replace it
+            self.discard(connection)
+    
+    def healthy(self, connection, returned):
+        """Check a connection before handing it out"""
+        if connection.closed:
+            return False
+        if time.monotonic() - returned < self.HEALTH_CHECK_AFTER:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+    
+    def putconn(self, connection):
+        """Return a connection, rolling back anything left open"""
+        if connection.closed or self.closed:
+            self.discard(connection)
+            return
+        try:
+            if connection.status != psycopg2.extensions.STATUS_READY:
+                connection.rollback()
+        except Exception:
+            self.discard(connection)
+            return
+        self.idle.put((connection, time.monotonic()))
+    
+    @contextmanager
+    def connection(self):
+        """Check out a connection for one operation; commits on success and rolls back on error"""
+        connection = self.getconn()
+        try:
+            yield connection
+            connection.commit()
+        except Exception:
+            if not connection.closed:
+                try:
+                    connection.rollback()
+                except Exception:
+                    pass
+            raise
+        finally:
+            self.putconn(connection)
+    
+    @contextmanager
+    def cursor(self):
+        """A cursor of its own, on a pooled connection, for one operation"""
+        with self.connection() as connection:
+            with connection.cursor(cursor_factory=DictCursor) as cursor:
+                yield cursor
+    
+    def closeall(self):
+        """Close the idle connections; connections in use are closed when returned"""
+        self.closed = True
+        while True:
+            try:
+                connection, returned = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(connection)
+
+
+class QueryExecutor:
+    """Runs database calls on worker threads and posts the results back to the Tk main loop"""
+    
+    # How often the main loop checks for finished jobs, in milliseconds
+    POLL_INTERVAL = 50
+    
+    def __init__(self, root, pool, workers=3):
+        self.root = root
+        self.pool = pool
+        self.jobs = queue.Queue()
+        self.finished = queue.Queue()
+        self.pending = 0
+        self.shown = 0          # pending jobs shown in the busy bar
+        self.running = {}       # worker thread -> (description, connection) of its job
+        self.running_lock = threading.Lock()
+        self.visible_job = None # the running job the busy bar names, which Cancel stops
+        self.status_frame = None
+        self.stopped = False
+        
+        self.workers = [threading.Thread(target=self.work, daemon=True) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+        self.root.after(self.POLL_INTERVAL, self.poll)
+    
+    def submit(self, work, on_done=None, error_message="Query failed", description="Running query...",
+               on_error=None):
+        """
+        Queue a database call. work(cursor) runs on a worker thread with its own
+        cursor on a pooled connection and is committed when it returns; on_done(result) then runs on the
+        main loop. Failed calls are rolled back, reported with error_message and
+        passed to on_error(error). Calls without a description, such as typeahead
+        lookups, run without the busy bar.
+        """
+        self.pending += 1
+        self.jobs.put((work, on_done, error_message, description, on_error))
+        if description:
+            self.shown += 1
+            self.show_progress(self.running_description() or description)
+    
+    def running_description(self):
+        """Description of a job that is running now, if any, which becomes the job Cancel stops"""
+        running = [job for job in list(self.running.values()) if job[0]]
+        self.visible_job = running[0] if running else None
+        return self.visible_job[0] if self.visible_job else None
+    
+    def cancel(self):
+        """Cancel the statement of the job shown in the busy bar; background lookups keep running"""
+        with self.running_lock:
+            # Only while it still runs, as its connection may already serve another job
+            if any(job is self.visible_job for job in self.running.values()):
+                self.visible_job[1].cancel()
+    
+    def shutdown(self):
+        """Stop the worker threads, dropping queued jobs and the results of running ones, so the pool can close"""
+        self.stopped = True
+        while True:
+            try:
+                self.jobs.get_nowait()
+            except queue.Empty:
+                break
+        with self.running_lock:
+            for description, connection in self.running.values():
+                connection.cancel()
+        for worker in self.workers:
+            self.jobs.put(None)
+    
+    def work(self):
+        """Worker thread: run jobs until shutdown"""
+        worker = threading.current_thread()
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            work, on_done, error_message, description, on_error = job
+            try:
+                with self.pool.connection() as connection:
+                    self.running[worker] = (description, connection)
+                    try:
+                        with connection.cursor(cursor_factory=DictCursor) as cursor:
+                            result = work(cursor)
+                    finally:
+                        # Before the connection goes back to the pool, where Cancel must not reach it
+                        with self.running_lock:
+                            del self.running[worker]
+                outcome = (on_done, result, None, error_message, description, on_error)
+            except Exception as e:
+                outcome = (on_done, None, e, error_message, description, on_error)
+            # Nobody is waiting for results after shutdown, and failures there are expected
+            if not self.stopped:
+                self.finished.put(outcome)
+    
+    def poll(self):
+        """Main loop: hand finished jobs to their callbacks"""
+        while not self.stopped:
+            try:
+                on_done, result, error, error_message, description, on_error = self.finished.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if description:
+                self.shown -= 1
+            try:
+                if isinstance(error, QueryCanceledError):
+                    messagebox.showinfo("Cancelled", "The query was cancelled.")
+                elif error is not None:
+                    messagebox.showerror("Database Error", f"{error_message}:\n\n{str(error)}")
+                if error is not None and on_error:
+                    on_error(error)
+                elif error is None and on_done:
+                    on_done(result)
+            except tk.TclError:
+                # The screen that asked for the result was closed in the meantime
+                pass
+        
+        if self.shown and not self.stopped:
+            self.show_progress(self.running_description() or "Running query...")
+        else:
+            self.hide_progress()
+        if not self.stopped:
+            self.root.after(self.POLL_INTERVAL, self.poll)
+    
+    def show_progress(self, description):
+        """Show the busy bar with a Cancel button at the bottom of the window"""
+        if self.status_frame is None or not self.status_frame.winfo_exists():
+            self.status_frame = tk.Frame(self.root, bg='#34495e', padx=10, pady=5)
+            self.status_label = tk.Label(self.status_frame, font=('Arial', 10), fg='white', bg='#34495e')
+            self.status_label.pack(side='left')
+            tk.Button(self.status_frame, text="✖ Cancel", command=self.cancel,
+                     bg='#e74c3c', fg='white', font=('Arial', 9, 'bold')).pack(side='right')
+            progress = ttk.Progressbar(self.status_frame, mode='indeterminate', length=200)
+            progress.pack(side='right', padx=10)
+            progress.start(10)
+        if not self.status_frame.winfo_ismapped():
+            self.status_frame.pack(side='bottom', fill='x')
+        queued = f" ({self.shown - 1} queued)" if self.shown > 1 else ""
+        self.status_label.config(text=f"⏳ {description}{queued}")
+        self.root.config(cursor="watch")
+    
+    def hide_progress(self):
+        """Remove the busy bar once every job is done"""
+        if self.status_frame is None:
+            return
+        if self.status_frame.winfo_exists():
+            self.status_frame.destroy()
+        self.status_frame = None
+        self.root.config(cursor="")
+
+
+class ReportCache:
+    """Report results kept for a while, evicted least recently used first and dropped when a table they read changes"""
+    
+    def __init__(self, ttl=300, max_entries=32, max_rows=100000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.entries = OrderedDict()    # key -> (time stored, tables read, rows)
+        self.changed = {}               # table -> version of its last invalidation
+        self.version = 0
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        """Cached rows and their age in seconds, or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            stored, tables, rows = entry
+            age = time.monotonic() - stored
+            if age > self.ttl:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return rows, age
+    
+    def start(self):
+        """Version to pass to put() for a report that starts running now"""
+        with self.lock:
+            return self.version
+    
+    def put(self, key, tables, rows, since):
+        """Store a report's rows unless one of its tables changed after it started running"""
+        if len(rows) > self.max_rows:
+            return
+        with self.lock:
+            if any(self.changed.get(table, -1) >= since for table in tables):
+                return
+            self.entries[key] = (time.monotonic(), frozenset(tables), rows)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def invalidate(self, *tables):
+        """Drop the reports that read any of the tables"""
+        with self.lock:
+            for table in tables:
+                self.changed[table] = self.version
+            self.version += 1
+            for key in [key for key, (stored, read, rows) in self.entries.items() if read & set(tables)]:
+                del self.entries[key]
+
+
+class RowStream:
+    """Bounded hand-off of row chunks from a worker thread to the Tk main loop"""
+    
+    # Chunks waiting for the main loop before the worker stops fetching
+    MAX_CHUNKS = 4
+    
+    def __init__(self, note=""):
+        self.chunks = queue.Queue(maxsize=self.MAX_CHUNKS)
+        self.closed = False
+        self.note = note
+    
+    @classmethod
+    def of(cls, rows, chunk_size, note=""):
+        """A finished stream over rows already in memory"""
+        stream = cls(note)
+        stream.chunks = queue.Queue()
+        for start in range(0, len(rows), chunk_size):
+            stream.chunks.put(rows[start:start + chunk_size])
+        stream.chunks.put(None)
+        return stream
+    
+    def put(self, rows):
+        """Worker thread: queue a chunk, waiting while the reader is behind; False once it stopped reading"""
+        while not self.closed:
+            try:
+                self.chunks.put(rows, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def finish(self):
+        """Worker thread: mark the end of the rows"""
+        self.put(None)
+    
+    def get(self):
+        """Main loop: the next chunk, None at the end; raises queue.Empty if none is ready"""
+        return self.chunks.get_nowait()
+    
+    def close(self):
+        """Stop the stream, e.g. when another report replaces it"""
+        self.closed = True
+
+
+class ProgressReader:
+    """CSV file handed to COPY FROM STDIN that keeps track of how much of it has been read"""
+    
+    def __init__(self, path):
+        self.size = os.path.getsize(path)
+        self.file = open(path, newline='', encoding='utf-8-sig')
+        self.position = 0
+    
+    def read(self, size=-1):
+        """Worker thread: the next block of the file"""
+        data = self.file.read(size)
+        self.position = self.file.buffer.tell()
+        return data
+    
+    def fraction(self):
+        """Share of the file read so far, from 0 to 1"""
+        return min(self.position / self.size, 1.0) if self.size else 1.0
+    
+    def close(self):
+        self.file.close()
+
+
+class ProgressWindow:
+    """Small window with a progress bar that follows a long-running background job"""
+    
+    # How often the bar is updated, in milliseconds
+    UPDATE_INTERVAL = 100
+    
+    def __init__(self, parent, text, fraction):
+        """fraction() returns how much of the job is done, from 0 to 1"""
+        self.fraction = fraction
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("Progress")
+        self.window.geometry("420x120")
+        self.window.configure(bg='#ecf0f1')
+        self.window.resizable(False, False)
+        self.window.transient(parent)
+        
+        tk.Label(self.window, text=text, font=('Arial', 11), bg='#ecf0f1').pack(pady=(15, 10))
+        self.bar = ttk.Progressbar(self.window, mode='determinate', length=360, maximum=100)
+        self.bar.pack()
+        self.percent = tk.Label(self.window, text="0%", font=('Arial', 10), bg='#ecf0f1', fg='#7f8c8d')
+        self.percent.pack(pady=5)
+        
+        self.update()
+    
+    def update(self):
+        """Move the bar to the job's progress and check again later"""
+        if not self.window.winfo_exists():
+            return
+        done = self.fraction()
+        self.bar['value'] = done * 100
+        self.percent.config(text=f"{done:.0%}")
+        self.window.after(self.UPDATE_INTERVAL, self.update)
+    
+    def close(self):
+        if self.window.winfo_exists():
+            self.window.destroy()
+
+
+class NameSearch:
+    """Indexed lookup of rows by name: prefix matches first, then similar names when pg_trgm is installed"""
+    
+    def __init__(self, table, key, name, fuzzy=False):
+        """name is the SQL expression searched, e.g. "firstName || ' ' || lastName" """
+        self.table = table
+        self.key = key
+        self.name = name
+        self.fuzzy = fuzzy
+    
+    def find(self, cursor, text, limit):
+        """Worker thread: up to limit (ID, name) pairs matching text, best first"""
+        # Lower-cased names in byte order, so the prefix is a range scan of the index
+        pattern = text.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        cursor.execute(f"""
+            SELECT {self.key}, {self.name}
+            FROM {self.table}
+            WHERE lower({self.name}) COLLATE "C" LIKE %s
+            ORDER BY lower({self.name}) COLLATE "C", {self.key}
+            LIMIT %s
+        """, (pattern, limit))
+        matches = [tuple(row) for row in cursor.fetchall()]
+        
+        if self.fuzzy and len(matches) < limit:
+            # Names with a word like the text anywhere in them, nearest first from the trigram index
+            cursor.execute(f"""
+                SELECT {self.key}, {self.name}
+                FROM {self.table}
+                WHERE %s <%% ({self.name}) AND {self.key} <> ALL(%s)
+                ORDER BY %s <<-> ({self.name}), {self.key}
+                LIMIT %s
+            """, (text, [key for key, name in matches], text, limit - len(matches)))
+            matches += [tuple(row) for row in cursor.fetchall()]
+        return matches
+
+
+class LookupCache:
+    """Small LRU cache shared by the typeahead boxes: matches of recent lookups and the entries picked last"""
+    
+    def __init__(self, ttl=60, max_lookups=100, max_picked=10):
+        self.ttl = ttl
+        self.max_lookups = max_lookups
+        self.max_picked = max_picked
+        self.lookups = OrderedDict()    # (table, lower-cased text) -> (time stored, matches), least recently used first
+        self.picked = {}                # table -> OrderedDict of ID -> name, most recently picked last
+        self.changed = {}               # table -> version of its last invalidation
+        self.version = 0
+    
+    def get(self, table, text):
+        """Matches of an earlier lookup, or None"""
+        key = (table, text.lower())
+        entry = self.lookups.get(key)
+        if entry is None:
+            return None
+        stored, matches = entry
+        if time.monotonic() - stored > self.ttl:
+            del self.lookups[key]
+            return None
+        self.lookups.move_to_end(key)
+        return matches
+    
+    def start(self):
+        """Version to pass to put() for a lookup that starts running now"""
+        return self.version
+    
+    def put(self, table, text, matches, since):
+        """Keep the matches of a lookup unless its table changed after it started running"""
+        if self.changed.get(table, -1) >= since:
+            return
+        key = (table, text.lower())
+        self.lookups[key] = (time.monotonic(), matches)
+        self.lookups.move_to_end(key)
+        while len(self.lookups) > self.max_lookups:
+            self.lookups.popitem(last=False)
+    
+    def remember(self, table, key, name):
+        """Record an entry the user picked"""
+        picked = self.picked.setdefault(table, OrderedDict())
+        picked[key] = name
+        picked.move_to_end(key)
+        while len(picked) > self.max_picked:
+            picked.popitem(last=False)
+    
+    def recent(self, table):
+        """(ID, name) pairs picked last, most recent first"""
+        return list(reversed(self.picked.get(table, {}).items()))
+    
+    def invalidate(self, *tables):
+        """Forget the lookups and picked entries of tables that changed"""
+        for table in tables:
+            self.changed[table] = self.version
+        self.version += 1
+        for key in [key for key in self.lookups if key[0] in tables]:
+            del self.lookups[key]
+        for table in tables:
+            self.picked.pop(table, None)
+
+
+class Typeahead:
+    """Entry or combobox that looks names up in the background as the user types and lists the matches in a drop-down"""
+    
+    # Milliseconds without typing before a lookup runs, the shortest text looked up, and matches listed
+    DEBOUNCE = 250
+    MIN_LENGTH = 2
+    LIMIT = 10
+    
+    def __init__(self, parent, executor, search, on_pick=None, cache=None, combobox=False, **options):
+        """
+        search is a NameSearch; on_pick(ID, name) runs when the user picks a match. Lookups
+        are answered from the LookupCache cache where possible, and a combobox's own
+        drop-down lists the entries picked last. options are passed on to the widget.
+        """
+        self.executor = executor
+        self.search = search
+        self.on_pick = on_pick
+        self.cache = cache
+        self.selected = None    # (ID, name) of the picked entry
+        self.text = ""          # text the listed matches were found for
+        self.matches = []
+        self.recent = []
+        self.lookup_id = None   # after() ID of the next lookup
+        self.popup = None
+        
+        if combobox:
+            self.entry = ttk.Combobox(parent, postcommand=self.list_recent, **options)
+            self.entry.bind('<<ComboboxSelected>>', lambda e: self.pick_recent())
+        else:
+            self.entry = tk.Entry(parent, **options)
+        self.entry.bind('<KeyRelease>', self.on_key)
+        self.entry.bind('<Down>', lambda e: self.focus_matches())
+        self.entry.bind('<Return>', lambda e: self.on_return())
+        self.entry.bind('<Escape>', lambda e: self.on_escape())
+        self.entry.bind('<FocusOut>', lambda e: self.entry.after(200, self.hide_unless_focused))
+    
+    def label(self, key, name):
+        """Text an entry is shown as"""
+        return f"{key} - {name}"
+    
+    def on_key(self, event):
+        """Look the text up once the user stops typing"""
+        if event.keysym in ('Down', 'Up', 'Return', 'Escape', 'Tab'):
+            return
+        if self.selected and self.entry.get() == self.label(*self.selected):
+            return
+        self.selected = None
+        if self.lookup_id:
+            self.entry.after_cancel(self.lookup_id)
+        self.lookup_id = self.entry.after(self.DEBOUNCE, self.lookup)
+    
+    def lookup(self):
+        """Search for the text, from the cache or in the background"""
+        self.lookup_id = None
+        text = self.entry.get().strip()
+        if len(text) < self.MIN_LENGTH:
+            self.hide()
+            return
+        cached = self.cache.get(self.search.table, text) if self.cache else None
+        if cached is not None:
+            self.show_matches(text, cached)
+            return
+        since = self.cache.start() if self.cache else None
+        
+        def done(matches):
+            if self.cache:
+                self.cache.put(self.search.table, text, matches, since)
+            # Matches for text the user has typed over since are dropped
+            if text == self.entry.get().strip():
+                self.show_matches(text, matches)
+        
+        self.executor.submit(lambda cursor: self.search.find(cursor, text, self.LIMIT), done,
+                             error_message="Search failed", description=None)
+    
+    def show_matches(self, text, matches):
+        """List the matches under the entry"""
+        self.text = text
+        self.matches = matches
+        if self.popup is None:
+            self.popup = tk.Toplevel(self.entry)
+            self.popup.overrideredirect(True)
+            self.listbox = tk.Listbox(self.popup, font=('Arial', 10), activestyle='none')
+            self.listbox.pack(fill='both', expand=True)
+            self.listbox.bind('<ButtonRelease-1>', lambda e: self.pick(self.listbox.nearest(e.y)))
+            self.listbox.bind('<Return>', lambda e: self.pick(self.listbox.index('active')))
+            self.listbox.bind('<Escape>', lambda e: (self.hide(), self.entry.focus_set()))
+            self.listbox.bind('<FocusOut>', lambda e: self.entry.after(200, self.hide_unless_focused))
+        
+        labels = [self.label(key, name) for key, name in matches] or ["No matches"]
+        self.listbox.delete(0, 'end')
+        self.listbox.insert('end', *labels)
+        self.listbox.config(height=len(labels), width=max(int(self.entry.cget('width')), *map(len, labels)))
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"+{x}+{y}")
+        self.popup.lift()
+    
+    def list_recent(self):
+        """Combobox drop-down: fill it with the entries picked last"""
+        self.recent = self.cache.recent(self.search.table) if self.cache else []
+        self.entry['values'] = [self.label(key, name) for key, name in self.recent]
+    
+    def pick_recent(self):
+        """Pick the entry chosen from the combobox drop-down"""
+        index = self.entry.current()
+        if 0 <= index < len(self.recent):
+            self.choose(*self.recent[index])
+    
+    def focus_matches(self):
+        """Move the keyboard into the list of matches"""
+        if self.popup is not None and self.matches:
+            self.listbox.focus_set()
+            self.listbox.selection_set(0)
+            self.listbox.activate(0)
+            return "break"
+    
+    def on_return(self):
+        """Pick the best match while the list is open, rather than e.g. submitting the form"""
+        if self.popup is not None:
+            self.pick(0)
+            return "break"
+    
+    def on_escape(self):
+        """Close the list while it is open, rather than e.g. closing the form"""
+        if self.popup is not None:
+            self.hide()
+            return "break"
+    
+    def pick(self, index):
+        """Pick the match at index, if the list is up to date"""
+        if index >= len(self.matches) or self.text != self.entry.get().strip():
+            return
+        self.choose(*self.matches[index])
+    
+    def choose(self, key, name):
+        """Make an entry the picked one and remember it"""
+        self.hide()
+        self.select(key, name)
+        if self.cache:
+            self.cache.remember(self.search.table, key, name)
+        self.entry.focus_set()
+        if self.on_pick:
+            self.on_pick(key, name)
+    
+    def select(self, key, name):
+        """Show an entry as picked, e.g. the current value of a form"""
+        self.entry.delete(0, 'end')
+        self.entry.insert(0, self.label(key, name))
+        self.selected = (key, name)
+    
+    def hide(self):
+        """Close the list of matches"""
+        if self.popup is not None:
+            self.popup.destroy()
+            self.popup = None
+    
+    def hide_unless_focused(self):
+        """Close the list once neither the entry nor the list has the focus"""
+        try:
+            if self.popup is not None and self.entry.focus_get() not in (self.entry, self.listbox):
+                self.hide()
+        except (tk.TclError, KeyError):
+            # The entry was destroyed, or the focus is in a widget Tk can't name
+            pass
+
+
+class PagedTable:
+    """Treeview that keeps only a window of rows, loaded page by page with keyset pagination as the user scrolls"""
+    
+    # Rows fetched per query, and how many pages the tree keeps at most
+    PAGE_SIZE = 100
+    MAX_PAGES = 3
+    # Scrolling within this fraction of either end of the loaded rows fetches the next page
+    PREFETCH = 0.2
+    
+    def __init__(self, tree, scrollbar, executor, headings, select, source, key,
+                 name="rows", format_row=None, on_status=None):
+        """
+        select holds one SQL expression per tree column and doubles as the sort
+        key of that column; key is the unique ID expression that breaks ties,
+        e.g. "c.customerID". source is the FROM clause of the query.
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.executor = executor
+        self.headings = headings
+        self.select = select
+        self.source = source
+        self.key = key
+        self.name = name
+        self.format_row = format_row
+        self.on_status = on_status
+        
+        self.sort_index = select.index(key)
+        self.descending = False
+        self.keys = {}          # tree item -> (sort value, ID) of its row
+        self.at_start = True    # no rows before the first loaded one
+        self.at_end = True      # no rows after the last loaded one
+        self.loading = False
+        self.generation = 0     # bumped whenever a load replaces the rows, so older loads are dropped
+        
+        for i, heading in enumerate(headings):
+            self.tree.heading(f'#{i+1}', text=heading, command=lambda i=i: self.sort_by(i))
+        self.tree.config(yscrollcommand=self.on_scroll)
+        self.update_headings()
+    
+    def page_query(self, start=None, backwards=False, inclusive=False):
+        """SQL and parameters of the page after start (before it if backwards), in the current sort order"""
+        sort = self.select[self.sort_index]
+        descending = self.descending != backwards
+        order = "DESC" if descending else "ASC"
+        compare = ("<" if descending else ">") + ("=" if inclusive else "")
+        
+        where, params = "", []
+        if start is not None and sort == self.key:
+            where, params = f"WHERE {self.key} {compare} %s", [start[1]]
+        elif start is not None:
+            where, params = f"WHERE ({sort}, {self.key}) {compare} (%s, %s)", list(start)
+        
+        sql = f"""
+            SELECT {', '.join(self.select)}, {sort}, {self.key}
+            FROM {self.source}
+            {where}
+            ORDER BY {sort} {order}, {self.key} {order}
+            LIMIT %s
+        """
+        return sql, params + [self.PAGE_SIZE]
+    
+    def fetch_page(self, cursor, start=None, backwards=False, inclusive=False):
+        """Worker thread: fetch one page as (values, key) pairs in display order"""
+        sql, params = self.page_query(start, backwards, inclusive)
+        cursor.execute(sql, params)
+        rows = [(list(row[:-2]), (row[-2], row[-1])) for row in cursor.fetchall()]
+        if backwards:
+            rows.reverse()
+        return rows
+    
+    def submit(self, work, on_done, replace=False):
+        """
+        Run a page load in the background, one at a time. A load that replaces
+        the rows (reload, sort, jump) makes any load still running stale, and
+        workers can finish out of order, so stale results are dropped.
+        """
+        if replace:
+            self.generation += 1
+        generation = self.generation
+        
+        def done(result):
+            if generation != self.generation:
+                return
+            self.loading = False
+            on_done(result)
+        
+        def failed(error):
+            if generation == self.generation:
+                self.loading = False
+        
+        self.loading = True
+        self.executor.submit(work, done, error_message=f"Failed to load {self.name}",
+                             description=f"Loading {self.name}...", on_error=failed)
+    
+    def reload(self, keep_position=False):
+        """Load the first page again, or the page starting at the first loaded row"""
+        start = None
+        children = self.tree.get_children()
+        if keep_position and children and not self.at_start:
+            start = self.keys[children[0]]
+        
+        self.submit(lambda cursor: self.fetch_page(cursor, start, inclusive=True),
+                    lambda rows: self.show_rows(rows, at_start=start is None), replace=True)
+    
+    def show_rows(self, rows, at_start):
+        """Replace the loaded rows"""
+        self.tree.delete(*self.tree.get_children())
+        self.keys.clear()
+        self.insert_rows(rows, 'end')
+        self.at_start = at_start
+        self.at_end = len(rows) < self.PAGE_SIZE
+        self.tree.yview_moveto(0)
+        self.update_status()
+    
+    def insert_rows(self, rows, index):
+        """Add rows to the tree at index ('end' or a position)"""
+        for offset, (values, key) in enumerate(rows):
+            if self.format_row:
+                values = self.format_row(values)
+            position = index if index == 'end' else index + offset
+            item = self.tree.insert('', position, values=values)
+            self.keys[item] = key
+    
+    def load_next(self):
+        """Append the page after the last loaded row, dropping pages from the top"""
+        children = self.tree.get_children()
+        if not children:
+            return
+        start = self.keys[children[-1]]
+        
+        def done(rows):
+            top = self.first_visible()
+            self.insert_rows(rows, 'end')
+            self.at_end = len(rows) < self.PAGE_SIZE
+            removed = self.trim(from_top=True)
+            self.scroll_to(top - removed)
+        
+        self.submit(lambda cursor: self.fetch_page(cursor, start), done)
+    
+    def load_previous(self):
+        """Prepend the page before the first loaded row, dropping pages from the bottom"""
+        children = self.tree.get_children()
+        if not children:
+            return
+        start = self.keys[children[0]]
+        
+        def done(rows):
+            top = self.first_visible()
+            self.insert_rows(rows, 0)
+            self.at_start = len(rows) < self.PAGE_SIZE
+            self.trim(from_top=False)
+            self.scroll_to(top + len(rows))
+        
+        self.submit(lambda cursor: self.fetch_page(cursor, start, backwards=True), done)
+    
+    def trim(self, from_top):
+        """Drop rows beyond MAX_PAGES pages from one end; returns how many were dropped"""
+        children = self.tree.get_children()
+        extra = len(children) - self.PAGE_SIZE * self.MAX_PAGES
+        if extra <= 0:
+            self.update_status()
+            return 0
+        
+        dropped = children[:extra] if from_top else children[-extra:]
+        self.tree.delete(*dropped)
+        for item in dropped:
+            del self.keys[item]
+        if from_top:
+            self.at_start = False
+        else:
+            self.at_end = False
+        self.update_status()
+        return extra
+    
+    def first_visible(self):
+        """Index of the row at the top of the view"""
+        return round(self.tree.yview()[0] * len(self.tree.get_children()))
+    
+    def scroll_to(self, index):
+        """Put the row at index at the top of the view"""
+        count = len(self.tree.get_children())
+        if count:
+            self.tree.yview_moveto(max(index, 0) / count)
+    
+    def on_scroll(self, first, last):
+        """Scrollbar callback: move the scrollbar and fetch more rows near either end"""
+        self.scrollbar.set(first, last)
+        if self.loading:
+            return
+        if float(last) >= 1 - self.PREFETCH and not self.at_end:
+            self.load_next()
+        elif float(first) <= self.PREFETCH and not self.at_start:
+            self.load_previous()
+    
+    def sort_by(self, index):
+        """Sort on the server by a column, toggling the direction on a second click"""
+        if index == self.sort_index:
+            self.descending = not self.descending
+        else:
+            self.sort_index = index
+            self.descending = False
+        self.update_headings()
+        self.reload()
+    
+    def jump_to(self, record_id):
+        """Load the rows starting at the row with the given ID and select it"""
+        def fetch(cursor):
+            cursor.execute(f"SELECT {self.select[self.sort_index]} FROM {self.source} WHERE {self.key} = %s",
+                           (record_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return self.fetch_page(cursor, (row[0], record_id), inclusive=True)
+        
+        def done(rows):
+            if not rows:
+                messagebox.showwarning("Not Found", f"ID {record_id} was not found.")
+                return
+            self.show_rows(rows, at_start=False)
+            first = self.tree.get_children()[0]
+            self.tree.selection_set(first)
+            self.tree.focus(first)
+        
+        self.submit(fetch, done, replace=True)
+    
+    def update_headings(self):
+        """Mark the sorted column in its heading"""
+        for i, heading in enumerate(self.headings):
+            arrow = (" ▼" if self.descending else " ▲") if i == self.sort_index else ""
+            self.tree.heading(f'#{i+1}', text=heading + arrow)
+    
+    def update_status(self):
+        """Report the loaded window through on_status"""
+        if not self.on_status:
+            return
+        count = len(self.tree.get_children())
+        if not count and self.at_start:
+            self.on_status(f"No {self.name} found")
+            return
+        order = "descending" if self.descending else "ascending"
+        more = "" if self.at_end else ", scroll for more"
+        self.on_status(f"{count} {self.name} loaded, sorted by {self.headings[self.sort_index]} ({order}){more}")
+
 
 class StreamingServiceGUI:
+    # Background threads running queries, each on its own pooled connection
+    QUERY_WORKERS = 3
+    # Report rows fetched from the server-side cursor at a time
+    REPORT_CHUNK_SIZE = 500
+    # Report rows added to the results table per idle callback
+    REPORT_INSERT_BATCH = 100
+    # Report rows shown at most - the tree keeps every row it shows, so larger results are cut off
+    REPORT_MAX_ROWS = 10000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Streaming Service Management System")
         self.root.geometry("1400x900")
         self.root.configure(bg='#f0f0f0')
         
-        # Database connection
-        self.connection = None
-        self.cursor = None
+        # Database connection pool, and the workers that run queries on it
+        self.pool = None
+        self.executor = None
+        self.report_stream = None
+        self.report_cursor_names = itertools.count(1)
+        self.report_cache = ReportCache()
+        self.statements = StatementRegistry(CRUD_STATEMENTS)
+        self.name_searches = {}
+        self.lookup_cache = LookupCache()
         
         # Start with login screen
         self.show_login_screen()
@@ -91,25 +1179,64 @@ class StreamingServiceGUI:
     def connect_database(self):
         """Connect to PostgreSQL database"""
         try:
-            self.connection = psycopg2.connect(
+            self.disconnect()
+            self.pool = ConnectionPool(
+                1, self.QUERY_WORKERS + 2,
                 host=self.host_entry.get(),
                 port=self.port_entry.get(),
                 database=self.database_entry.get(),
                 user=self.username_entry.get(),
                 password=self.password_entry.get()
             )
-            self.cursor = self.connection.cursor(cursor_factory=DictCursor)
-            
-            # Test connection
-            self.cursor.execute("SELECT version();")
-            version = self.cursor.fetchone()[0]
+        except Exception as e:
+            messagebox.showerror("Connection Error", f"Failed to connect to PostgreSQL database:\n\n{str(e)}")
+            self.status_label.config(text="Connection failed. Please check credentials.", fg='red')
+            return
+        
+        # Every query, this test included, runs in the background on the executor's
+        # workers - the main thread never holds a cursor of its own
+        executor = self.executor = QueryExecutor(self.root, self.pool, self.QUERY_WORKERS)
+        
+        def test(cursor):
+            cursor.execute("SELECT version();")
+            version = cursor.fetchone()[0]
             
+            # Similar names are only searched for where pg_trgm is installed (see SearchIndexes.sql)
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            return version, cursor.fetchone()[0]
+        
+        def done(result):
+            if executor is not self.executor:
+                return
+            version, fuzzy = result
+            self.name_searches = {name: NameSearch(*search, fuzzy=fuzzy) for name, search in NAME_SEARCHES.items()}
             messagebox.showinfo("Success", f"Connected successfully to PostgreSQL!\n\nVersion: {version[:60]}...")
             self.show_main_menu()
-            
-        except Exception as e:
-            messagebox.showerror("Connection Error", f"Failed to connect to PostgreSQL database:\n\n{str(e)}")
+        
+        def failed(error):
+            if executor is not self.executor:
+                return
+            self.disconnect()
             self.status_label.config(text="Connection failed. Please check credentials.", fg='red')
+        
+        executor.submit(test, done, error_message="Failed to connect to PostgreSQL database",
+                        description="Connecting...", on_error=failed)
+    
+    def disconnect(self):
+        """Stop the query workers and close the pooled connections"""
+        self.report_cache = ReportCache()
+        self.lookup_cache = LookupCache()
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+    
+    def logout(self):
+        """Disconnect and go back to the login screen"""
+        self.disconnect()
+        self.show_login_screen()
     
     def show_main_menu(self):
         """תפריט ראשי"""
@@ -135,7 +1262,7 @@ class StreamingServiceGUI:
             ("⭐ Favorites Management", self.show_favorites_management, '#9b59b6'),
             ("📊 Reports & Queries", self.show_reports_screen, '#27ae60'),
             ("🔧 Functions & Procedures", self.show_functions_screen, '#e74c3c'),
-            ("🚪 Disconnect", self.show_login_screen, '#95a5a6')
+            ("🚪 Disconnect", self.logout, '#95a5a6')
         ]
         
         # Create buttons in grid
@@ -158,6 +1285,163 @@ class StreamingServiceGUI:
                               font=('Arial', 18, 'bold'), fg='white', bg='#34495e')
         title_label.pack(expand=True)
     
+    def create_jump_box(self, parent, get_table):
+        """Create a 'Go to ID' box that loads a paged table from the given ID"""
+        def jump():
+            try:
+                record_id = int(entry.get().strip())
+            except ValueError:
+                messagebox.showerror("Validation Error", "ID must be a number")
+                return
+            get_table().jump_to(record_id)
+        
+        tk.Button(parent, text="Go", command=jump,
+                 bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side='right', padx=5)
+        entry = tk.Entry(parent, font=('Arial', 11), width=10)
+        entry.pack(side='right', padx=5)
+        entry.bind('<Return>', lambda e: jump())
+        tk.Label(parent, text="Go to ID:", font=('Arial', 10, 'bold'), bg='#ecf0f1').pack(side='right')
+    
+    def create_search_box(self, parent, search, get_table):
+        """Create a search box that lists matching names as the user types and loads a paged table at the one picked"""
+        search_frame = tk.Frame(parent, bg='#ecf0f1')
+        search_frame.pack(fill='x', pady=(0, 10))
+        
+        tk.Label(search_frame, text="🔍 Search by name:", font=('Arial', 10, 'bold'), bg='#ecf0f1').pack(side='left')
+        typeahead = Typeahead(search_frame, self.executor, self.name_searches[search],
+                              lambda record_id, name: get_table().jump_to(record_id),
+                              cache=self.lookup_cache, font=('Arial', 11), width=30)
+        typeahead.entry.pack(side='left', padx=5)
+        tk.Label(search_frame, text=f"Type at least {Typeahead.MIN_LENGTH} letters, then pick a match",
+                 font=('Arial', 9), bg='#ecf0f1', fg='#7f8c8d').pack(side='left')
+    
+    def run_write(self, work, on_done, tables, **options):
+        """Run a CRUD statement in the background and drop the cached reports and lookups of the tables it changes"""
+        def done(result):
+            self.report_cache.invalidate(*tables)
+            self.lookup_cache.invalidate(*tables)
+            on_done(result)
+        
+        self.executor.submit(work, done, **options)
+    
+    def import_csv(self, table, tables, on_done):
+        """Bulk import a CSV file into a table in one transaction - rows whose key exists are skipped or updated"""
+        path = filedialog.askopenfilename(title=f"Import {table} from CSV",
+                                          filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        columns, key_columns = BULK_TABLES[table]
+        file_name = os.path.basename(path)
+        
+        # The header names the columns, in any order and case
+        try:
+            with open(path, newline='', encoding='utf-8-sig') as f:
+                header = next(csv.reader(f), [])
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Import Error", f"Could not read {file_name}:\n\n{str(e)}")
+            return
+        names = {column.lower(): column for column in columns}
+        header = [names.get(name.strip().lower()) for name in header]
+        if sorted(filter(None, header)) != sorted(columns) or None in header:
+            messagebox.showerror("Import Error",
+                                 f"The first line of {file_name} must name the {table} columns:\n\n{', '.join(columns)}")
+            return
+        
+        update = False
+        if len(key_columns) < len(columns):
+            update = messagebox.askyesnocancel(
+                "Existing Rows",
+                f"Some rows of {file_name} may already be in {table}.\n\n"
+                f"Yes - update those rows from the file\nNo - keep them and skip those lines")
+            if update is None:
+                return
+        
+        reader = ProgressReader(path)
+        progress = ProgressWindow(self.root, f"Importing {file_name} into {table}...", reader.fraction)
+        start = time.perf_counter()
+        
+        def load(cursor):
+            # COPY into a scratch table first, so the file can be checked against the keys in one statement
+            try:
+                cursor.execute(f"CREATE TEMP TABLE csv_import (LIKE {table}) ON COMMIT DROP")
+                cursor.copy_expert(
+                    f"COPY csv_import ({', '.join(header)}) FROM STDIN WITH (FORMAT csv, HEADER true)", reader)
+            finally:
+                reader.close()
+            cursor.execute("SELECT COUNT(*) FROM csv_import")
+            read = cursor.fetchone()[0]
+            
+            keys = ", ".join(key_columns)
+            values = ", ".join(columns)
+            if update:
+                changes = ", ".join(f"{column} = EXCLUDED.{column}" for column in columns if column not in key_columns)
+                conflict = f"DO UPDATE SET {changes}"
+            else:
+                conflict = "DO NOTHING"
+            # A key repeated in the file is written once; xmax is 0 only on newly inserted rows
+            cursor.execute(f"""
+                WITH written AS (
+                    INSERT INTO {table} ({values})
+                    SELECT DISTINCT ON ({keys}) {values} FROM csv_import
+                    ON CONFLICT ({keys}) {conflict}
+                    RETURNING xmax = 0 AS inserted
+                )
+                SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted)
+                FROM written
+            """)
+            inserted, updated = cursor.fetchone()
+            return read, inserted, updated
+        
+        def done(counts):
+            progress.close()
+            read, inserted, updated = counts
+            summary = f"Imported {file_name} into {table} in {time.perf_counter() - start:.1f} seconds.\n\n"
+            summary += f"📄 Rows in file: {read}\n"
+            summary += f"➕ Added: {inserted}\n"
+            if update:
+                summary += f"✏ Updated: {updated}\n"
+            summary += f"⏭ Skipped (already in {table} or repeated in the file): {read - inserted - updated}"
+            messagebox.showinfo("Import Complete", summary)
+            on_done()
+        
+        self.run_write(load, done, tables, on_error=lambda error: progress.close(),
+                       error_message=f"Failed to import {file_name} - no rows were imported",
+                       description=f"Importing {file_name}...")
+    
+    def delete_rows(self, table, keys, name, on_done):
+        """Delete several rows of a table, given by their primary key values, in one statement"""
+        key_columns = BULK_TABLES[table][1]
+        
+        def delete(cursor):
+            if len(key_columns) == 1:
+                cursor.execute(f"DELETE FROM {table} WHERE {key_columns[0]} = ANY(%s)", ([key[0] for key in keys],))
+            else:
+                matches = " AND ".join(f"t.{column} = d.{column}" for column in key_columns)
+                execute_values(cursor,
+                               f"DELETE FROM {table} t USING (VALUES %s) AS d ({', '.join(key_columns)}) WHERE {matches}",
+                               keys, page_size=len(keys))
+            return cursor.rowcount
+        
+        def done(deleted):
+            messagebox.showinfo("Deleted", f"{deleted} of {len(keys)} selected {name} deleted successfully.")
+            on_done()
+        
+        self.run_write(delete, done, referencing_tables(table),
+                       error_message=f"Failed to delete {name} (they may have related records that prevent deletion) - nothing was deleted",
+                       description=f"Deleting {len(keys)} {name}...")
+    
+    def confirm_bulk_delete(self, rows, name, describe, consequences=""):
+        """Ask before deleting several selected rows, listing the first few"""
+        warning_msg = f"⚠️ WARNING: DELETE {len(rows)} {name.upper()} ⚠️\n\n"
+        warning_msg += f"You are about to permanently delete:\n\n"
+        for row in rows[:10]:
+            warning_msg += f"• {describe(row)}\n"
+        if len(rows) > 10:
+            warning_msg += f"• ...and {len(rows) - 10} more\n"
+        warning_msg += f"\n{consequences}❌ THIS CANNOT BE UNDONE!\n\n"
+        warning_msg += f"Are you sure you want to delete these {name}?"
+        return messagebox.askyesno("Confirm Deletion", warning_msg)
+    
     def show_customer_management(self):
         """ניהול לקוחות - CRUD"""
         self.clear_screen()
@@ -178,11 +1462,24 @@ class StreamingServiceGUI:
                  bg='#f39c12', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="🗑 Delete Customer", command=self.delete_customer,
                  bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
+        tk.Button(buttons_frame, text="📥 Import CSV",
+                 command=lambda: self.import_csv("Customer", ("Customer",), self.refresh_customers),
+                 bg='#8e44ad', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="🔄 Refresh", command=self.refresh_customers,
                  bg='#3498db', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="⬅ Back", command=self.show_main_menu,
                  bg='#95a5a6', fg='white', font=('Arial', 10, 'bold')).pack(side='right', padx=5)
         
+        # Jump to ID
+        self.create_jump_box(buttons_frame, lambda: self.customer_table)
+        
+        # Search by name
+        self.create_search_box(content_frame, "customers", lambda: self.customer_table)
+        
+        # Status line
+        customer_status = tk.Label(content_frame, text="", font=('Arial', 10), bg='#ecf0f1', fg='#7f8c8d', anchor='w')
+        customer_status.pack(side='bottom', fill='x', pady=(5, 0))
+        
         # Treeview for customers
         tree_frame = tk.Frame(content_frame)
         tree_frame.pack(fill='both', expand=True)
@@ -205,56 +1502,33 @@ class StreamingServiceGUI:
         # Define headings
         headings = ['Customer ID', 'First Name', 'Last Name', 'Date of Birth', 'Customer Since']
         for i, heading in enumerate(headings):
-            self.customer_tree.heading(f'#{i+1}', text=heading)
             self.customer_tree.column(f'#{i+1}', width=150)
         
+        # Rows are loaded a page at a time as the table scrolls
+        self.customer_table = PagedTable(
+            self.customer_tree, v_scrollbar, self.executor, headings,
+            ['customerID', 'firstName', 'lastName', 'dateOfBirth', 'customerSince'],
+            "Customer", "customerID", name="customers",
+            on_status=lambda text: customer_status.config(text=text))
+        
         # Pack components
         self.customer_tree.pack(side='left', fill='both', expand=True)
         v_scrollbar.pack(side='right', fill='y')
         h_scrollbar.pack(side='bottom', fill='x')
         
         # Load data
-        self.refresh_customers()
+        self.customer_table.reload()
         
         # Bind selection event
         self.customer_tree.bind('<<TreeviewSelect>>', self.on_customer_select)
     
     def refresh_customers(self):
         """Load customers"""
-        try:
-            # Clear existing data
-            for item in self.customer_tree.get_children():
-                self.customer_tree.delete(item)
-            
-            # Show loading message
-            self.root.config(cursor="wait")
-            self.root.update()
-            
-            # Fetch customers
-            self.cursor.execute("SELECT customerID, firstName, lastName, dateOfBirth, customerSince FROM Customer ORDER BY customerID")
-            customers = self.cursor.fetchall()
-            
-            # Insert into treeview
-            for customer in customers:
-                self.customer_tree.insert('', 'end', values=customer)
-            
-            # Reset cursor
-            self.root.config(cursor="")
-            
-            # Clear any previous selection
-            if hasattr(self, 'selected_customer'):
-                delattr(self, 'selected_customer')
-                
-            # Show success message with count
-            if customers:
-                status_msg = f"✅ Successfully loaded {len(customers)} customer{'s' if len(customers) != 1 else ''}"
-                messagebox.showinfo("Data Loaded", status_msg)
-            else:
-                messagebox.showinfo("No Data", "No customers found in the database.\n\nClick 'Add Customer' to create the first customer.")
-            
-        except Exception as e:
-            self.root.config(cursor="")
-            messagebox.showerror("Database Error", f"Failed to load customers:\n\n{str(e)}\n\nPlease check your database connection.")
+        # Clear any previous selection
+        if hasattr(self, 'selected_customer'):
+            delattr(self, 'selected_customer')
+        
+        self.customer_table.reload(keep_position=True)
     
     def on_customer_select(self, event):
         """Handle customer selection"""
@@ -267,19 +1541,15 @@ class StreamingServiceGUI:
         """Add new customer"""
         dialog = CustomerDialog(self.root, "Add Customer")
         if dialog.result:
-            try:
-                self.cursor.execute("""
-                    INSERT INTO Customer (customerID, firstName, lastName, dateOfBirth, customerSince)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, dialog.result)
-                
-                self.connection.commit()
+            def insert(cursor):
+                self.statements.execute(cursor, "add_customer", dialog.result)
+            
+            def done(result):
                 messagebox.showinfo("Success", "Customer added successfully!")
                 self.refresh_customers()
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Error", f"Failed to add customer: {str(e)}")
+            
+            self.run_write(insert, done, ("Customer",), error_message="Failed to add customer",
+                           description="Adding customer...")
     
     def edit_customer(self):
         """Edit selected customer"""
@@ -290,25 +1560,30 @@ class StreamingServiceGUI:
         
         dialog = CustomerDialog(self.root, "Edit Customer", self.selected_customer)
         if dialog.result:
-            try:
-                self.cursor.execute("""
-                    UPDATE Customer 
-                    SET firstName = %s, lastName = %s, dateOfBirth = %s, customerSince = %s
-                    WHERE customerID = %s
-                """, dialog.result[1:] + [self.selected_customer[0]])
-                
-                self.connection.commit()
+            customer_id = self.selected_customer[0]
+            
+            def update(cursor):
+                self.statements.execute(cursor, "edit_customer", dialog.result[1:] + [customer_id])
+            
+            def done(result):
                 messagebox.showinfo("Success", 
                                   f"Customer '{dialog.result[1]} {dialog.result[2]}' updated successfully!")
                 self.refresh_customers()
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Database Error", 
-                                   f"Failed to update customer:\n\n{str(e)}\n\nThe operation has been cancelled.")
+            
+            self.run_write(update, done, ("Customer",), error_message="Failed to update customer",
+                           description="Updating customer...")
     
     def delete_customer(self):
-        """Delete selected customer"""
+        """Delete selected customers"""
+        selection = self.customer_tree.selection()
+        if len(selection) > 1:
+            customers = [self.customer_tree.item(item)['values'] for item in selection]
+            if self.confirm_bulk_delete(customers, "customers", lambda c: f"{c[0]} - {c[1]} {c[2]}",
+                                        "⚠️ THIS WILL ALSO DELETE all profiles and related data of these customers\n\n"):
+                self.delete_rows("Customer", [(c[0],) for c in customers], "customers",
+                                 self.refresh_customers)
+            return
+        
         if not hasattr(self, 'selected_customer') or not self.selected_customer:
             messagebox.showwarning("Selection Required", 
                                  "Please select a customer from the table first.\n\nClick on a row in the table to select it, then click Delete.")
@@ -329,19 +1604,21 @@ class StreamingServiceGUI:
         warning_msg += "Are you sure you want to delete this customer?"
         
         if messagebox.askyesno("Confirm Deletion", warning_msg):
-            try:
-                self.cursor.execute("DELETE FROM Customer WHERE customerID = %s", (self.selected_customer[0],))
-                self.connection.commit()
+            customer_id = self.selected_customer[0]
+            
+            def delete(cursor):
+                self.statements.execute(cursor, "delete_customer", (customer_id,))
+            
+            def done(result):
                 messagebox.showinfo("Deleted", f"Customer '{customer_name}' and all related data deleted successfully.")
                 self.refresh_customers()
                 # Clear selection
                 if hasattr(self, 'selected_customer'):
                     delattr(self, 'selected_customer')
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Database Error", 
-                                   f"Failed to delete customer:\n\n{str(e)}\n\nThe customer may have related records that prevent deletion.")
+            
+            self.run_write(delete, done, referencing_tables("Customer"),
+                           error_message="Failed to delete customer (it may have related records that prevent deletion)",
+                           description="Deleting customer...")
     
     def show_profile_management(self):
         """ניהול פרופילים - CRUD"""
@@ -363,11 +1640,24 @@ class StreamingServiceGUI:
                  bg='#f39c12', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="🗑 Delete Profile", command=self.delete_profile,
                  bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
+        tk.Button(buttons_frame, text="📥 Import CSV",
+                 command=lambda: self.import_csv("Profile", ("Profile",), self.refresh_profiles),
+                 bg='#8e44ad', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="🔄 Refresh", command=self.refresh_profiles,
                  bg='#3498db', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="⬅ Back", command=self.show_main_menu,
                  bg='#95a5a6', fg='white', font=('Arial', 10, 'bold')).pack(side='right', padx=5)
         
+        # Jump to ID
+        self.create_jump_box(buttons_frame, lambda: self.profile_table)
+        
+        # Search by name
+        self.create_search_box(content_frame, "profiles", lambda: self.profile_table)
+        
+        # Status line
+        profile_status = tk.Label(content_frame, text="", font=('Arial', 10), bg='#ecf0f1', fg='#7f8c8d', anchor='w')
+        profile_status.pack(side='bottom', fill='x', pady=(5, 0))
+        
         # Treeview for profiles
         tree_frame = tk.Frame(content_frame)
         tree_frame.pack(fill='both', expand=True)
@@ -383,39 +1673,30 @@ class StreamingServiceGUI:
         # Define headings
         headings = ['Profile ID', 'Profile Name', 'Profile Picture', 'Is Online', 'Customer ID', 'Customer Name']
         for i, heading in enumerate(headings):
-            self.profile_tree.heading(f'#{i+1}', text=heading)
             self.profile_tree.column(f'#{i+1}', width=120)
         
+        def format_row(values):
+            values[3] = "Yes" if values[3] else "No"  # Convert boolean
+            return values
+        
+        # Rows are loaded a page at a time as the table scrolls
+        self.profile_table = PagedTable(
+            self.profile_tree, v_scrollbar, self.executor, headings,
+            ['p.profileID', 'p.profileName', 'p.profilePicture', 'p.isOnline', 'p.customerID',
+             "c.firstName || ' ' || c.lastName"],
+            "Profile p JOIN Customer c ON p.customerID = c.customerID", "p.profileID",
+            name="profiles", format_row=format_row,
+            on_status=lambda text: profile_status.config(text=text))
+        
         self.profile_tree.pack(side='left', fill='both', expand=True)
         v_scrollbar.pack(side='right', fill='y')
         
-        self.refresh_profiles()
+        self.profile_table.reload()
         self.profile_tree.bind('<<TreeviewSelect>>', self.on_profile_select)
     
     def refresh_profiles(self):
         """Load profiles"""
-        try:
-            for item in self.profile_tree.get_children():
-                self.profile_tree.delete(item)
-            
-            self.cursor.execute("""
-                SELECT p.profileID, p.profileName, p.profilePicture, p.isOnline, 
-                       p.customerID, c.firstName || ' ' || c.lastName
-                FROM Profile p
-                JOIN Customer c ON p.customerID = c.customerID
-                ORDER BY p.profileID
-            """)
-            profiles = self.cursor.fetchall()
-            
-            for profile in profiles:
-                values = list(profile)
-                values[3] = "Yes" if values[3] else "No"  # Convert boolean
-                self.profile_tree.insert('', 'end', values=values)
-                
-            messagebox.showinfo("Success", f"Loaded {len(profiles)} profiles")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load profiles: {str(e)}")
+        self.profile_table.reload(keep_position=True)
     
     def on_profile_select(self, event):
         """Handle profile selection"""
@@ -426,21 +1707,18 @@ class StreamingServiceGUI:
     
     def add_profile(self):
         """Add new profile"""
-        dialog = ProfileDialog(self.root, "Add Profile", self.cursor)
+        dialog = ProfileDialog(self.root, "Add Profile", self.executor, self.name_searches["customers"],
+                               self.lookup_cache)
         if dialog.result:
-            try:
-                self.cursor.execute("""
-                    INSERT INTO Profile (profileID, profileName, profilePicture, isOnline, WatchHistoryID, customerID)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, dialog.result)
-                
-                self.connection.commit()
+            def insert(cursor):
+                self.statements.execute(cursor, "add_profile", dialog.result)
+            
+            def done(result):
                 messagebox.showinfo("Success", "Profile added successfully!")
                 self.refresh_profiles()
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Error", f"Failed to add profile: {str(e)}")
+            
+            self.run_write(insert, done, ("Profile",), error_message="Failed to add profile",
+                           description="Adding profile...")
     
     def edit_profile(self):
         """Edit selected profile"""
@@ -449,27 +1727,32 @@ class StreamingServiceGUI:
                                  "Please select a profile from the table first.\n\nClick on a row in the table to select it, then click Edit.")
             return
         
-        dialog = ProfileDialog(self.root, "Edit Profile", self.cursor, self.selected_profile)
+        dialog = ProfileDialog(self.root, "Edit Profile", self.executor, self.name_searches["customers"],
+                               self.lookup_cache, self.selected_profile)
         if dialog.result:
-            try:
-                self.cursor.execute("""
-                    UPDATE Profile 
-                    SET profileName = %s, profilePicture = %s, isOnline = %s, WatchHistoryID = %s, customerID = %s
-                    WHERE profileID = %s
-                """, dialog.result[1:] + [self.selected_profile[0]])
-                
-                self.connection.commit()
+            profile_id = self.selected_profile[0]
+            
+            def update(cursor):
+                self.statements.execute(cursor, "edit_profile", dialog.result[1:] + [profile_id])
+            
+            def done(result):
                 messagebox.showinfo("Success", 
                                   f"Profile '{dialog.result[1]}' updated successfully!")
                 self.refresh_profiles()
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Database Error", 
-                                   f"Failed to update profile:\n\n{str(e)}\n\nThe operation has been cancelled.")
+            
+            self.run_write(update, done, ("Profile",), error_message="Failed to update profile",
+                           description="Updating profile...")
     
     def delete_profile(self):
-        """Delete selected profile"""
+        """Delete selected profiles"""
+        selection = self.profile_tree.selection()
+        if len(selection) > 1:
+            profiles = [self.profile_tree.item(item)['values'] for item in selection]
+            if self.confirm_bulk_delete(profiles, "profiles", lambda p: f"{p[0]} - {p[1]} ({p[5]})"):
+                self.delete_rows("Profile", [(p[0],) for p in profiles], "profiles",
+                                 self.refresh_profiles)
+            return
+        
         if not hasattr(self, 'selected_profile') or not self.selected_profile:
             messagebox.showwarning("Selection Required", 
                                  "Please select a profile from the table first.\n\nClick on a row in the table to select it, then click Delete.")
@@ -485,18 +1768,19 @@ class StreamingServiceGUI:
         warning_msg += "Are you sure you want to delete this profile?"
         
         if messagebox.askyesno("Confirm Deletion", warning_msg):
-            try:
-                self.cursor.execute("DELETE FROM Profile WHERE profileID = %s", (self.selected_profile[0],))
-                self.connection.commit()
+            profile_id = self.selected_profile[0]
+            
+            def delete(cursor):
+                self.statements.execute(cursor, "delete_profile", (profile_id,))
+            
+            def done(result):
                 messagebox.showinfo("Deleted", f"Profile '{profile_name}' deleted successfully.")
                 self.refresh_profiles()
                 if hasattr(self, 'selected_profile'):
                     delattr(self, 'selected_profile')
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Database Error", 
-                                   f"Failed to delete profile:\n\n{str(e)}")
+            
+            self.run_write(delete, done, referencing_tables("Profile"), error_message="Failed to delete profile",
+                           description="Deleting profile...")
     
     def show_favorites_management(self):
         """ניהול מועדפים - CRUD"""
@@ -515,6 +1799,9 @@ class StreamingServiceGUI:
                  bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="🗑 Remove Favorite", command=self.delete_favorite,
                  bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
+        tk.Button(buttons_frame, text="📥 Import CSV",
+                 command=lambda: self.import_csv("MarksAsFavorite", ("MarksAsFavorite",), self.refresh_favorites),
+                 bg='#8e44ad', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="🔄 Refresh", command=self.refresh_favorites,
                  bg='#3498db', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
         tk.Button(buttons_frame, text="⬅ Back", command=self.show_main_menu,
@@ -545,25 +1832,28 @@ class StreamingServiceGUI:
     
     def refresh_favorites(self):
         """Load favorites"""
-        try:
-            for item in self.favorites_tree.get_children():
-                self.favorites_tree.delete(item)
-            
-            self.cursor.execute("""
+        def fetch(cursor):
+            cursor.execute("""
                 SELECT maf.profileID, p.profileName, maf.movieID
                 FROM MarksAsFavorite maf
                 JOIN Profile p ON maf.profileID = p.profileID
                 ORDER BY maf.profileID, maf.movieID
             """)
-            favorites = self.cursor.fetchall()
-            
-            for favorite in favorites:
-                self.favorites_tree.insert('', 'end', values=favorite)
-                
-            messagebox.showinfo("Success", f"Loaded {len(favorites)} favorites")
+            return cursor.fetchall()
+        
+        self.executor.submit(fetch, self.show_favorites,
+                             error_message="Failed to load favorites",
+                             description="Loading favorites...")
+    
+    def show_favorites(self, favorites):
+        """Fill the favorites table with loaded rows"""
+        for item in self.favorites_tree.get_children():
+            self.favorites_tree.delete(item)
+        
+        for favorite in favorites:
+            self.favorites_tree.insert('', 'end', values=favorite)
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load favorites: {str(e)}")
+        messagebox.showinfo("Success", f"Loaded {len(favorites)} favorites")
     
     def on_favorite_select(self, event):
         """Handle favorite selection"""
@@ -574,24 +1864,29 @@ class StreamingServiceGUI:
     
     def add_favorite(self):
         """Add new favorite"""
-        dialog = FavoriteDialog(self.root, "Add Favorite", self.cursor)
+        dialog = FavoriteDialog(self.root, "Add Favorite", self.statements, self.executor,
+                                self.name_searches["profiles"], self.lookup_cache)
         if dialog.result:
-            try:
-                self.cursor.execute("""
-                    INSERT INTO MarksAsFavorite (profileID, movieID)
-                    VALUES (%s, %s)
-                """, dialog.result)
-                
-                self.connection.commit()
+            def insert(cursor):
+                self.statements.execute(cursor, "add_favorite", dialog.result)
+            
+            def done(result):
                 messagebox.showinfo("Success", "Favorite added successfully!")
                 self.refresh_favorites()
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Error", f"Failed to add favorite: {str(e)}")
+            
+            self.run_write(insert, done, ("MarksAsFavorite",), error_message="Failed to add favorite",
+                           description="Adding favorite...")
     
     def delete_favorite(self):
-        """Delete selected favorite"""
+        """Delete selected favorites"""
+        selection = self.favorites_tree.selection()
+        if len(selection) > 1:
+            favorites = [self.favorites_tree.item(item)['values'] for item in selection]
+            if self.confirm_bulk_delete(favorites, "favorites", lambda f: f"{f[1]} - movie {f[2]}"):
+                self.delete_rows("MarksAsFavorite", [(f[0], f[2]) for f in favorites], "favorites",
+                                 self.refresh_favorites)
+            return
+        
         if not hasattr(self, 'selected_favorite') or not self.selected_favorite:
             messagebox.showwarning("Selection Required", 
                                  "Please select a favorite from the table first.")
@@ -606,23 +1901,20 @@ class StreamingServiceGUI:
         confirm_msg += "Are you sure you want to continue?"
         
         if messagebox.askyesno("Confirm Remove Favorite", confirm_msg):
-            try:
-                self.cursor.execute("""
-                    DELETE FROM MarksAsFavorite 
-                    WHERE profileID = %s AND movieID = %s
-                """, (self.selected_favorite[0], self.selected_favorite[2]))
-                
-                self.connection.commit()
+            profile_id = self.selected_favorite[0]
+            
+            def delete(cursor):
+                self.statements.execute(cursor, "delete_favorite", (profile_id, movie_id))
+            
+            def done(result):
                 messagebox.showinfo("Success", 
                                   f"Movie {movie_id} removed from {profile_name}'s favorites successfully!")
                 self.refresh_favorites()
                 if hasattr(self, 'selected_favorite'):
                     delattr(self, 'selected_favorite')
-                
-            except Exception as e:
-                self.connection.rollback()
-                messagebox.showerror("Database Error", 
-                                   f"Failed to remove favorite:\n\n{str(e)}")
+            
+            self.run_write(delete, done, referencing_tables("MarksAsFavorite"), error_message="Failed to remove favorite",
+                           description="Removing favorite...")
     
     def show_reports_screen(self):
         """מסך דוחות ושאילתות"""
@@ -681,125 +1973,133 @@ class StreamingServiceGUI:
         tk.Label(results_frame, text="Select a report from the left panel to view results...", 
                 font=('Arial', 12)).pack(pady=50)
     
+    def run_report(self, sql, columns, tables, format_row=None, params=None):
+        """Run a report query in the background and stream its rows into the results table"""
+        # Reports are cached until a write to one of the tables they read
+        key = (sql, tuple(params or ()))
+        cached = self.report_cache.get(key)
+        if cached:
+            rows, age = cached
+            stream = RowStream.of(rows, self.REPORT_CHUNK_SIZE, note=f" (cached {int(age)}s ago)")
+            self.display_query_results(stream, columns)
+            return
+        
+        stream = RowStream()
+        cursor_name = f"report_{next(self.report_cursor_names)}"
+        cache = self.report_cache
+        since = cache.start()
+        
+        def fetch(cursor):
+            # A named cursor keeps the result on the server until it is fetched
+            report_cursor = cursor.connection.cursor(name=cursor_name)
+            collected = []
+            try:
+                report_cursor.execute(sql, params)
+                while True:
+                    rows = report_cursor.fetchmany(self.REPORT_CHUNK_SIZE)
+                    if not rows:
+                        break
+                    if format_row:
+                        rows = [format_row(list(row)) for row in rows]
+                    if collected is not None:
+                        collected.extend(rows)
+                        if len(collected) > cache.max_rows:
+                            collected = None    # too large to cache
+                    if not stream.put(rows):
+                        return
+                stream.finish()
+            finally:
+                report_cursor.close()
+            if collected is not None:
+                cache.put(key, tables, collected, since)
+        
+        self.display_query_results(stream, columns)
+        self.executor.submit(fetch, description="Running report...",
+                             on_error=lambda error: stream.close())
+    
     def query_customer_stats(self):
         """שאילתה 1: סטטיסטיקות לקוחות"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    c.customerID,
-                    c.firstName || ' ' || c.lastName AS customer_name,
-                    COUNT(p.profileID) AS num_profiles,
-                    COUNT(DISTINCT maf.movieID) AS num_favorites,
-                    EXTRACT(YEAR FROM c.customerSince) AS join_year
-                FROM Customer c
-                LEFT JOIN Profile p ON c.customerID = p.customerID
-                LEFT JOIN MarksAsFavorite maf ON p.profileID = maf.profileID
-                GROUP BY c.customerID, c.firstName, c.lastName, c.customerSince
-                ORDER BY num_favorites DESC
-            """)
-            
-            results = self.cursor.fetchall()
-            self.display_query_results(results, 
-                ['Customer ID', 'Customer Name', 'Profiles', 'Favorites', 'Join Year'])
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Query failed: {str(e)}")
+        self.run_report("""
+            SELECT 
+                c.customerID,
+                c.firstName || ' ' || c.lastName AS customer_name,
+                COUNT(p.profileID) AS num_profiles,
+                COUNT(DISTINCT maf.movieID) AS num_favorites,
+                EXTRACT(YEAR FROM c.customerSince) AS join_year
+            FROM Customer c
+            LEFT JOIN Profile p ON c.customerID = p.customerID
+            LEFT JOIN MarksAsFavorite maf ON p.profileID = maf.profileID
+            GROUP BY c.customerID, c.firstName, c.lastName, c.customerSince
+            ORDER BY num_favorites DESC
+        """, ['Customer ID', 'Customer Name', 'Profiles', 'Favorites', 'Join Year'],
+            ("Customer", "Profile", "MarksAsFavorite"))
     
     def query_popular_movies(self):
         """שאילתה 2: סרטים פופולריים"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    maf.movieID,
-                    COUNT(maf.profileID) AS favorite_count
-                FROM MarksAsFavorite maf
-                GROUP BY maf.movieID
-                HAVING COUNT(maf.profileID) > 0
-                ORDER BY favorite_count DESC
-                LIMIT 10
-            """)
-            
-            results = self.cursor.fetchall()
-            self.display_query_results(results, 
-                ['Movie ID', 'Favorite Count'])
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Query failed: {str(e)}")
+        self.run_report("""
+            SELECT 
+                maf.movieID,
+                COUNT(maf.profileID) AS favorite_count
+            FROM MarksAsFavorite maf
+            GROUP BY maf.movieID
+            HAVING COUNT(maf.profileID) > 0
+            ORDER BY favorite_count DESC
+            LIMIT 10
+        """, ['Movie ID', 'Favorite Count'], ("MarksAsFavorite",))
     
     def query_profile_activity(self):
         """שאילתה 3: פעילות פרופילים"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    p.profileID,
-                    p.profileName,
-                    p.isOnline,
-                    COUNT(maf.movieID) AS favorites_count
-                FROM Profile p
-                LEFT JOIN MarksAsFavorite maf ON p.profileID = maf.profileID
-                GROUP BY p.profileID, p.profileName, p.isOnline
-                ORDER BY favorites_count DESC
-            """)
-            
-            results = self.cursor.fetchall()
-            formatted_results = []
-            for row in results:
-                formatted_row = list(row)
-                formatted_row[2] = "Online" if formatted_row[2] else "Offline"
-                formatted_results.append(formatted_row)
-            
-            self.display_query_results(formatted_results, 
-                ['Profile ID', 'Profile Name', 'Status', 'Favorites'])
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Query failed: {str(e)}")
+        def format_row(row):
+            row[2] = "Online" if row[2] else "Offline"
+            return row
+        
+        self.run_report("""
+            SELECT 
+                p.profileID,
+                p.profileName,
+                p.isOnline,
+                COUNT(maf.movieID) AS favorites_count
+            FROM Profile p
+            LEFT JOIN MarksAsFavorite maf ON p.profileID = maf.profileID
+            GROUP BY p.profileID, p.profileName, p.isOnline
+            ORDER BY favorites_count DESC
+        """, ['Profile ID', 'Profile Name', 'Status', 'Favorites'], ("Profile", "MarksAsFavorite"), format_row)
     
     def query_payment_summary(self):
         """שאילתה 4: סיכום תשלומים"""
-        try:
-            # This is a simplified query since Payment table structure may vary
-            self.cursor.execute("""
-                SELECT 
-                    COUNT(*) as total_customers,
-                    AVG(EXTRACT(YEAR FROM CURRENT_DATE) - EXTRACT(YEAR FROM customerSince)) as avg_years_as_customer
-                FROM Customer
-            """)
-            
-            results = self.cursor.fetchall()
-            self.display_query_results(results, 
-                ['Total Customers', 'Avg Years as Customer'])
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Query failed: {str(e)}")
+        # This is a simplified query since Payment table structure may vary
+        self.run_report("""
+            SELECT 
+                COUNT(*) as total_customers,
+                AVG(EXTRACT(YEAR FROM CURRENT_DATE) - EXTRACT(YEAR FROM customerSince)) as avg_years_as_customer
+            FROM Customer
+        """, ['Total Customers', 'Avg Years as Customer'], ("Customer",))
     
     def query_watch_history(self):
         """שאילתה 5: ניתוח לקוחות ופרופילים"""
-        try:
-            self.cursor.execute("""
-                SELECT 
-                    c.customerID,
-                    c.firstName || ' ' || c.lastName as customer_name,
-                    COUNT(p.profileID) as profile_count,
-                    CASE 
-                        WHEN COUNT(p.profileID) >= 3 THEN 'Family'
-                        WHEN COUNT(p.profileID) = 2 THEN 'Couple'
-                        ELSE 'Individual'
-                    END as customer_type
-                FROM Customer c
-                LEFT JOIN Profile p ON c.customerID = p.customerID
-                GROUP BY c.customerID, c.firstName, c.lastName
-                ORDER BY profile_count DESC
-            """)
-            
-            results = self.cursor.fetchall()
-            self.display_query_results(results, 
-                ['Customer ID', 'Customer Name', 'Profile Count', 'Customer Type'])
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Query failed: {str(e)}")
+        self.run_report("""
+            SELECT 
+                c.customerID,
+                c.firstName || ' ' || c.lastName as customer_name,
+                COUNT(p.profileID) as profile_count,
+                CASE 
+                    WHEN COUNT(p.profileID) >= 3 THEN 'Family'
+                    WHEN COUNT(p.profileID) = 2 THEN 'Couple'
+                    ELSE 'Individual'
+                END as customer_type
+            FROM Customer c
+            LEFT JOIN Profile p ON c.customerID = p.customerID
+            GROUP BY c.customerID, c.firstName, c.lastName
+            ORDER BY profile_count DESC
+        """, ['Customer ID', 'Customer Name', 'Profile Count', 'Customer Type'], ("Customer", "Profile"))
     
-    def display_query_results(self, results, columns):
-        """Display query results in treeview"""
+    def display_query_results(self, stream, columns):
+        """Display query results in treeview as they arrive"""
+        # Stop filling in the previous report
+        if self.report_stream:
+            self.report_stream.close()
+        self.report_stream = stream
+        
         # Clear previous results
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
@@ -810,11 +2110,42 @@ class StreamingServiceGUI:
             self.results_tree.heading(col, text=col)
             self.results_tree.column(col, width=120)
         
-        # Insert results
-        for row in results:
-            self.results_tree.insert('', 'end', values=row)
+        self.insert_query_results(stream, [], 0)
+    
+    def insert_query_results(self, stream, rows, count):
+        """Insert streamed rows a batch at a time while the window is idle"""
+        if stream.closed:
+            return
+        try:
+            if not rows:
+                rows = stream.get()
+                if rows is None:
+                    stream.close()
+                    messagebox.showinfo("Success", f"Query completed! Found {count} results{stream.note}")
+                    return
+            if count >= self.REPORT_MAX_ROWS:
+                # More rows than are shown - closing the stream stops the worker too
+                stream.close()
+                messagebox.showinfo("Results Cut Off", f"Showing the first {count} results{stream.note}. "
+                                    "Refine the report to see the rest.")
+                return
+            
+            batch_size = min(self.REPORT_INSERT_BATCH, self.REPORT_MAX_ROWS - count)
+            batch, rows = rows[:batch_size], rows[batch_size:]
+            for row in batch:
+                self.results_tree.insert('', 'end', values=row)
+            count += len(batch)
+            
+        except queue.Empty:
+            # The worker hasn't fetched the next chunk yet
+            self.root.after(QueryExecutor.POLL_INTERVAL, lambda: self.insert_query_results(stream, rows, count))
+            return
+        except tk.TclError:
+            # The reports screen was closed
+            stream.close()
+            return
         
-        messagebox.showinfo("Success", f"Query completed! Found {len(results)} results")
+        self.root.after_idle(lambda: self.insert_query_results(stream, rows, count))
     
     def show_functions_screen(self):
         """מסך פונקציות ופרוצדורות"""
@@ -843,6 +2174,10 @@ class StreamingServiceGUI:
                  command=self.count_total_favorites,
                  bg='#27ae60', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5, pady=10)
         
+        tk.Button(functions_frame, text="⏱ Statement Statistics", 
+                 command=self.show_statement_stats,
+                 bg='#34495e', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5, pady=10)
+        
         # Results area
         results_frame = tk.LabelFrame(content_frame, text="Function Results", 
                                      font=('Arial', 12, 'bold'))
@@ -864,14 +2199,17 @@ class StreamingServiceGUI:
     
     def clean_test_data(self):
         """Function 1: Clean test data"""
-        try:
+        def count(cursor):
             # Count records before deletion
-            self.cursor.execute("SELECT COUNT(*) FROM MarksAsFavorite")
-            favorites_count = self.cursor.fetchone()[0]
-            
-            self.cursor.execute("SELECT COUNT(*) FROM Profile")
-            profiles_count = self.cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM MarksAsFavorite")
+            favorites_count = cursor.fetchone()[0]
             
+            cursor.execute("SELECT COUNT(*) FROM Profile")
+            profiles_count = cursor.fetchone()[0]
+            return favorites_count, profiles_count
+        
+        def done(counts):
+            favorites_count, profiles_count = counts
             result_text = f"Clean Test Data Function Executed:\n"
             result_text += f"- Found {favorites_count} favorite records\n"
             result_text += f"- Found {profiles_count} profile records\n"
@@ -880,20 +2218,23 @@ class StreamingServiceGUI:
             
             self.function_results_text.insert('end', result_text)
             messagebox.showinfo("Success", f"Data analysis completed")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Function failed: {str(e)}")
+        
+        self.executor.submit(count, done, error_message="Function failed",
+                             description="Counting test data...")
     
     def generate_sample_data(self):
         """Function 2: Generate sample data info"""
-        try:
+        def next_ids(cursor):
             # Get next available IDs
-            self.cursor.execute("SELECT COALESCE(MAX(customerID), 0) + 1 FROM Customer")
-            next_customer_id = self.cursor.fetchone()[0]
-            
-            self.cursor.execute("SELECT COALESCE(MAX(profileID), 0) + 1 FROM Profile")
-            next_profile_id = self.cursor.fetchone()[0]
+            cursor.execute("SELECT COALESCE(MAX(customerID), 0) + 1 FROM Customer")
+            next_customer_id = cursor.fetchone()[0]
             
+            cursor.execute("SELECT COALESCE(MAX(profileID), 0) + 1 FROM Profile")
+            next_profile_id = cursor.fetchone()[0]
+            return next_customer_id, next_profile_id
+        
+        def done(ids):
+            next_customer_id, next_profile_id = ids
             result_text = f"Sample Data Generation Info:\n"
             result_text += f"- Next available Customer ID: {next_customer_id}\n"
             result_text += f"- Next available Profile ID: {next_profile_id}\n"
@@ -903,24 +2244,24 @@ class StreamingServiceGUI:
             
             self.function_results_text.insert('end', result_text)
             messagebox.showinfo("Success", "Sample data analysis completed")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Function failed: {str(e)}")
+        
+        self.executor.submit(next_ids, done, error_message="Function failed",
+                             description="Finding next available IDs...")
     
     def count_total_favorites(self):
         """Function 3: Count total favorites"""
-        try:
+        def count(cursor):
             # Count total favorites by profile
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT 
                     COUNT(*) as total_favorites,
                     COUNT(DISTINCT profileID) as profiles_with_favorites,
                     COUNT(DISTINCT movieID) as unique_movies_favorited
                 FROM MarksAsFavorite
             """)
-            
-            stats = self.cursor.fetchone()
-            
+            return cursor.fetchone()
+        
+        def done(stats):
             result_text = f"Favorites Statistics:\n"
             result_text += f"- Total Favorites: {stats[0]}\n"
             result_text += f"- Profiles with Favorites: {stats[1]}\n"
@@ -930,9 +2271,18 @@ class StreamingServiceGUI:
             
             self.function_results_text.insert('end', result_text)
             messagebox.showinfo("Success", "Favorites analysis completed")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Function failed: {str(e)}")
+        
+        self.executor.submit(count, done, error_message="Function failed",
+                             description="Counting favorites...")
+    
+    def show_statement_stats(self):
+        """Function 4: Prepared statement statistics"""
+        result_text = f"Prepared Statement Statistics:\n"
+        result_text += self.statements.report() + "\n"
+        result_text += f"- Analysis time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        result_text += "-" * 50 + "\n\n"
+        
+        self.function_results_text.insert('end', result_text)
 
 
 class CustomerDialog:
@@ -1132,9 +2482,8 @@ class CustomerDialog:
 
 class ProfileDialog:
     """Dialog for adding/editing profiles"""
-    def __init__(self, parent, title, cursor, profile_data=None):
+    def __init__(self, parent, title, executor, customer_search, cache, profile_data=None):
         self.result = None
-        self.cursor = cursor
         
         # Create dialog window - INCREASED SIZE
         self.dialog = tk.Toplevel(parent)
@@ -1199,10 +2548,9 @@ class ProfileDialog:
         # Customer selection
         tk.Label(main_frame, text="Select Customer:", font=('Arial', 13, 'bold'), 
                 bg='white', fg='#34495e').pack(anchor='w', pady=(20, 8))
-        self.customer_var = tk.StringVar()
-        self.customer_combo = ttk.Combobox(main_frame, textvariable=self.customer_var, 
-                                          font=('Arial', 13), width=42, state='readonly', height=10)
-        self.customer_combo.pack(fill='x', pady=(0, 15), ipady=12)
+        self.customer_box = Typeahead(main_frame, executor, customer_search, cache=cache, combobox=True,
+                                      font=('Arial', 13), width=42, height=10)
+        self.customer_box.entry.pack(fill='x', pady=(0, 15), ipady=12)
         
         # Watch History ID
         tk.Label(main_frame, text="Watch History ID:", font=('Arial', 13, 'bold'), 
@@ -1223,9 +2571,6 @@ class ProfileDialog:
                                         activebackground='white')
         online_checkbox.pack(anchor='w')
         
-        # Load customers
-        self.load_customers()
-        
         # Fill with existing data if editing
         if profile_data:
             self.fill_existing_data(profile_data)
@@ -1238,7 +2583,7 @@ class ProfileDialog:
                              text="💡 Important Notes:\n" +
                                   "• Profile ID must be a unique number\n" +
                                   "• Watch History ID should be a number (can be same as Profile ID)\n" +
-                                  "• Select a customer from the dropdown\n" +
+                                  "• Type a customer's name and pick the customer from the list\n" +
                                   "• Profile picture URL is optional", 
                              font=('Arial', 11), bg='#e8f4fd', fg='#2c3e50', justify='left')
         info_label.pack(padx=20, pady=15)
@@ -1278,17 +2623,6 @@ class ProfileDialog:
         # Wait for dialog
         parent.wait_window(self.dialog)
     
-    def load_customers(self):
-        """Load customer list for selection"""
-        try:
-            self.cursor.execute("SELECT customerID, firstName || ' ' || lastName FROM Customer ORDER BY firstName")
-            customers = self.cursor.fetchall()
-            customer_list = [f"{row[0]} - {row[1]}" for row in customers]
-            self.customer_combo['values'] = customer_list
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load customers: {str(e)}")
-    
     def fill_existing_data(self, profile_data):
         """Fill form with existing profile data"""
         try:
@@ -1299,11 +2633,7 @@ class ProfileDialog:
             self.is_online_var.set(profile_data[3] == "Yes")
             
             # Set customer
-            customer_id = profile_data[4]
-            for i, value in enumerate(self.customer_combo['values']):
-                if value.startswith(str(customer_id)):
-                    self.customer_combo.current(i)
-                    break
+            self.customer_box.select(profile_data[4], profile_data[5])
             
             # Generate a default watch history ID
             self.watch_history_entry.insert(0, str(profile_data[0]))
@@ -1325,9 +2655,9 @@ class ProfileDialog:
                 self.profile_name_entry.focus()
                 return
                 
-            if not self.customer_var.get():
-                messagebox.showerror("Validation Error", "Please select a customer")
-                self.customer_combo.focus()
+            if self.customer_box.selected is None:
+                messagebox.showerror("Validation Error", "Please type a customer's name and pick the customer from the list")
+                self.customer_box.entry.focus()
                 return
                 
             if not self.watch_history_entry.get().strip():
@@ -1346,7 +2676,7 @@ class ProfileDialog:
                 return
             
             # Get customer ID
-            customer_id = int(self.customer_var.get().split(' - ')[0])
+            customer_id, customer_name = self.customer_box.selected
             
             # Validate profile name
             profile_name = self.profile_name_entry.get().strip()
@@ -1360,7 +2690,6 @@ class ProfileDialog:
             is_online = self.is_online_var.get()
             
             # Show confirmation dialog
-            customer_name = self.customer_var.get().split(' - ')[1]
             confirm_msg = f"Save profile information?\n\n"
             confirm_msg += f"Profile ID: {profile_id}\n"
             confirm_msg += f"Profile Name: {profile_name}\n"
@@ -1391,9 +2720,11 @@ class ProfileDialog:
 
 class FavoriteDialog:
     """Dialog for adding favorites"""
-    def __init__(self, parent, title, cursor):
+    def __init__(self, parent, title, statements, executor, profile_search, cache):
         self.result = None
-        self.cursor = cursor
+        self.statements = statements
+        self.executor = executor
+        self.checking = False   # a duplicate check is running
         
         # Create dialog window - INCREASED SIZE
         self.dialog = tk.Toplevel(parent)
@@ -1421,10 +2752,9 @@ class FavoriteDialog:
         # Profile selection
         tk.Label(main_frame, text="Select Profile:", font=('Arial', 13, 'bold'), 
                 bg='white', fg='#34495e').pack(anchor='w', pady=(20, 8))
-        self.profile_var = tk.StringVar()
-        self.profile_combo = ttk.Combobox(main_frame, textvariable=self.profile_var, 
-                                         font=('Arial', 13), width=40, state='readonly', height=10)
-        self.profile_combo.pack(fill='x', pady=(0, 25), ipady=12)
+        self.profile_box = Typeahead(main_frame, executor, profile_search, cache=cache, combobox=True,
+                                     font=('Arial', 13), width=40, height=10)
+        self.profile_box.entry.pack(fill='x', pady=(0, 25), ipady=12)
         
         # Movie ID
         tk.Label(main_frame, text="Movie ID:", font=('Arial', 13, 'bold'), 
@@ -1434,8 +2764,8 @@ class FavoriteDialog:
                                       highlightcolor='#3498db')
         self.movie_id_entry.pack(fill='x', pady=(0, 25), ipady=12)
         
-        # Load profiles
-        self.load_profiles()
+        # Make sure there is a profile to pick
+        self.check_profiles()
         
         # Validation info
         info_frame = tk.Frame(main_frame, bg='#e8f4fd', relief='solid', bd=2)
@@ -1443,7 +2773,7 @@ class FavoriteDialog:
         
         info_label = tk.Label(info_frame, 
                              text="💡 Important Notes:\n" +
-                                  "• Select a profile from the dropdown\n" +
+                                  "• Type a profile's name and pick the profile from the list\n" +
                                   "• Movie ID must be a positive number\n" +
                                   "• This will add the movie to the profile's favorites\n" +
                                   "• Duplicate favorites will be rejected", 
@@ -1469,7 +2799,7 @@ class FavoriteDialog:
         cancel_btn.pack(side='left', padx=15)
         
         # Focus on profile selection
-        self.profile_combo.focus()
+        self.profile_box.entry.focus()
         
         # Bind Enter key to save
         self.dialog.bind('<Return>', lambda e: self.save())
@@ -1478,30 +2808,29 @@ class FavoriteDialog:
         # Wait for dialog
         parent.wait_window(self.dialog)
     
-    def load_profiles(self):
-        """Load profile list for selection"""
-        try:
-            self.cursor.execute("SELECT profileID, profileName FROM Profile ORDER BY profileName")
-            profiles = self.cursor.fetchall()
-            profile_list = [f"{row[0]} - {row[1]}" for row in profiles]
-            self.profile_combo['values'] = profile_list
-            
-            if not profiles:
+    def check_profiles(self):
+        """Close the dialog if there are no profiles to pick from"""
+        def check(cursor):
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM Profile)")
+            return cursor.fetchone()[0]
+        
+        def done(has_profiles):
+            if not has_profiles and self.dialog.winfo_exists():
                 messagebox.showwarning("No Profiles", "No profiles found. Please add profiles first.")
                 self.dialog.destroy()
-                return
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load profiles: {str(e)}")
-            self.dialog.destroy()
+        
+        self.executor.submit(check, done, error_message="Failed to look up profiles", description=None,
+                             on_error=lambda error: self.dialog.destroy())
     
     def save(self):
         """Save favorite data with validation"""
+        if self.checking:
+            return
         try:
             # Validate profile selection
-            if not self.profile_var.get():
-                messagebox.showerror("Validation Error", "Please select a profile")
-                self.profile_combo.focus()
+            if self.profile_box.selected is None:
+                messagebox.showerror("Validation Error", "Please type a profile's name and pick the profile from the list")
+                self.profile_box.entry.focus()
                 return
             
             # Validate movie ID
@@ -1523,38 +2852,48 @@ class FavoriteDialog:
                 return
             
             # Get profile ID
-            profile_id = int(self.profile_var.get().split(' - ')[0])
-            profile_name = self.profile_var.get().split(' - ')[1]
+            profile_id, profile_name = self.profile_box.selected
             
-            # Check if this favorite already exists
-            try:
-                self.cursor.execute("""
-                    SELECT COUNT(*) FROM MarksAsFavorite 
-                    WHERE profileID = %s AND movieID = %s
-                """, (profile_id, movie_id))
-                
-                if self.cursor.fetchone()[0] > 0:
+            # Check if this favorite already exists, then confirm
+            def check(cursor):
+                self.statements.execute(cursor, "favorite_exists", (profile_id, movie_id))
+                return cursor.fetchone()[0] > 0
+            
+            def done(exists):
+                self.checking = False
+                if not self.dialog.winfo_exists():
+                    return
+                if exists:
                     messagebox.showwarning("Duplicate Entry", 
                                          f"Movie {movie_id} is already in {profile_name}'s favorites!")
                     return
-                    
-            except Exception as e:
-                messagebox.showwarning("Warning", f"Could not check for duplicates: {str(e)}")
+                self.confirm(profile_id, profile_name, movie_id)
             
-            # Show confirmation dialog
-            confirm_msg = f"Add to favorites?\n\n"
-            confirm_msg += f"Profile: {profile_name}\n"
-            confirm_msg += f"Movie ID: {movie_id}\n\n"
-            confirm_msg += "This movie will be added to the profile's favorite list."
+            def failed(error):
+                # Reported by the executor - let the insert itself reject a duplicate
+                self.checking = False
+                if self.dialog.winfo_exists():
+                    self.confirm(profile_id, profile_name, movie_id)
             
-            if messagebox.askyesno("Confirm Add Favorite", confirm_msg):
-                # Collect validated data
-                self.result = [profile_id, movie_id]
-                self.dialog.destroy()
+            self.checking = True
+            self.executor.submit(check, done, error_message="Could not check for duplicates",
+                                 description="Checking favorites...", on_error=failed)
             
         except Exception as e:
             messagebox.showerror("Error", f"Error saving data: {str(e)}")
     
+    def confirm(self, profile_id, profile_name, movie_id):
+        """Ask before adding the favorite and close the dialog with it"""
+        confirm_msg = f"Add to favorites?\n\n"
+        confirm_msg += f"Profile: {profile_name}\n"
+        confirm_msg += f"Movie ID: {movie_id}\n\n"
+        confirm_msg += "This movie will be added to the profile's favorite list."
+        
+        if messagebox.askyesno("Confirm Add Favorite", confirm_msg):
+            # Collect validated data
+            self.result = [profile_id, movie_id]
+            self.dialog.destroy()
+    
     def cancel(self):
         """Cancel dialog with confirmation"""
         if messagebox.askyesno("Confirm Cancel", "Are you sure you want to cancel?"):
@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import sys
+import types
+from pathlib import Path
+from urllib.parse import quote, urlencode
+
+import pytest
+
+# The scripts import each other as top-level modules of their own directory
+ROOT = Path(__file__).resolve().parent.parent
+for directory in ("data_insert", "part5"):
+    sys.path.insert(0, str(ROOT / directory))
+
+
+@pytest.fixture
+def table_rows():
+    """Function giving every row of every table of a SQLite build, sorted, keyed by table"""
+    from schema import TABLE_COLUMNS
+
+    def table_rows(db_path):
+        conn = sqlite3.connect(db_path)
+        rows = {table: sorted(conn.execute(f"SELECT * FROM {table}").fetchall()) for table in TABLE_COLUMNS}
+        conn.close()
+        return rows
+
+    return table_rows
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock of the GUI module, moved forward by setting .now"""
+    import streaming_service_gui
+
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(streaming_service_gui, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+@pytest.fixture(scope="module")
+def postgres(request):
+    """
+    Opens connections to the scratch PostgreSQL database given by
+    STREAMING_TEST_DSN, e.g. "host=localhost dbname=scratch user=postgres".
+    Every connection works in a schema of the test module's own, dropped
+    once the module's tests are done; public stays on the search path for
+    extensions, so tests create their tables before using them. The
+    fixture's url attribute is a postgresql:// URL, as the loaders take,
+    that sees the module's schema alone, so tables a loader drops and
+    recreates are never looked up in public. Skips the tests without the
+    database.
+    """
+    psycopg2 = pytest.importorskip("psycopg2")
+    dsn = os.environ.get("STREAMING_TEST_DSN")
+    if not dsn:
+        pytest.skip("STREAMING_TEST_DSN is not set")
+    schema = request.module.__name__.rpartition(".")[2]
+    connections = []
+
+    def connect():
+        conn = psycopg2.connect(dsn, options=f"-c search_path={schema},public")
+        connections.append(conn)
+        return conn
+
+    params = {**psycopg2.extensions.parse_dsn(dsn), "options": f"-c search_path={schema}"}
+    connect.url = "postgresql:///?" + urlencode(params, quote_via=quote)
+
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        cursor.execute(f"CREATE SCHEMA {schema}")
+
+    yield connect
+
+    for opened in connections:
+        opened.close()
+    with conn.cursor() as cursor:
+        cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+    conn.close()
@@ -0,0 +1,42 @@
+import sqlite3
+
+from populate_coordinator import build_keys, create_database, run_loaders
+from schema import PRIMARY_KEYS
+
+
+def key_indexes(db_path):
+    """Names of the primary key indexes build_keys created"""
+    conn = sqlite3.connect(db_path)
+    names = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    conn.close()
+    return {name for name in names if name.startswith("pk_")}
+
+
+def test_keys_are_built_after_a_clean_load(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    create_database("bare.db", deferred_keys=True)
+    run_loaders("bare.db", scale_factor=0.5)
+
+    violations = build_keys("bare.db")
+
+    assert not any(violations.values())
+    assert key_indexes("bare.db") == {f"pk_{table}" for table in PRIMARY_KEYS}
+
+
+def test_violated_keys_are_reported_and_not_built(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    create_database("bare.db", deferred_keys=True)
+    run_loaders("bare.db", scale_factor=0.5)
+    conn = sqlite3.connect("bare.db")
+    conn.execute("INSERT INTO Payment SELECT * FROM Payment WHERE paymentID = (SELECT MIN(paymentID) FROM Payment)")
+    conn.execute("UPDATE Reviews SET profileID = -1 WHERE movieID = (SELECT MIN(movieID) FROM Reviews)")
+    conn.commit()
+    conn.close()
+
+    violations = build_keys("bare.db")
+
+    assert {name: count for name, count in violations.items() if count} == {
+        "Payment primary key": 1,
+        "Reviews.profileID -> Profile": 1,
+    }
+    assert key_indexes("bare.db") == {f"pk_{table}" for table in PRIMARY_KEYS if table != "Payment"}
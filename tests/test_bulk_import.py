@@ -0,0 +1,128 @@
+import pytest
+
+import streaming_service_gui
+from schema import create_table_sql
+from streaming_service_gui import StreamingServiceGUI, filedialog, messagebox
+
+
+class FakeProgressWindow:
+    """Stands in for the progress window, which needs a display"""
+
+    def __init__(self, parent, text, fraction):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="module")
+def conn(postgres):
+    """Connection to the scratch database, with the tables the tests import into"""
+    conn = postgres()
+    with conn, conn.cursor() as cursor:
+        cursor.execute(create_table_sql("Customer", foreign_keys=False))
+        cursor.execute(create_table_sql("MarksAsFavorite", foreign_keys=False))
+    return conn
+
+
+@pytest.fixture
+def app(conn, monkeypatch, tmp_path):
+    """GUI without windows whose writes run right away on the scratch database"""
+    with conn, conn.cursor() as cursor:
+        # The tables exist in the test schema, so these never reach another schema's
+        cursor.execute("TRUNCATE Customer, MarksAsFavorite")
+        cursor.execute("INSERT INTO Customer VALUES ('Dana', 'Levi', 1, '1990-01-01', '2020-01-01')")
+        cursor.execute("INSERT INTO MarksAsFavorite VALUES (1, 10), (1, 11), (2, 10)")
+
+    app = object.__new__(StreamingServiceGUI)
+    app.root = None
+    app.conn = conn
+    app.messages = []
+    app.csv_path = tmp_path / "rows.csv"
+
+    def run_write(work, on_done, tables, **options):
+        with conn, conn.cursor() as cursor:
+            result = work(cursor)
+        on_done(result)
+
+    app.run_write = run_write
+    monkeypatch.setattr(streaming_service_gui, "ProgressWindow", FakeProgressWindow)
+    monkeypatch.setattr(filedialog, "askopenfilename", lambda **options: str(app.csv_path))
+    monkeypatch.setattr(messagebox, "showinfo", lambda title, message: app.messages.append((title, message)))
+    monkeypatch.setattr(messagebox, "showerror", lambda title, message: app.messages.append((title, message)))
+    return app
+
+
+def import_csv(app, monkeypatch, table, text, update=None):
+    """Import text as a CSV file, answering the existing-rows question with update; True once done"""
+    app.csv_path.write_text(text, encoding="utf-8")
+
+    def ask(title, message):
+        assert update is not None, "asked about existing rows of a table without other columns"
+        return update
+
+    monkeypatch.setattr(messagebox, "askyesnocancel", ask)
+    done = []
+    app.import_csv(table, (table,), lambda: done.append(True))
+    return bool(done)
+
+
+def rows(app, sql):
+    with app.conn, app.conn.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+CUSTOMERS_CSV = (
+    "LastName,customerid,FirstName,dateOfBirth,customerSince\n"
+    "Cohen,1,Dana,1990-01-01,2020-01-01\n"
+    "Mizrahi,2,Noa,1985-05-05,2021-01-01\n"
+    "Mizrahi,2,Noa,1985-05-05,2021-01-01\n"
+    "Peretz,3,Avi,1970-03-03,2022-01-01\n"
+)
+
+
+def test_import_skips_existing_and_repeated_keys(app, monkeypatch):
+    assert import_csv(app, monkeypatch, "Customer", CUSTOMERS_CSV, update=False)
+
+    assert rows(app, "SELECT customerID, lastName FROM Customer ORDER BY 1") == [
+        (1, "Levi"), (2, "Mizrahi"), (3, "Peretz")
+    ]
+    title, summary = app.messages[-1]
+    assert "Rows in file: 4" in summary and "Added: 2" in summary and "Updated" not in summary
+
+
+def test_import_updates_existing_rows(app, monkeypatch):
+    assert import_csv(app, monkeypatch, "Customer", CUSTOMERS_CSV, update=True)
+
+    assert rows(app, "SELECT customerID, lastName FROM Customer ORDER BY 1") == [
+        (1, "Cohen"), (2, "Mizrahi"), (3, "Peretz")
+    ]
+    title, summary = app.messages[-1]
+    assert "Added: 2" in summary and "Updated: 1" in summary
+
+
+def test_import_of_key_only_table_does_not_ask_about_updates(app, monkeypatch):
+    assert import_csv(app, monkeypatch, "MarksAsFavorite", "movieID,profileID\n10,1\n20,1\n20,1\n")
+
+    assert rows(app, "SELECT profileID, movieID FROM MarksAsFavorite ORDER BY 1, 2") == [
+        (1, 10), (1, 11), (1, 20), (2, 10)
+    ]
+
+
+def test_import_rejects_a_header_without_the_table_columns(app, monkeypatch):
+    assert not import_csv(app, monkeypatch, "Customer", "customerID,firstName\n5,Tal\n", update=False)
+
+    assert app.messages[-1][0] == "Import Error"
+    assert rows(app, "SELECT COUNT(*) FROM Customer") == [(1,)]
+
+
+def test_delete_rows_by_single_and_composite_keys(app):
+    done = []
+    app.delete_rows("Customer", [(1,), (99,)], "customers", lambda: done.append(True))
+    app.delete_rows("MarksAsFavorite", [(1, 10), (2, 10), (3, 30)], "favorites", lambda: done.append(True))
+
+    assert done == [True, True]
+    assert rows(app, "SELECT COUNT(*) FROM Customer") == [(0,)]
+    assert rows(app, "SELECT profileID, movieID FROM MarksAsFavorite") == [(1, 11)]
+    assert app.messages[-1][1].startswith("2 of 3 selected favorites deleted")
@@ -0,0 +1,56 @@
+import gc
+import random
+import sqlite3
+
+import pytest
+
+import checkpoints
+import table_writer
+from checkpoints import CHECKPOINT_TABLE
+from populate_coordinator import populate_database
+
+
+def test_resume_after_failure_builds_the_same_rows(tmp_path, monkeypatch, table_rows):
+    monkeypatch.chdir(tmp_path)
+    # Several checkpointed chunks per table, so the failure lands mid-table
+    monkeypatch.setattr(checkpoints, "CHECKPOINT_ROWS", 50)
+
+    random.seed(5)
+    populate_database("expected.db", bulk=True, scale_factor=2, resume=True)
+
+    # Fail the python loader on its third chunk, after the other stages completed
+    record_chunk = table_writer.record_chunk
+    calls = []
+
+    def failing_record_chunk(writer, cursor, table, rows):
+        if writer.stage == "python":
+            calls.append(table)
+            if len(calls) == 3:
+                raise RuntimeError("injected failure")
+        record_chunk(writer, cursor, table, rows)
+
+    monkeypatch.setattr(table_writer, "record_chunk", failing_record_chunk)
+    random.seed(5)
+    with pytest.raises(RuntimeError, match="injected failure"):
+        populate_database("resumed.db", bulk=True, scale_factor=2, resume=True)
+    # The failed writer's connection lives on in the traceback, as it would
+    # until the process exits - close it so the resumed run can write
+    gc.collect()
+
+    conn = sqlite3.connect("resumed.db")
+    stages = {stage: (rows_done, complete) for stage, rows_done, complete
+              in conn.execute(f"SELECT stage, rows_done, complete FROM {CHECKPOINT_TABLE}")}
+    conn.close()
+    assert stages["json"][1] and stages["excel"][1] and not stages["python"][1]
+    # Two chunks of the python loader's first table were committed before the failure
+    assert stages["python.Customer"] == (100, False)
+
+    # Committed chunks are skipped and the rest regenerated from the recorded seed
+    monkeypatch.setattr(table_writer, "record_chunk", record_chunk)
+    random.seed(99)
+    populate_database("resumed.db", bulk=True, scale_factor=2, resume=True)
+
+    assert table_rows("resumed.db") == table_rows("expected.db")
+    conn = sqlite3.connect("resumed.db")
+    assert not conn.execute("SELECT name FROM sqlite_master WHERE name = ?", (CHECKPOINT_TABLE,)).fetchall()
+    conn.close()
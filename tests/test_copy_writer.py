@@ -0,0 +1,52 @@
+import sqlite3
+
+from populate_coordinator import populate_database
+from schema import TABLE_COLUMNS
+from table_writer import CsvRowStream, PostgresCopyWriter
+
+
+def counts(cursor):
+    """Number of rows in every table, keyed by table"""
+    rows = {}
+    for table in TABLE_COLUMNS:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        rows[table] = cursor.fetchone()[0]
+    return rows
+
+
+def test_empty_strings_and_none_are_both_empty_fields():
+    assert CsvRowStream([("", None, "a,b", 1)]).read() == ',,"a,b",1\n'
+
+
+def test_seeded_build_matches_sqlite(postgres, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    populate_database("build.db", scale_factor=0.5, seed=3, snapshot_dir=tmp_path / "snapshots")
+    populate_database(postgres.url, scale_factor=0.5, seed=3)
+
+    sqlite = sqlite3.connect("build.db")
+    expected = counts(sqlite.cursor())
+    sqlite.close()
+    conn = postgres()
+    with conn, conn.cursor() as cursor:
+        assert counts(cursor) == expected
+
+
+def test_conflicting_favorites_are_skipped(postgres, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    populate_database(postgres.url, scale_factor=0.5, seed=3)
+    conn = postgres()
+    with conn, conn.cursor() as cursor:
+        cursor.execute("SELECT profileID, movieID FROM MarksAsFavorite ORDER BY 1, 2 LIMIT 3")
+        existing = cursor.fetchall()
+        before = counts(cursor)["MarksAsFavorite"]
+
+    writer = PostgresCopyWriter(postgres.url)
+    # Pairs already in the table, and one pair twice in the same copy
+    assert writer.insert("MarksAsFavorite", existing + existing[:1], ignore_conflicts=True) == 4
+    writer.insert("Customer", [("", "Levi", 999999, "1990-01-01", "2020-01-01")])
+    writer.close()
+
+    with conn, conn.cursor() as cursor:
+        assert counts(cursor)["MarksAsFavorite"] == before
+        cursor.execute("SELECT firstName FROM Customer WHERE customerID = 999999")
+        assert cursor.fetchone() == ("",)
@@ -0,0 +1,38 @@
+import pytest
+
+from dataset_scale import JSON_LOADER, LOADER_ROWS, DatasetSlice
+
+
+@pytest.mark.parametrize("scale_factor", [0.01, 0.5, 1, 7.3])
+@pytest.mark.parametrize("shards", [1, 2, 3, 8])
+def test_slices_are_disjoint_and_cover_every_id(scale_factor, shards):
+    slices = [
+        DatasetSlice(loader, scale_factor, shard, shards)
+        for loader in range(len(LOADER_ROWS)) for shard in range(shards)
+    ]
+    ids = [record_id for ids in slices for record_id in ids.ids]
+
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == list(range(1, len(ids) + 1))
+    for ids in slices:
+        assert ids.loader_base_id <= ids.base_id
+        assert ids.base_id + ids.count <= ids.loader_base_id + ids.loader_count
+
+
+@pytest.mark.parametrize("scale_factor", [0.5, 1, 7.3])
+def test_loaders_draw_from_disjoint_movies(scale_factor):
+    ranges = [DatasetSlice(loader, scale_factor) for loader in range(len(LOADER_ROWS))]
+    movies = [movie for ids in ranges for movie in range(ids.movie_low, ids.movie_high + 1)]
+
+    assert len(movies) == len(set(movies))
+
+
+def test_random_pairs_are_unique_and_stay_in_their_shard():
+    pairs = []
+    for shard in range(3):
+        ids = DatasetSlice(JSON_LOADER, 2, shard, 3)
+        shard_pairs = ids.random_pairs(ids.count)
+        assert all(profile_id in ids.ids for profile_id, movie_id in shard_pairs)
+        pairs += shard_pairs
+
+    assert len(pairs) == len(set(pairs))
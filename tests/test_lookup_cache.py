@@ -0,0 +1,48 @@
+from streaming_service_gui import LookupCache
+
+
+def test_lookups_ignore_case_and_expire_after_ttl(clock):
+    cache = LookupCache(ttl=60)
+    cache.put("Customer", "Jo", [(7, "John Levi")], cache.start())
+
+    clock.now = 59
+    assert cache.get("Customer", "JO") == [(7, "John Levi")]
+    clock.now = 61
+    assert cache.get("Customer", "jo") is None
+    assert not cache.lookups
+
+
+def test_least_recently_used_lookup_is_evicted(clock):
+    cache = LookupCache(max_lookups=2)
+    for text in ("ab", "cd"):
+        cache.put("Customer", text, [], cache.start())
+    cache.get("Customer", "ab")
+    cache.put("Customer", "ef", [], cache.start())
+
+    assert list(cache.lookups) == [("Customer", "ab"), ("Customer", "ef")]
+
+
+def test_lookup_started_before_a_write_is_not_stored(clock):
+    cache = LookupCache()
+    since = cache.start()
+    cache.invalidate("Customer")
+
+    cache.put("Customer", "jo", [(7, "John Levi")], since)
+    cache.put("Profile", "jo", [(3, "Jo")], since)
+
+    assert cache.get("Customer", "jo") is None
+    assert cache.get("Profile", "jo") == [(3, "Jo")]
+
+
+def test_invalidate_forgets_lookups_and_picked_entries_of_a_table(clock):
+    cache = LookupCache(max_picked=2)
+    cache.put("Customer", "jo", [(7, "John Levi")], cache.start())
+    cache.put("Profile", "jo", [(3, "Jo")], cache.start())
+    for key, name in ((1, "A"), (2, "B"), (3, "C")):
+        cache.remember("Customer", key, name)
+
+    assert cache.recent("Customer") == [(3, "C"), (2, "B")]
+    cache.invalidate("Customer")
+
+    assert cache.recent("Customer") == []
+    assert list(cache.lookups) == [("Profile", "jo")]
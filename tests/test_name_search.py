@@ -0,0 +1,112 @@
+"""
+Runs the GUI's name searches against PostgreSQL with part5/SearchIndexes.sql
+applied and checks that their plans use its indexes. Needs the scratch
+database of the postgres fixture; the similar-name tests also need the pg_trgm
+extension to be available.
+"""
+from pathlib import Path
+
+import pytest
+
+from schema import create_table_sql
+from streaming_service_gui import NAME_SEARCHES, NameSearch
+
+SEARCH_INDEXES = Path(__file__).resolve().parent.parent / "part5" / "SearchIndexes.sql"
+ROWS = 50000
+
+# (search, ID of the planted row, its name, prefix index, trigram index)
+PLANTED = {
+    "customers": (ROWS + 1, "Jonathan Levi", "idx_customer_name_prefix", "idx_customer_name_trgm"),
+    "profiles": (ROWS + 1, "Jonathan Kids", "idx_profile_name_prefix", "idx_profile_name_trgm"),
+}
+
+
+class RecordingCursor:
+    """Cursor that keeps the statements it ran, to EXPLAIN them afterwards"""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+        self.cursor.execute(sql, params)
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+
+def script_statements(path):
+    """The statements of an SQL script, without its comments"""
+    lines = [line for line in path.read_text(encoding="utf-8").splitlines() if not line.lstrip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def plan(cursor, sql, params):
+    """The EXPLAIN output of a statement, as one string"""
+    cursor.execute("EXPLAIN " + sql, params)
+    return "\n".join(row[0] for row in cursor.fetchall())
+
+
+@pytest.fixture(scope="module")
+def database(postgres):
+    """Cursor on generated customers and profiles with the search indexes, and whether pg_trgm is there"""
+    conn = postgres()
+    conn.autocommit = True
+    cursor = conn.cursor()
+
+    cursor.execute(create_table_sql("Customer", foreign_keys=False))
+    cursor.execute(create_table_sql("Profile", foreign_keys=False))
+    cursor.execute("""
+        INSERT INTO Customer
+        SELECT initcap(substr(md5(i::text), 1, 7)), initcap(substr(md5((-i)::text), 1, 9)), i,
+               DATE '1980-01-01', DATE '2020-01-01'
+        FROM generate_series(1, %s) i
+    """, (ROWS,))
+    cursor.execute("""
+        INSERT INTO Profile
+        SELECT initcap(substr(md5('p' || i), 1, 8)), 'avatar.png', FALSE, i, i, i
+        FROM generate_series(1, %s) i
+    """, (ROWS,))
+    cursor.execute("INSERT INTO Customer VALUES ('Jonathan', 'Levi', %s, DATE '1980-01-01', DATE '2020-01-01')",
+                   (PLANTED["customers"][0],))
+    cursor.execute("INSERT INTO Profile VALUES ('Jonathan Kids', 'avatar.png', FALSE, %s, 1, 1)",
+                   (PLANTED["profiles"][0],))
+
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+    trigrams = cursor.fetchone()[0]
+    for statement in script_statements(SEARCH_INDEXES):
+        if trigrams or "trgm" not in statement:
+            cursor.execute(statement)
+    cursor.execute("ANALYZE Customer")
+    cursor.execute("ANALYZE Profile")
+
+    return cursor, trigrams
+
+
+@pytest.mark.parametrize("search", sorted(NAME_SEARCHES))
+def test_prefix_search_uses_prefix_index(database, search):
+    cursor, trigrams = database
+    record_id, name, prefix_index, trigram_index = PLANTED[search]
+    recording = RecordingCursor(cursor)
+
+    matches = NameSearch(*NAME_SEARCHES[search]).find(recording, "JONATH", 10)
+
+    assert matches == [(record_id, name)]
+    assert prefix_index in plan(cursor, *recording.statements[0])
+
+
+@pytest.mark.parametrize("search", sorted(NAME_SEARCHES))
+def test_similar_names_use_trigram_index(database, search):
+    cursor, trigrams = database
+    if not trigrams:
+        pytest.skip("pg_trgm is not available")
+    record_id, name, prefix_index, trigram_index = PLANTED[search]
+    recording = RecordingCursor(cursor)
+
+    # Misspelt, so the prefix query finds nothing and the trigram query runs
+    matches = NameSearch(*NAME_SEARCHES[search], fuzzy=True).find(recording, "jonatan", 10)
+
+    assert matches[0] == (record_id, name)
+    assert len(recording.statements) == 2
+    assert trigram_index in plan(cursor, *recording.statements[1])
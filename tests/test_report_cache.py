@@ -0,0 +1,62 @@
+from streaming_service_gui import ReportCache, referencing_tables
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ReportCache(ttl=300)
+    cache.put("report", {"Customer"}, [(1,)], cache.start())
+
+    clock.now = 299
+    assert cache.get("report") == ([(1,)], 299)
+    clock.now = 301
+    assert cache.get("report") is None
+    assert "report" not in cache.entries
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ReportCache(max_entries=2)
+    cache.put("a", {"Customer"}, [1], cache.start())
+    cache.put("b", {"Customer"}, [2], cache.start())
+    cache.get("a")
+    cache.put("c", {"Customer"}, [3], cache.start())
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.get("b") is None
+
+
+def test_large_results_are_not_kept(clock):
+    cache = ReportCache(max_rows=2)
+    cache.put("report", {"Customer"}, [1, 2, 3], cache.start())
+
+    assert cache.get("report") is None
+
+
+def test_invalidate_drops_the_reports_reading_a_table(clock):
+    cache = ReportCache()
+    cache.put("customers", {"Customer"}, [1], cache.start())
+    cache.put("profiles", {"Profile", "Customer"}, [2], cache.start())
+    cache.put("payments", {"Payment"}, [3], cache.start())
+
+    cache.invalidate("Customer")
+
+    assert list(cache.entries) == ["payments"]
+
+
+def test_report_started_before_a_change_is_not_stored(clock):
+    cache = ReportCache()
+    since = cache.start()
+    cache.invalidate("Customer")
+
+    cache.put("customers", {"Customer"}, [1], since)
+    cache.put("payments", {"Payment"}, [2], since)
+    cache.put("customers", {"Customer"}, [3], cache.start())
+
+    assert cache.get("payments") == ([2], 0)
+    assert cache.get("customers") == ([3], 0)
+
+
+def test_deletes_invalidate_the_tables_referencing_the_deleted_rows():
+    customer = referencing_tables("Customer")
+
+    assert {"Customer", "Devices", "Payment", "Profile", "Reviews", "MarksAsFavorite"} <= set(customer)
+    assert "Favorites" not in customer
+    assert referencing_tables("MarksAsFavorite") == ("MarksAsFavorite",)
@@ -0,0 +1,29 @@
+from populate_coordinator import populate_database
+from snapshots import snapshot_key
+
+
+def test_seeded_builds_are_identical_and_reused(tmp_path, monkeypatch, capsys, table_rows):
+    monkeypatch.chdir(tmp_path)
+    populate_database("first.db", scale_factor=0.5, vectorized=True, seed=3, snapshot_dir=tmp_path / "a")
+    populate_database("second.db", scale_factor=0.5, vectorized=True, seed=3, snapshot_dir=tmp_path / "b")
+    populate_database("other.db", scale_factor=0.5, vectorized=True, seed=4, snapshot_dir=tmp_path / "b")
+
+    assert table_rows("first.db") == table_rows("second.db")
+    assert table_rows("first.db") != table_rows("other.db")
+
+    # The same build again is cloned from its snapshot
+    capsys.readouterr()
+    populate_database("clone.db", scale_factor=0.5, vectorized=True, seed=3, snapshot_dir=tmp_path / "a")
+
+    assert "Cloned snapshot" in capsys.readouterr().out
+    assert table_rows("clone.db") == table_rows("first.db")
+
+
+def test_snapshot_key_depends_on_every_option():
+    key = snapshot_key(3, 1, shards=1, vectorized=False)
+
+    assert key == snapshot_key(3, 1, vectorized=False, shards=1)
+    assert key != snapshot_key(4, 1, shards=1, vectorized=False)
+    assert key != snapshot_key(3, 2, shards=1, vectorized=False)
+    assert key != snapshot_key(3, 1, shards=2, vectorized=False)
+    assert key != snapshot_key(3, 1, shards=1, vectorized=True)
@@ -0,0 +1,56 @@
+import pytest
+
+from schema import create_table_sql
+from streaming_service_gui import CRUD_STATEMENTS, StatementRegistry
+
+
+@pytest.fixture(scope="module")
+def connect(postgres):
+    """The postgres fixture's connections, with the tables the CRUD statements use"""
+    conn = postgres()
+    with conn, conn.cursor() as cursor:
+        for table in ("Customer", "Profile", "MarksAsFavorite"):
+            cursor.execute(create_table_sql(table, foreign_keys=False))
+    return postgres
+
+
+def prepared_names(cursor):
+    """Names of the statements prepared on the cursor's connection"""
+    cursor.execute("SELECT name FROM pg_prepared_statements")
+    return {name for (name,) in cursor.fetchall()}
+
+
+def test_every_statement_prepares(connect):
+    conn = connect()
+    with conn, conn.cursor() as cursor:
+        for name, sql in CRUD_STATEMENTS.items():
+            cursor.execute(f"PREPARE {name} AS {sql}")
+
+        assert prepared_names(cursor) == set(CRUD_STATEMENTS)
+
+
+def test_statements_are_prepared_once_per_connection(connect):
+    registry = StatementRegistry(CRUD_STATEMENTS)
+
+    conn = connect()
+    with conn, conn.cursor() as cursor:
+        registry.execute(cursor, "add_customer", (1, "Dana", "Levi", "1990-01-01", "2020-01-01"))
+        registry.execute(cursor, "add_favorite", (1, 42))
+        registry.execute(cursor, "favorite_exists", (1, 42))
+        assert cursor.fetchone()[0] == 1
+        registry.execute(cursor, "delete_favorite", (1, 42))
+        registry.execute(cursor, "favorite_exists", (1, 42))
+        assert cursor.fetchone()[0] == 0
+
+        assert prepared_names(cursor) == {"add_customer", "add_favorite", "favorite_exists", "delete_favorite"}
+    assert registry.prepares == 4
+    assert registry.stats["favorite_exists"][0] == 2
+
+    # A new connection prepares the statements it runs again
+    other = connect()
+    with other, other.cursor() as cursor:
+        registry.execute(cursor, "edit_customer", ("Dana", "Cohen", "1990-01-01", "2020-01-01", 1))
+        cursor.execute("SELECT lastName FROM Customer WHERE customerID = 1")
+        assert cursor.fetchone()[0] == "Cohen"
+    assert registry.prepares == 5
+    assert registry.report().endswith("Prepared 5 times on 2 open connections")
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from text_pools import FIRST_NAMES, LAST_NAMES, REVIEW_CLOSINGS, REVIEW_OPENINGS, FakerText, PoolText
+
+
+def columns(text, n=50):
+    """Every column a text source generates"""
+    return [text.first_names(n), text.last_names(n), text.words(n), text.user_names(n), text.comments(n)]
+
+
+@pytest.mark.parametrize("source", [PoolText, FakerText])
+def test_same_seed_generates_the_same_text(source):
+    if source is FakerText:
+        pytest.importorskip("faker")
+    random.seed(3)
+    first = columns(source())
+    random.seed(3)
+    second = columns(source())
+    random.seed(4)
+    other = columns(source())
+
+    assert first == second
+    assert first != other
+
+
+def test_pool_text_is_drawn_from_the_pools():
+    random.seed(3)
+    text = PoolText()
+
+    assert set(text.first_names(500)) <= set(FIRST_NAMES)
+    assert set(text.last_names(500)) <= set(LAST_NAMES)
+    for comment in text.comments(100):
+        assert any(comment == f"{opening} {closing}" for opening in REVIEW_OPENINGS for closing in REVIEW_CLOSINGS)
+    assert len(text.user_names(100)) == 100
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from dataset_scale import EXCEL_LOADER, JSON_LOADER, DatasetSlice
+from vectorized import unique_pairs
+
+
+@pytest.mark.parametrize("shards", [1, 3])
+def test_unique_pairs_are_unique_across_shards(shards):
+    rng = np.random.default_rng(0)
+    pairs = []
+    for shard in range(shards):
+        ids = DatasetSlice(EXCEL_LOADER, 2, shard, shards)
+        profile_ids, movie_ids = unique_pairs(rng, ids, ids.count)
+        assert len(profile_ids) == ids.count
+        assert set(profile_ids) <= set(ids.ids)
+        assert set(movie_ids) <= set(range(ids.loader_base_id, ids.loader_base_id + ids.loader_count))
+        pairs += zip(profile_ids, movie_ids)
+
+    assert len(pairs) == len(set(pairs))
+
+
+def test_unique_pairs_stop_at_every_combination():
+    ids = DatasetSlice(JSON_LOADER, 0.02)
+    profile_ids, movie_ids = unique_pairs(np.random.default_rng(0), ids, 100)
+
+    assert len(profile_ids) == ids.count * ids.loader_count
+    assert len(set(zip(profile_ids, movie_ids))) == len(profile_ids)
@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+
+from populate_coordinator import create_database, populate_database, run_loaders, verify_data
+
+
+@pytest.mark.parametrize("deferred_keys", [False, True])
+def test_clean_build_passes(tmp_path, monkeypatch, deferred_keys):
+    monkeypatch.chdir(tmp_path)
+    populate_database("clean.db", scale_factor=0.5, deferred_keys=deferred_keys)
+
+    report = verify_data("clean.db", scale_factor=0.5)
+
+    assert report["ok"]
+    # 67 + 66 + 66 rows, as the loaders round them
+    assert report["minimum_rows"] == 199
+    assert all(count >= 199 for count in report["row_counts"].values())
+    for check in ("duplicate_keys", "orphaned_rows", "value_violations"):
+        assert not any(report[check].values())
+
+
+def test_corrupted_build_reports_each_violation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Bare tables, so the corruption isn't rejected by the keys
+    create_database("corrupted.db", deferred_keys=True)
+    run_loaders("corrupted.db", scale_factor=0.5)
+
+    conn = sqlite3.connect("corrupted.db")
+    conn.execute("INSERT INTO Customer SELECT * FROM Customer WHERE customerID IN (1, 2)")
+    conn.execute("UPDATE Devices SET customerID = -1 WHERE deviceID = (SELECT MIN(deviceID) FROM Devices)")
+    conn.execute("UPDATE MarksAsFavorite SET movieID = -1 WHERE rowid IN "
+                 "(SELECT rowid FROM MarksAsFavorite ORDER BY rowid LIMIT 3)")
+    conn.execute("UPDATE Reviews SET rating = 9 WHERE movieID = (SELECT MIN(movieID) FROM Reviews)")
+    conn.execute("DELETE FROM Payment WHERE paymentID > 100")
+    conn.commit()
+    conn.close()
+
+    report = verify_data("corrupted.db", scale_factor=0.5)
+
+    assert not report["ok"]
+    assert report["row_counts"]["Payment"] == 100
+    assert {table: count for table, count in report["duplicate_keys"].items() if count} == {"Customer": 2}
+    assert {key: count for key, count in report["orphaned_rows"].items() if count} == {
+        "Devices.customerID -> Customer": 1,
+        "MarksAsFavorite.movieID -> Favorites": 3,
+    }
+    assert {rule: count for rule, count in report["value_violations"].items() if count} == {
+        "Reviews: rating BETWEEN 1 AND 5": 1,
+    }